@@ -1,8 +1,18 @@
 from django.contrib import admin
+from django.contrib.auth.models import Permission
+from core.admin import LargeTableAdmin
 from auth_app.models import User
 
 
 @admin.register(User)
-class UserAdmin(admin.ModelAdmin):
+class UserAdmin(LargeTableAdmin):
     list_display = ('id', 'fullname', 'email', 'is_staff', 'is_superuser')
-    search_fields = ('fullname', 'email')
+    search_fields = ('=id', '^username', '^email')
+    sortable_by = ('id',)
+    ordering = ('username',)
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == 'user_permissions':
+            # Permission labels include the content type; join it.
+            kwargs['queryset'] = Permission.objects.select_related('content_type')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
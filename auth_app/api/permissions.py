@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from boards_app.membership import shares_board
+
 
 class IsSelfOrBoardMember(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
@@ -8,12 +10,11 @@ class IsSelfOrBoardMember(permissions.BasePermission):
 
         - If the object is the request.user itself, return True.
         - Otherwise, return True if the request.user and the object
-        share at least one board (either as members or owners).
+        share at least one board (either as members or owners), checked
+        with one EXISTS query over the board membership rows
+        (boards_app.membership.shares_board()).
         """
         if obj == request.user:
             return True
 
-        user_boards = request.user.member_boards.all() | request.user.owned_boards.all()
-        target_boards = obj.member_boards.all() | obj.owned_boards.all()
-
-        return bool(user_boards & target_boards)
+        return shares_board(request.user, obj)
@@ -1,9 +1,11 @@
 from rest_framework import serializers
 from django.contrib.auth.hashers import make_password
 from auth_app.models import User
+from core.fieldsets import SparseFieldsetMixin
+from core.serializers import CachedFieldsMixin
 
 
-class RegisterSerializer(serializers.ModelSerializer):
+class RegisterSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user registration.
 
@@ -49,13 +51,30 @@ class RegisterSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class MemberSerializer(serializers.ModelSerializer):
+class MemberSerializer(SparseFieldsetMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Lightweight serializer for user membership representation.
 
     - Exposes only basic user information: id, fullname, and email.
     - Intended for contexts where sensitive fields (like password) should not be included.
+    - Nested fields can be narrowed with ?fields= (e.g. assignee.fullname).
     """
     class Meta:
         model = User
         fields = ['id', 'fullname', 'email']
+
+
+class ProvisionedUserSerializer(serializers.Serializer):
+    """
+    One row of a bulk provisioning request (auth_app.provisioning).
+
+    - email, fullname and password as for registration; the email is also
+      the username.
+    - boards: optional IDs of boards the user becomes a member of.
+    - Checks of the whole batch (duplicate or registered emails, unknown
+      boards) are done by provision_users() with one query each.
+    """
+    email = serializers.EmailField(max_length=150)
+    fullname = serializers.CharField(max_length=255)
+    password = serializers.CharField(write_only=True)
+    boards = serializers.ListField(child=serializers.IntegerField(), required=False)
@@ -1,9 +1,13 @@
+from django.conf import settings
 from rest_framework import generics, permissions
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from auth_app.models import User
+from auth_app.provisioning import hash_row_passwords
+from core.throttling import LoginThrottle, ProvisioningThrottle, RegistrationThrottle
+from jobs_app.api.views import enqueue_job_response
 from .serializers import RegisterSerializer
 
 
@@ -15,10 +19,16 @@ class RegisterView(generics.CreateAPIView):
     - Creates a new User instance with hashed password.
     - Automatically generates and returns an authentication token.
     - Response includes: token, user_id, and the created user data.
+    - Throttled per client IP and email (core.throttling); rejected
+      requests get 429 with Retry-After before any hashing. No
+      authentication, so an Authorization header cannot get a 401 (and a
+      token query) ahead of the throttle.
     """
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
+    authentication_classes = []
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [RegistrationThrottle]
 
     def create(self, request, *args, **kwargs):
         response = super().create(request, *args, **kwargs)
@@ -38,8 +48,13 @@ class EmailAuthTokenView(ObtainAuthToken):
     - Returns an authentication token along with basic user info:
       fullname, email, and user_id.
     - Returns error responses for invalid credentials or missing fields.
+    - Throttled per client IP and email (core.throttling); rejected
+      requests get 429 with Retry-After before any database access, also
+      when they carry an Authorization header (no authentication).
     """
+    authentication_classes = []
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [LoginThrottle]
 
     def post(self, request, *args, **kwargs):
         email = request.data.get('email')
@@ -104,3 +119,42 @@ class EmailCheckView(APIView):
                 {'error': 'Email not found'},
                 status=404
             )
+
+
+class BulkProvisionView(APIView):
+    """
+    API endpoint creating many users at once (auth_app.provisioning).
+
+    - Staff only; throttled per client IP and user (core.throttling).
+    - Body: {"users": [{"email", "fullname", "password", "boards"?}, ...]}
+      with at most PROVISIONING_MAX_ROWS rows; boards must be boards the
+      requesting user owns or is a member of.
+    - The passwords are hashed before the rows are queued, so the job
+      payload holds no plaintext password; the rows are validated and
+      inserted by a provision_users job (auth_app.jobs). Returns 202 with
+      the job status. Its result is
+      {"created": [...], "errors": [...]}: every valid row becomes a user
+      with a token, invalid rows are skipped and reported with their index.
+    """
+    permission_classes = [permissions.IsAdminUser]
+    throttle_classes = [ProvisioningThrottle]
+
+    def post(self, request):
+        rows = request.data.get('users') if isinstance(request.data, dict) else None
+        if not isinstance(rows, list) or not rows:
+            return Response(
+                {'users': ['Expected a non-empty list of users.']},
+                status=400
+            )
+        if len(rows) > settings.PROVISIONING_MAX_ROWS:
+            return Response(
+                {'users': [
+                    f'At most {settings.PROVISIONING_MAX_ROWS} users per request; '
+                    'use "manage.py provision_users" for larger imports.'
+                ]},
+                status=400
+            )
+
+        return enqueue_job_response(
+            request, 'provision_users', {'rows': hash_row_passwords(rows)}, max_attempts=1
+        )
@@ -0,0 +1,38 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+
+def setup_worker():
+    """Configure Django in a pool worker started without fork."""
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        django.setup()
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    Return make_password() of every password, in order.
+
+    - Hashing is CPU bound and slow on purpose, so the passwords are spread
+      over a process pool of workers processes (PROVISIONING_HASH_WORKERS,
+      0 for one per CPU).
+    - With one worker, or too few passwords to keep every worker busy,
+      they are hashed in this process instead of starting a pool.
+    - This module imports no models, so spawned workers can load it before
+      setup_worker() configures Django.
+    """
+    passwords = list(passwords)
+    if workers is None:
+        workers = settings.PROVISIONING_HASH_WORKERS
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(passwords) // settings.PROVISIONING_HASH_MIN_PER_WORKER)
+    if workers <= 1:
+        return [make_password(password) for password in passwords]
+
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=setup_worker) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
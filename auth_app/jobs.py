@@ -0,0 +1,40 @@
+from auth_app.models import User
+from auth_app.provisioning import provision_users
+from boards_app.membership import member_boards
+from core.deletion import chunked_delete_copied
+from jobs_app.queue import PermanentJobError, job_handler, progress_reporter
+
+
+@job_handler('delete_user')
+def delete_user(job):
+    """
+    Delete a user with owned boards, created tasks and comments in chunks.
+
+    - Payload: {"user_id": <id>}.
+    - Reports the rows deleted or updated per model as progress and
+      returns them.
+    - With sharding, the user's copy and its boards, tasks and comments
+      are deleted on every shard as well.
+    """
+    return chunked_delete_copied(
+        User.objects.filter(pk=job.payload['user_id']),
+        progress=progress_reporter(job),
+    )
+
+
+@job_handler('provision_users')
+def provision_users_job(job):
+    """
+    Create the users of a POST /api/users/bulk/ request.
+
+    - Payload: {"rows": [...]} from hash_row_passwords(), so it holds
+      password hashes only; rows may join the boards the user who
+      enqueued the job belongs to.
+    - Returns {"created": [...], "errors": [...]} from provision_users().
+    - Enqueued with a single attempt.
+    """
+    if job.created_by is None:
+        raise PermanentJobError('The user who enqueued the job no longer exists.')
+    return provision_users(
+        job.payload['rows'], boards=member_boards(job.created_by), hashed=True
+    )
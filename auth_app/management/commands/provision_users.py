@@ -0,0 +1,75 @@
+import csv
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from auth_app.provisioning import provision_users
+
+
+def read_rows(path):
+    """
+    Read the users to provision from a .json or .csv file.
+
+    - JSON: a list of {"email", "fullname", "password", "boards"?} objects.
+    - CSV: a header row with email, fullname, password and optionally
+      boards, whose board ids are separated by spaces or semicolons.
+    """
+    if path.suffix.lower() == '.json':
+        rows = json.loads(path.read_text())
+        if not isinstance(rows, list):
+            raise CommandError('The JSON file must contain a list of users.')
+        return rows
+
+    with path.open(newline='') as file:
+        rows = []
+        for row in csv.DictReader(file):
+            boards = (row.pop('boards', None) or '').replace(';', ' ').split()
+            if boards:
+                row['boards'] = boards
+            rows.append(row)
+        return rows
+
+
+class Command(BaseCommand):
+    """
+    Create users with tokens and board memberships from a file.
+
+    - Passwords are hashed in parallel, users and tokens are inserted with
+      bulk inserts (auth_app.provisioning).
+    - Invalid rows are reported with their row number and skipped.
+    - Example: python manage.py provision_users users.csv --board 3 --workers 8
+    """
+    help = 'Provision many users at once from a CSV or JSON file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=Path, help='CSV or JSON file with the users.')
+        parser.add_argument('--board', type=int, action='append', default=[],
+                            help='Id of a board every user joins (repeatable).')
+        parser.add_argument('--workers', type=int, default=settings.PROVISIONING_HASH_WORKERS,
+                            help='Password hashing processes (0 for one per CPU).')
+        parser.add_argument('--batch-size', type=int, default=settings.PROVISIONING_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not path.is_file():
+            raise CommandError(f'{path} does not exist.')
+        rows = read_rows(path)
+        if options['board']:
+            for row in rows:
+                if isinstance(row, dict):
+                    row['boards'] = [*row.get('boards', []), *options['board']]
+
+        result = provision_users(
+            rows, workers=options['workers'], batch_size=options['batch_size']
+        )
+        for error in result['errors']:
+            messages = '; '.join(
+                f'{field}: {" ".join(str(message) for message in field_errors)}'
+                for field, field_errors in error['errors'].items()
+            )
+            self.stderr.write(f'Row {error["row"] + 1} ({error["email"]}): {messages}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {len(result["created"])} users, skipped {len(result["errors"])} rows'
+        ))
@@ -1,6 +1,9 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 
+from core.deletion import chunked_delete_copied
+from core.sharding import copy_to_shards
+
 
 class User(AbstractUser):
     """
@@ -9,6 +12,14 @@ class User(AbstractUser):
     - Adds an optional 'fullname' field for storing the user's full name.
     - Retains all default fields and authentication behavior from AbstractUser
       (username, email, password, etc.).
+    - email is indexed for the admin's prefix search.
+    - With sharding, users live on the default database and save() keeps
+      a copy on every shard (core.sharding.copy_to_shards()), where board
+      data joins them. delete() removes the copies and what cascades from
+      them in chunks (core.deletion.chunked_delete_copied()).
+    - save() touches the boards showing the user (as member, assignee,
+      reviewer or comment author) when a field of PROFILE_FIELDS changed,
+      so their cached representations expire.
     - The string representation (__str__) returns:
         * fullname if available,
         * otherwise username,
@@ -17,5 +28,36 @@ class User(AbstractUser):
     """
     fullname = models.CharField(max_length=255, blank=True, null=True)
 
+    # Fields shown with the user in board, task and comment payloads.
+    PROFILE_FIELDS = ('username', 'email', 'fullname')
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['email'], name='user_email_idx'),
+        ]
+
     def __str__(self):
         return self.fullname or self.username or self.email or "User"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super().from_db(db, field_names, values)
+        user._loaded_profile = user.profile()
+        return user
+
+    def profile(self):
+        return tuple(self.__dict__.get(name) for name in self.PROFILE_FIELDS)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        copy_to_shards([self])
+        loaded_profile = getattr(self, '_loaded_profile', None)
+        if loaded_profile is not None and loaded_profile != self.profile():
+            from boards_app.membership import touch_user_boards
+
+            touch_user_boards(self)
+        self._loaded_profile = self.profile()
+
+    def delete(self, *args, **kwargs):
+        chunked_delete_copied(User.objects.filter(pk=self.pk), shards_only=True)
+        return super().delete(*args, **kwargs)
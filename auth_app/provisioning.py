@@ -0,0 +1,184 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from rest_framework import serializers
+from rest_framework.authtoken.models import Token
+from rest_framework.fields import empty
+
+from auth_app.api.serializers import ProvisionedUserSerializer
+from auth_app.hashing import hash_passwords
+from auth_app.models import User
+from boards_app.models import Board, BoardMembership
+from core.sharding import copy_to_shards, fan_out, merge, shard_for, use_shard
+
+
+def in_batches(values, batch_size):
+    values = list(values)
+    for start in range(0, len(values), batch_size):
+        yield values[start:start + batch_size]
+
+
+def registered_emails(emails, batch_size):
+    """Return the emails used as email or username, one query per batch."""
+    found = set()
+    for batch in in_batches(emails, batch_size):
+        found.update(
+            value
+            for pair in User.objects
+            .filter(Q(email__in=batch) | Q(username__in=batch))
+            .values_list('email', 'username')
+            for value in pair
+        )
+    return found
+
+
+def validate_rows(rows, boards, batch_size):
+    """
+    Validate rows; return (valid rows as (index, data), errors).
+
+    - Field errors come from ProvisionedUserSerializer. Emails repeated in
+      the batch or already registered and board ids that are not in
+      boards are reported per row.
+    - errors is a list of {"row": index, "email": ..., "errors": {...}}.
+    """
+    valid, errors = [], []
+    for index, row in enumerate(rows):
+        serializer = ProvisionedUserSerializer(data=row)
+        if serializer.is_valid():
+            valid.append((index, serializer.validated_data))
+        else:
+            email = row.get('email') if isinstance(row, dict) else None
+            errors.append({'row': index, 'email': email, 'errors': serializer.errors})
+
+    emails = [data['email'] for _, data in valid]
+    taken = registered_emails(emails, batch_size)
+    board_ids = {board_id for _, data in valid for board_id in data.get('boards', ())}
+    known_boards = set(merge(fan_out(
+        lambda: list(boards.filter(id__in=board_ids).values_list('id', flat=True))
+    )))
+
+    seen, accepted = set(), []
+    for index, data in valid:
+        row_errors = {}
+        if data['email'] in taken:
+            row_errors['email'] = ['Email is already registered']
+        elif data['email'] in seen:
+            row_errors['email'] = ['Email appears more than once in the batch']
+        seen.add(data['email'])
+        unknown = sorted(set(data.get('boards', ())) - known_boards)
+        if unknown:
+            row_errors['boards'] = [
+                'Unknown board id(s): ' + ', '.join(str(board_id) for board_id in unknown)
+            ]
+        if row_errors:
+            errors.append({'row': index, 'email': data['email'], 'errors': row_errors})
+        else:
+            accepted.append((index, data))
+    errors.sort(key=lambda error: error['row'])
+    return accepted, errors
+
+
+def hash_row_passwords(rows, workers=None):
+    """
+    Return a copy of rows with every valid password replaced by its hash.
+
+    - For rows that are stored before provision_users(rows, hashed=True)
+      creates them, e.g. in a job payload, so no plaintext password is
+      kept. The passwords are hashed with hash_passwords().
+    - Rows that are not objects and passwords that do not validate are
+      copied as they are; provision_users() reports them.
+    """
+    field = ProvisionedUserSerializer().fields['password']
+    rows, indexes, passwords = list(rows), [], []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            continue
+        try:
+            passwords.append(field.run_validation(row.get('password', empty)))
+        except serializers.ValidationError:
+            continue
+        indexes.append(index)
+    for index, password_hash in zip(indexes, hash_passwords(passwords, workers)):
+        rows[index] = {**rows[index], 'password': password_hash}
+    return rows
+
+
+def insert_memberships(memberships, batch_size):
+    """
+    Bulk insert memberships and touch their boards, on the shard of each board.
+    """
+    by_shard = defaultdict(list)
+    for membership in memberships:
+        by_shard[shard_for(membership.board_id)].append(membership)
+    for shard, rows in by_shard.items():
+        with use_shard(shard):
+            BoardMembership.objects.bulk_create(rows, batch_size=batch_size)
+            Board.touch(pk__in={membership.board_id for membership in rows})
+
+
+def provision_users(rows, boards=None, workers=None, batch_size=None, hashed=False):
+    """
+    Create many users at once, each with a token and optional board
+    memberships.
+
+    - rows: dicts with email, fullname, password and optionally boards
+      (see ProvisionedUserSerializer).
+    - boards: queryset of the boards rows may join (all boards by
+      default); other board ids are reported as row errors.
+    - hashed: the passwords of rows are hashes from hash_row_passwords()
+      and are stored as they are.
+    - Rows are validated with a constant number of queries, the passwords
+      are hashed in parallel (auth_app.hashing), and users, tokens and
+      memberships are inserted with bulk_create in one transaction.
+      The boards gaining members are touched.
+    - With sharding, the users are copied to every shard and the
+      memberships written to the boards' shards; those writes are not
+      part of the transaction on the default database.
+    - Invalid rows are skipped and reported; the others are created.
+    - Returns {"created": [{"row", "id", "email"}, ...], "errors": [...]}
+      with row indexes into rows.
+    """
+    batch_size = batch_size or settings.PROVISIONING_BATCH_SIZE
+    if boards is None:
+        boards = Board.objects.all()
+    accepted, errors = validate_rows(rows, boards, batch_size)
+    if not accepted:
+        return {'created': [], 'errors': errors}
+
+    if hashed:
+        hashes = [data['password'] for _, data in accepted]
+    else:
+        hashes = hash_passwords((data['password'] for _, data in accepted), workers)
+    users = [
+        User(
+            username=data['email'],
+            email=data['email'],
+            fullname=data['fullname'],
+            password=password_hash,
+        )
+        for (_, data), password_hash in zip(accepted, hashes)
+    ]
+    with transaction.atomic():
+        users = User.objects.bulk_create(users, batch_size=batch_size)
+        Token.objects.bulk_create(
+            [Token(user=user, key=Token.generate_key()) for user in users],
+            batch_size=batch_size,
+        )
+        copy_to_shards(users)
+        memberships = [
+            BoardMembership(board_id=board_id, user_id=user.pk)
+            for (_, data), user in zip(accepted, users)
+            for board_id in set(data.get('boards', ()))
+        ]
+        if memberships:
+            insert_memberships(memberships, batch_size)
+
+    return {
+        'created': [
+            {'row': index, 'id': user.id, 'email': user.email}
+            for (index, _), user in zip(accepted, users)
+        ],
+        'errors': errors,
+    }
@@ -6,19 +6,37 @@ Covers:
 - User login (success, invalid credentials, missing fields).
 - Email check endpoint (existing, non-existing, missing parameter, authentication).
 - User model string representation.
+- Bulk provisioning: staff-only endpoint queueing a job, per-row errors,
+  throttling, parallel hashing and the provision_users command.
+- Login and registration throttling: per-email and per-IP buckets,
+  Retry-After and rejection before any database access.
 """
 
-from django.test import TestCase
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth.hashers import check_password
+from django.core.management import call_command
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 from rest_framework import status
+from auth_app.hashing import hash_passwords
 from auth_app.models import User
+from auth_app.provisioning import provision_users
+from boards_app.membership import member_boards
+from boards_app.models import Board
+from core.throttling import reset_throttles
+from jobs_app.models import Job
 
 
 class RegistrationTests(TestCase):
     """Tests for user registration endpoint and serializer validation."""
 
     def setUp(self):
+        reset_throttles()
         self.client = APIClient()
         self.url = reverse('registration')
 
@@ -80,6 +98,7 @@ class LoginTests(TestCase):
     """Tests for user login via email and password authentication."""
 
     def setUp(self):
+        reset_throttles()
         self.client = APIClient()
         self.url = reverse('login')
         self.user = User.objects.create_user(
@@ -193,3 +212,270 @@ class UserModelTests(TestCase):
             email='test@example.com'
         )
         self.assertEqual(str(user), 'testuser')
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class BulkProvisioningTests(TestCase):
+    """Tests for bulk user provisioning (auth_app.provisioning)."""
+
+    def setUp(self):
+        reset_throttles()
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin@test.com', email='admin@test.com', password='pass123', is_staff=True
+        )
+        self.board = Board.objects.create(title='Team', owner=self.admin)
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('user-provisioning')
+
+    def row(self, email, **extra):
+        return {'email': email, 'fullname': email.split('@')[0], 'password': 'Secret123', **extra}
+
+    def provision(self, rows):
+        """Post rows, run the queued job and return its status."""
+        response = self.client.post(self.url, {'users': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['name'], 'provision_users')
+        call_command('run_worker', burst=True, stdout=StringIO())
+        return self.client.get(response['Location']).data
+
+    def test_creates_users_with_tokens_and_memberships(self):
+        rows = [
+            self.row('ann@test.com', boards=[self.board.id]),
+            self.row('bob@test.com'),
+        ]
+
+        job = self.provision(rows)
+
+        self.assertEqual(job['status'], 'succeeded')
+        self.assertEqual([item['row'] for item in job['result']['created']], [0, 1])
+        self.assertEqual(job['result']['errors'], [])
+        ann = User.objects.get(email='ann@test.com')
+        self.assertEqual(ann.username, 'ann@test.com')
+        self.assertTrue(ann.check_password('Secret123'))
+        self.assertEqual(Token.objects.filter(user__email__in=['ann@test.com', 'bob@test.com']).count(), 2)
+        self.assertIn(ann, self.board.members.all())
+
+        login = self.client.post(
+            reverse('login'), {'email': 'bob@test.com', 'password': 'Secret123'}
+        )
+        self.assertEqual(login.status_code, status.HTTP_200_OK)
+
+    def test_reports_invalid_rows_and_creates_the_others(self):
+        foreign_board = Board.objects.create(
+            title='Foreign',
+            owner=User.objects.create_user(username='x@test.com', email='x@test.com'),
+        )
+        rows = [
+            self.row('admin@test.com'),
+            self.row('new@test.com'),
+            self.row('new@test.com'),
+            self.row('not-an-email'),
+            self.row('other@test.com', boards=[foreign_board.id]),
+        ]
+
+        result = self.provision(rows)['result']
+
+        self.assertEqual([item['email'] for item in result['created']], ['new@test.com'])
+        errors = {error['row']: error['errors'] for error in result['errors']}
+        self.assertEqual(sorted(errors), [0, 2, 3, 4])
+        self.assertEqual(errors[0]['email'], ['Email is already registered'])
+        self.assertIn('more than once', errors[2]['email'][0])
+        self.assertIn('email', errors[3])
+        self.assertEqual(errors[4]['boards'], [f'Unknown board id(s): {foreign_board.id}'])
+        self.assertFalse(User.objects.filter(email='other@test.com').exists())
+
+    def test_rejects_invalid_requests(self):
+        job = self.provision([self.row('bad')])
+        self.assertEqual(job['result']['created'], [])
+        self.assertEqual(job['result']['errors'][0]['row'], 0)
+
+        response = self.client.post(self.url, {'users': []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        with self.settings(PROVISIONING_MAX_ROWS=1):
+            rows = [self.row('a@test.com'), self.row('b@test.com')]
+            response = self.client.post(self.url, {'users': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.filter(email='a@test.com').exists())
+
+    def test_requires_staff(self):
+        member = User.objects.create_user(username='member@test.com', email='member@test.com')
+        self.client.force_authenticate(user=member)
+
+        response = self.client.post(self.url, {'users': [self.row('a@test.com')]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Job.objects.exists())
+
+    @override_settings(THROTTLE_BUCKETS={'provisioning': {'ip': '10/min', 'user': '1/min'}})
+    def test_is_throttled_per_user(self):
+        self.assertEqual(
+            self.client.post(self.url, {'users': [self.row('a@test.com')]}, format='json').status_code,
+            status.HTTP_202_ACCEPTED,
+        )
+
+        response = self.client.post(self.url, {'users': [self.row('b@test.com')]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_job_payload_holds_only_password_hashes(self):
+        rows = [self.row('ann@test.com'), self.row('bob@test.com', password=''), 'not-a-row']
+        response = self.client.post(self.url, {'users': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        job = Job.objects.get()
+        self.assertEqual(job.max_attempts, 1)
+        ann, bob, other = job.payload['rows']
+        self.assertNotIn('Secret123', str(job.payload))
+        self.assertTrue(check_password('Secret123', ann['password']))
+        self.assertEqual(bob['password'], '')
+        self.assertEqual(other, 'not-a-row')
+
+        call_command('run_worker', burst=True, stdout=StringIO())
+        job.refresh_from_db()
+        self.assertEqual([item['email'] for item in job.result['created']], ['ann@test.com'])
+        self.assertEqual([error['row'] for error in job.result['errors']], [1, 2])
+        self.assertTrue(User.objects.get(email='ann@test.com').check_password('Secret123'))
+
+    def test_validation_queries_do_not_grow_with_rows(self):
+        rows = [self.row(f'user{index}@test.com', boards=[self.board.id]) for index in range(20)]
+
+        # Registered emails, boards, user, token and membership inserts,
+        # board touch, plus savepoint and release.
+        with self.assertNumQueries(8):
+            result = provision_users(rows, boards=member_boards(self.admin))
+
+        self.assertEqual(len(result['created']), 20)
+
+    @override_settings(PROVISIONING_HASH_MIN_PER_WORKER=1)
+    def test_hash_passwords_in_process_pool(self):
+        passwords = [f'password-{index}' for index in range(6)]
+
+        hashes = hash_passwords(passwords, workers=2)
+
+        self.assertEqual(len(hashes), 6)
+        for password, encoded in zip(passwords, hashes):
+            self.assertTrue(check_password(password, encoded))
+
+    def test_provision_users_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'users.csv'
+            path.write_text(
+                'email,fullname,password,boards\n'
+                'csv1@test.com,Csv One,Secret123,\n'
+                'csv2@test.com,Csv Two,Secret123,\n'
+                'admin@test.com,Admin,Secret123,\n'
+            )
+            stdout, stderr = StringIO(), StringIO()
+            call_command(
+                'provision_users', str(path), board=[self.board.id], workers=1,
+                stdout=stdout, stderr=stderr,
+            )
+
+        self.assertIn('Created 2 users, skipped 1 rows', stdout.getvalue())
+        self.assertIn('Row 3 (admin@test.com)', stderr.getvalue())
+        self.assertEqual(
+            set(self.board.member_users().values_list('email', flat=True)),
+            {'csv1@test.com', 'csv2@test.com'},
+        )
+
+
+@override_settings(THROTTLE_BUCKETS={
+    'login': {'ip': '4/min', 'email': '2/min'},
+    'registration': {'ip': '2/min', 'email': '1/min'},
+})
+class ThrottlingTests(TestCase):
+    """Tests for the token bucket throttling of login and registration."""
+
+    def setUp(self):
+        reset_throttles()
+        self.client = APIClient()
+        self.login_url = reverse('login')
+
+    def login(self, email, ip='203.0.113.1'):
+        return self.client.post(
+            self.login_url, {'email': email, 'password': 'wrong'}, REMOTE_ADDR=ip
+        )
+
+    def test_email_bucket_rejects_with_retry_after(self):
+        self.assertEqual(self.login('a@test.com').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.login('A@test.com ', ip='203.0.113.2').status_code, 400)
+
+        with self.assertNumQueries(0):
+            response = self.login('a@test.com', ip='203.0.113.3')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response['Retry-After'], '30')
+        self.assertEqual(self.login('b@test.com', ip='203.0.113.3').status_code, 400)
+
+    def test_ip_bucket_rejects_any_email(self):
+        for index in range(4):
+            self.assertEqual(self.login(f'user{index}@test.com').status_code, 400)
+
+        response = self.login('other@test.com')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(self.login('other@test.com', ip='203.0.113.9').status_code, 400)
+
+    def test_forwarded_for_is_ignored_without_trusted_proxies(self):
+        for index in range(4):
+            self.client.post(
+                self.login_url, {'email': f'user{index}@test.com', 'password': 'x'},
+                HTTP_X_FORWARDED_FOR=f'198.51.100.{index}',
+            )
+
+        response = self.client.post(
+            self.login_url, {'email': 'last@test.com', 'password': 'x'},
+            HTTP_X_FORWARDED_FOR='198.51.100.99',
+        )
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_authorization_header_does_not_bypass_throttle(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Token bogus')
+        for index in range(4):
+            self.assertEqual(self.login(f'user{index}@test.com').status_code, 400)
+
+        with self.assertNumQueries(0):
+            response = self.login('other@test.com')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        url = reverse('registration')
+        data = {
+            'fullname': 'New User', 'email': 'new@test.com',
+            'password': 'pw', 'repeated_password': 'other',
+        }
+        self.assertEqual(self.client.post(url, data).status_code, 400)
+        with self.assertNumQueries(0):
+            response = self.client.post(url, data)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_registration_is_throttled(self):
+        url = reverse('registration')
+        data = {
+            'fullname': 'New User', 'email': 'new@test.com',
+            'password': 'pw', 'repeated_password': 'other',
+        }
+
+        self.assertEqual(self.client.post(url, data).status_code, 400)
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+
+    def test_shared_cache_store(self):
+        with self.settings(THROTTLE_CACHE='default'):
+            reset_throttles()
+            self.login('a@test.com')
+            self.login('a@test.com')
+            self.assertEqual(self.login('a@test.com').status_code, 429)
+            reset_throttles()
+            self.assertEqual(self.login('a@test.com').status_code, 400)
+
+    def test_throttling_can_be_disabled(self):
+        with self.settings(THROTTLE_ENABLED=False):
+            for _ in range(5):
+                self.assertEqual(self.login('a@test.com').status_code, 400)
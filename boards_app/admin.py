@@ -1,8 +1,20 @@
 from django.contrib import admin
+from django.urls import reverse
+from django.utils.html import format_html
+from core.admin import LargeTableAdmin
 from boards_app.models import Board
 
 
 @admin.register(Board)
-class BoardAdmin(admin.ModelAdmin):
-    list_display = ('id', 'title', 'owner')
-    search_fields = ('title',)
+class BoardAdmin(LargeTableAdmin):
+    list_display = ('id', 'title', 'owner', 'task_link')
+    list_select_related = ('owner',)
+    search_fields = ('=id', '^title')
+    sortable_by = ('id', 'title')
+    ordering = ('title', 'id')
+    autocomplete_fields = ('owner',)
+
+    @admin.display(description='Tasks')
+    def task_link(self, board):
+        url = reverse('admin:task_app_task_changelist')
+        return format_html('<a href="{}?board__id__exact={}">Tasks</a>', url, board.pk)
@@ -0,0 +1,85 @@
+from boards_app.membership import ais_member, member_boards, member_rows
+from boards_app.models import Board
+from core.async_views import (
+    NOT_FOUND,
+    PERMISSION_DENIED,
+    AsyncAPIView,
+    error_response,
+    fetch_all,
+    set_prefetched,
+)
+from core.fieldsets import FieldSelection, sideload
+from core.sharding import afan_out, merge
+from task_app.api.serializers import TaskReadSerializer
+from task_app.models import Task
+from .serializers import BoardListSerializer, BoardDetailSerializer
+
+
+class AsyncBoardListView(AsyncAPIView):
+    """
+    Async variant of GET /api/boards/.
+
+    - Returns the boards the user owns or is a member of, with the same
+      summary counts as BoardListSerializer.
+    - Accepts ?fields= like the sync view.
+    - With sharding, the shards are queried in turn and the boards merged
+      by id.
+    """
+
+    async def get(self, request):
+        user = request.user
+        queryset = BoardListSerializer.setup_eager_loading(
+            member_boards(user),
+            FieldSelection.from_request(request)
+        )
+        results = await afan_out(lambda: fetch_all(queryset.all()))
+        boards = merge(results, key=lambda board: board.pk)
+        context = {'request': request}
+        return self.render(BoardListSerializer(boards, many=True, context=context).data)
+
+
+class AsyncBoardDetailView(AsyncAPIView):
+    """
+    Async variant of GET /api/boards/<pk>/.
+
+    - Loads the selected members and tasks once the board exists. Django
+      runs async ORM queries one after the other in its thread-sensitive
+      executor, so they are awaited in turn; the view does not block the
+      event loop while they run.
+    - Only the owner and members may read the board (403 otherwise). As in
+      IsBoardMemberOrOwner, the check uses the members when they are
+      selected, otherwise a lookup of the user's membership row.
+    - Accepts ?fields=, ?expand= and ?normalize= like the sync view.
+    """
+
+    def shard_key(self, request, pk=None, **kwargs):
+        return pk
+
+    async def get(self, request, pk):
+        try:
+            board = await Board.objects.aget(pk=pk)
+        except Board.DoesNotExist:
+            return error_response(NOT_FOUND, 404)
+
+        selection = FieldSelection.from_request(request)
+        tasks = Task.objects.filter(board=board)
+        if selection.expands('tasks'):
+            tasks = TaskReadSerializer.setup_eager_loading(tasks, selection.child('tasks'))
+        elif 'tasks' in selection:
+            tasks = tasks.only('id', 'board')
+        else:
+            tasks = tasks.none()
+        user = request.user
+        if 'members' in selection:
+            board.member_rows = await fetch_all(member_rows(board))
+            allowed = board.owner_id == user.id or any(
+                row.user_id == user.id for row in board.member_rows
+            )
+        else:
+            allowed = await ais_member(board, user)
+        if not allowed:
+            return error_response(PERMISSION_DENIED, 403)
+        tasks = await fetch_all(tasks)
+
+        set_prefetched(board, 'tasks', tasks)
+        return self.render(sideload(BoardDetailSerializer(board, context={'request': request})))
@@ -0,0 +1,17 @@
+from rest_framework.pagination import CursorPagination
+
+
+class TaskColumnPagination(CursorPagination):
+    """
+    Cursor pagination for the tasks of one board column.
+
+    - Newest tasks first, like the Task default ordering.
+    - Pages are fetched with a keyset condition on id instead of an
+      OFFSET, so deep pages stay as cheap as the first one and no total
+      count is computed.
+    - ?page_size=<n> overrides page_size up to max_page_size.
+    """
+    ordering = '-id'
+    page_size = 25
+    page_size_query_param = 'page_size'
+    max_page_size = 100
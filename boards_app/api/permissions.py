@@ -1,4 +1,5 @@
 from rest_framework import permissions
+from boards_app.membership import is_member
 
 
 class IsBoardMemberOrOwner(permissions.BasePermission):
@@ -9,14 +10,17 @@ class IsBoardMemberOrOwner(permissions.BasePermission):
     - A member of the board.
 
     Used to restrict object-level access to board resources
-    based on ownership or membership.
+    based on ownership or membership. Uses prefetched member rows if
+    present, otherwise a single lookup of the user's membership row.
     """
 
     def has_object_permission(self, request, view, obj):
-        return (
-            obj.owner == request.user or
-            request.user in obj.members.all()
-        )
+        if obj.owner_id == request.user.id:
+            return True
+        rows = getattr(obj, 'member_rows', None)
+        if rows is not None:
+            return any(row.user_id == request.user.id for row in rows)
+        return is_member(obj, request.user)
 
 
 class IsBoardOwner(permissions.BasePermission):
@@ -29,4 +33,4 @@ class IsBoardOwner(permissions.BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        return obj.owner == request.user
+        return obj.owner_id == request.user.id
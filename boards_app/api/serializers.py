@@ -1,11 +1,38 @@
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework import serializers
-from boards_app.models import Board
-from auth_app.models import User
+from boards_app.membership import (
+    apply_member_diff,
+    prefetch_member_rows,
+    set_members,
+    unknown_user_ids,
+)
+from boards_app.models import Board, BoardMembership
+from task_app.models import Task
 from task_app.api.serializers import TaskReadSerializer
 from auth_app.api.serializers import MemberSerializer
+from core.fieldsets import ALL_FIELDS, SparseFieldsetMixin
+from core.serializers import CachedFieldsMixin
 
 
-class BoardListSerializer(serializers.ModelSerializer):
+def count_subquery(queryset, board_field):
+    """
+    Return a correlated COUNT(*) subquery of queryset rows per board.
+
+    - board_field is the name of the foreign key pointing to the board.
+    """
+    counts = (
+        queryset
+        .filter(**{board_field: OuterRef('pk')})
+        .order_by()
+        .values(board_field)
+        .annotate(count=Count('*'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+class BoardListSerializer(SparseFieldsetMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for listing boards with summary information.
 
@@ -16,12 +43,16 @@ class BoardListSerializer(serializers.ModelSerializer):
         * tasks_to_do_count: tasks with status 'to-do'
         * tasks_high_prio_count: tasks with priority 'high'
     - Exposes the owner's id.
+    - The counts are annotated by setup_eager_loading() as correlated
+      subqueries, so listing boards costs a constant number of queries.
+    - Supports ?fields= on GET requests (core.fieldsets); counts that are
+      not selected are not annotated.
     """
-    member_count = serializers.SerializerMethodField()
-    ticket_count = serializers.SerializerMethodField()
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
+    member_count = serializers.IntegerField(read_only=True)
+    ticket_count = serializers.IntegerField(read_only=True)
+    tasks_to_do_count = serializers.IntegerField(read_only=True)
+    tasks_high_prio_count = serializers.IntegerField(read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Board
@@ -35,72 +66,113 @@ class BoardListSerializer(serializers.ModelSerializer):
             'owner_id'
         ]
 
-    def get_member_count(self, obj):
-        return obj.members.count()
-
-    def get_ticket_count(self, obj):
-        return obj.tasks.count()
-
-    def get_tasks_to_do_count(self, obj):
-        return obj.tasks.filter(status='to-do').count()
-
-    def get_tasks_high_prio_count(self, obj):
-        return obj.tasks.filter(priority='high').count()
-
-
-class BoardDetailSerializer(serializers.ModelSerializer):
+    @staticmethod
+    def setup_eager_loading(queryset, selection=ALL_FIELDS):
+        tasks = Task.objects.all()
+        counts = {
+            'member_count': BoardMembership.objects.filter(role=BoardMembership.MEMBER),
+            'ticket_count': tasks,
+            'tasks_to_do_count': tasks.filter(status='to-do'),
+            'tasks_high_prio_count': tasks.filter(priority='high'),
+        }
+        return queryset.annotate(**{
+            name: count_subquery(counted, 'board')
+            for name, counted in counts.items() if name in selection
+        })
+
+
+class BoardDetailSerializer(SparseFieldsetMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for detailed board representation.
 
-    - Provides board id, title, and owner_id.
-    - Includes nested member data via MemberSerializer.
+    - Provides board id, title, owner_id and version (for If-Match).
+    - Includes nested member data via MemberSerializer; the owner is not
+      listed (Board.listed_members).
     - Includes nested task data via TaskReadSerializer.
     - All related fields (owner_id, members, tasks) are read-only.
+    - setup_eager_loading() prefetches the member rows with their users and
+      the tasks in one query each.
+    - Supports ?fields= and ?expand= on GET requests (core.fieldsets), also
+      for the nested tasks (e.g. ?fields=id,title,tasks.id,tasks.title).
+      Unselected relations are not prefetched; collapsed tasks are fetched
+      without joins and annotations.
+    - With ?normalize=users, members (and the users of the tasks) are user
+      ids.
     """
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
-    members = MemberSerializer(many=True, read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
+    members = MemberSerializer(source='listed_members', many=True, read_only=True)
     tasks = TaskReadSerializer(many=True, read_only=True)
+    sideloaded_fields = {'members': ('users', MemberSerializer)}
 
     class Meta:
         model = Board
-        fields = ['id', 'title', 'owner_id', 'members', 'tasks']
-        read_only_fields = ['owner_id', 'members', 'tasks']
-
-
-class BoardCreateUpdateSerializer(serializers.ModelSerializer):
+        fields = ['id', 'title', 'owner_id', 'version', 'members', 'tasks']
+        read_only_fields = ['owner_id', 'version', 'members', 'tasks']
+
+    @staticmethod
+    def setup_eager_loading(queryset, selection=ALL_FIELDS):
+        prefetches = []
+        if 'members' in selection:
+            prefetches.append(prefetch_member_rows())
+        if selection.expands('tasks'):
+            tasks = TaskReadSerializer.setup_eager_loading(
+                Task.objects.all(), selection.child('tasks')
+            )
+            prefetches.append(Prefetch('tasks', queryset=tasks))
+        elif 'tasks' in selection:
+            prefetches.append(Prefetch('tasks', queryset=Task.objects.only('id', 'board')))
+        return queryset.prefetch_related(*prefetches)
+
+
+def validate_member_ids(value):
+    """Reject user ids that do not exist, reported together after one query."""
+    unknown = unknown_user_ids(value)
+    if unknown:
+        raise serializers.ValidationError(
+            'Unknown user id(s): ' + ', '.join(str(user_id) for user_id in unknown)
+        )
+    return value
+
+
+class BoardCreateUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for creating and updating boards.
 
     - Accepts a list of member IDs for assignment (write-only).
-    - Exposes owner_data and members_data via MemberSerializer (read-only).
+    - Exposes owner_data and members_data via MemberSerializer and the
+      board version (read-only).
+    - Unknown member IDs are rejected with a 400 error listing them.
     - On create:
         * Creates a new board with provided title and owner.
         * Assigns members if member IDs are provided.
     - On update:
         * Updates the board title.
-        * Replaces members if member IDs are provided.
+        * Replaces members if member IDs are provided; only the difference
+          to the current members is written (boards_app.membership). The
+          owner keeps their membership row either way.
     """
     members = serializers.ListField(
         child=serializers.IntegerField(),
         write_only=True,
-        required=False
+        required=False,
+        validators=[validate_member_ids]
     )
     owner_data = MemberSerializer(source='owner', read_only=True)
     members_data = MemberSerializer(
-        source='members', many=True, read_only=True)
+        source='listed_members', many=True, read_only=True)
 
     class Meta:
         model = Board
-        fields = ['id', 'title', 'members', 'owner_data', 'members_data']
-        read_only_fields = ['owner_data', 'members_data']
+        fields = ['id', 'title', 'version', 'members', 'owner_data', 'members_data']
+        read_only_fields = ['version', 'owner_data', 'members_data']
 
     def create(self, validated_data):
         member_ids = validated_data.pop('members', [])
         board = Board.objects.create(**validated_data)
 
+        member_ids = set(member_ids) - {board.owner_id}
         if member_ids:
-            members = User.objects.filter(id__in=member_ids)
-            board.members.set(members)
+            apply_member_diff(board, sorted(member_ids), [])
 
         return board
 
@@ -111,7 +183,20 @@ class BoardCreateUpdateSerializer(serializers.ModelSerializer):
         instance.save()
 
         if member_ids is not None:
-            members = User.objects.filter(id__in=member_ids)
-            instance.members.set(members)
+            set_members(instance, member_ids)
 
         return instance
+
+
+class BoardMembersSerializer(serializers.Serializer):
+    """
+    Input of the add and remove member endpoints.
+
+    - members: non-empty list of user IDs; unknown IDs are rejected with a
+      400 error listing them.
+    """
+    members = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        validators=[validate_member_ids]
+    )
@@ -1,8 +1,13 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 from .views import BoardViewSet
+from .async_views import AsyncBoardListView, AsyncBoardDetailView
 
 
 router = DefaultRouter()
 router.register(r'boards', BoardViewSet, basename='board')
 
-urlpatterns = router.urls
+urlpatterns = router.urls + [
+    path('async/boards/', AsyncBoardListView.as_view(), name='async-board-list'),
+    path('async/boards/<int:pk>/', AsyncBoardDetailView.as_view(), name='async-board-detail'),
+]
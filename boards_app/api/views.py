@@ -1,38 +1,117 @@
 from django.db import models
+from django.http import Http404
+from django.urls import reverse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from boards_app.models import Board
-from .serializers import BoardListSerializer, BoardDetailSerializer, BoardCreateUpdateSerializer
+from rest_framework.response import Response
+from boards_app.membership import member_boards, update_members
+from boards_app.models import Board, BoardMembership
+from core.concurrency import VersionedUpdateMixin
+from core.conditional import conditional
+from core.deletion import chunked_delete
+from core.fieldsets import FieldSelection, sideload
+from core.renderers import COMPACT_RENDERER_CLASSES
+from core.sharding import ShardSelectionMixin, fan_out_serialize, fan_out_version, new_id
+from jobs_app.api.views import enqueue_job_response
+from task_app.api.serializers import TaskReadSerializer
+from task_app.models import Task
+from .pagination import TaskColumnPagination
+from .serializers import (
+    BoardCreateUpdateSerializer,
+    BoardDetailSerializer,
+    BoardListSerializer,
+    BoardMembersSerializer,
+)
 from .permissions import IsBoardMemberOrOwner, IsBoardOwner
 
+BOARD_COLUMNS = [value for value, _ in Task.STATUS_CHOICES]
 
-class BoardViewSet(viewsets.ModelViewSet):
+
+def board_version(user, boards, version=None):
+    """
+    Return the version of the single board in boards for @conditional.
+
+    - (content_updated_at, '') from one query that also checks that user
+      is the owner or a member (has a membership row); None if there is no
+      such board or user may not read it.
+    - version: expression of the object version to add for a detail view
+      (e.g. F('version')), read in the same query.
+    """
+    extra = {} if version is None else {'object_version': version}
+    state = boards.annotate(
+        is_member=models.Exists(
+            BoardMembership.objects.filter(board=models.OuterRef('pk'), user=user)
+        )
+    ).values('is_member', 'content_updated_at', **extra).first()
+    if state is None or not state['is_member']:
+        return None
+    if version is None:
+        return state['content_updated_at'], ''
+    return state['content_updated_at'], '', state['object_version']
+
+
+class BoardViewSet(ShardSelectionMixin, VersionedUpdateMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing boards.
 
     - Requires authentication for all actions.
     - Queryset behavior:
-        * list: returns boards where the user is owner or member.
+        * list: returns boards where the user is owner or member,
+          annotated with the summary counts.
+        * retrieve: prefetches members and tasks.
         * other actions: returns all boards.
     - Serializer selection:
         * list: uses BoardListSerializer (summary view).
         * retrieve: uses BoardDetailSerializer (detailed view).
         * create/update/partial_update: uses BoardCreateUpdateSerializer.
+        * members/add, members/remove: uses BoardMembersSerializer.
     - Permission rules:
         * destroy: only board owners can delete.
-        * update/partial_update/retrieve: allowed for board owners or members.
+        * update/partial_update/retrieve/export/columns/column and the
+          member endpoints: allowed for board owners or members.
         * other actions: requires authentication only.
     - On create: automatically assigns the requesting user as the board owner.
+    - Updates honour If-Match: "<version>" and answer 412 when the board
+      changed in the meantime (core.concurrency.VersionedUpdateMixin).
+    - On destroy: deletes tasks and comments in chunks (core.deletion);
+      with ?async=true a delete_board job is enqueued instead (202).
+    - Custom actions:
+        * export: enqueues an export_board job and returns its status (202).
+        * columns: task counts per status (Kanban column) from one GROUP BY
+          query, with the URL of every column.
+        * columns/<status>: the tasks of one column, cursor paginated.
+        * members/add, members/remove: add or remove the given user IDs
+          with one bulk write; returns the IDs that actually changed.
+    - list, retrieve and columns/<status> accept ?fields= and ?expand=
+      (core.fieldsets); unselected fields are neither queried nor rendered.
+      retrieve and columns/<status> also accept ?normalize=users, which
+      returns every user once in a top-level users map.
+    - list, retrieve, columns and columns/<status> answer If-None-Match
+      with 304 (core.conditional), based on Board.content_updated_at; all
+      but list also answer If-Modified-Since.
+    - Responses can be rendered in the compact columnar format
+      (core.renderers.CompactJSONRenderer).
+    - With sharding (core.sharding), detail routes run on the shard of
+      their board and a new board gets its id (and shard) before it is
+      validated; list queries every shard and merges the boards by id.
     """
     permission_classes = [IsAuthenticated]
+    renderer_classes = COMPACT_RENDERER_CLASSES
+    new_board_id = None
 
     def get_queryset(self):
         user = self.request.user
 
         if self.action == 'list':
-            return Board.objects.filter(
-                models.Q(owner=user) | models.Q(members=user)
-            ).distinct()
+            return BoardListSerializer.setup_eager_loading(
+                member_boards(user),
+                FieldSelection.from_request(self.request)
+            )
+        elif self.action == 'retrieve':
+            return BoardDetailSerializer.setup_eager_loading(
+                Board.objects.all(), FieldSelection.from_request(self.request)
+            )
 
         return Board.objects.all()
 
@@ -41,15 +120,126 @@ class BoardViewSet(viewsets.ModelViewSet):
             return BoardListSerializer
         elif self.action == 'retrieve':
             return BoardDetailSerializer
+        elif self.action in ['add_members', 'remove_members']:
+            return BoardMembersSerializer
         else:
             return BoardCreateUpdateSerializer
 
     def get_permissions(self):
         if self.action == 'destroy':
             return [IsAuthenticated(), IsBoardOwner()]
-        elif self.action in ['update', 'partial_update', 'retrieve']:
+        elif self.action in [
+            'update', 'partial_update', 'retrieve', 'export', 'columns', 'column',
+            'add_members', 'remove_members'
+        ]:
             return [IsAuthenticated(), IsBoardMemberOrOwner()]
         return [IsAuthenticated()]
 
+    def shard_key(self, request, pk=None, **kwargs):
+        if self.action == 'create':
+            self.new_board_id = new_id('boards_app.board')
+            return self.new_board_id
+        return pk
+
+    def list_version(self, request, *args, **kwargs):
+        return fan_out_version(member_boards(request.user), 'content_updated_at')
+
+    def detail_version(self, request, pk=None, **kwargs):
+        return board_version(
+            request.user, Board.objects.filter(pk=pk), version=models.F('version')
+        )
+
+    @conditional('list_version', last_modified=False)
+    def list(self, request, *args, **kwargs):
+        _, data = fan_out_serialize(
+            self.get_serializer_class(),
+            self.filter_queryset(self.get_queryset()),
+            self.get_serializer_context(),
+            key=lambda board: board.pk,
+        )
+        return Response(data)
+
+    @conditional('detail_version')
+    def retrieve(self, request, *args, **kwargs):
+        serializer = self.get_serializer(self.get_object())
+        return Response(sideload(serializer))
+
     def perform_create(self, serializer):
-        serializer.save(owner=self.request.user)
+        if self.new_board_id is None:
+            serializer.save(owner=self.request.user)
+        else:
+            serializer.save(owner=self.request.user, pk=self.new_board_id)
+
+    def destroy(self, request, *args, **kwargs):
+        if request.query_params.get('async') in ('1', 'true'):
+            board = self.get_object()
+            return enqueue_job_response(request, 'delete_board', {'board_id': board.pk})
+        return super().destroy(request, *args, **kwargs)
+
+    def perform_destroy(self, instance):
+        chunked_delete(Board.objects.filter(pk=instance.pk))
+
+    @action(detail=True, methods=['post'])
+    def export(self, request, pk=None):
+        board = self.get_object()
+        return enqueue_job_response(request, 'export_board', {'board_id': board.pk})
+
+    @action(detail=True, methods=['post'], url_path='members/add', url_name='members-add')
+    def add_members(self, request, pk=None, format=None):
+        return self.change_members(request, add=True)
+
+    @action(detail=True, methods=['post'], url_path='members/remove', url_name='members-remove')
+    def remove_members(self, request, pk=None, format=None):
+        return self.change_members(request, add=False)
+
+    def change_members(self, request, add):
+        board = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        member_ids = serializer.validated_data['members']
+        if add:
+            added, removed = update_members(board, add=member_ids)
+        else:
+            added, removed = update_members(board, remove=member_ids)
+        return Response({'added': added, 'removed': removed})
+
+    @action(detail=True, methods=['get'])
+    @conditional('detail_version')
+    def columns(self, request, pk=None, format=None):
+        board = self.get_object()
+        counts = dict(
+            Task.objects.filter(board=board)
+            .order_by()
+            .values_list('status')
+            .annotate(count=models.Count('id'))
+        )
+        return Response({
+            'id': board.id,
+            'title': board.title,
+            'columns': [
+                {
+                    'status': column,
+                    'count': counts.get(column, 0),
+                    'url': request.build_absolute_uri(
+                        reverse('board-column', kwargs={'pk': board.pk, 'column': column})
+                    ),
+                }
+                for column in BOARD_COLUMNS
+            ],
+        })
+
+    @action(detail=True, methods=['get'], url_path=r'columns/(?P<column>[\w-]+)')
+    @conditional('detail_version')
+    def column(self, request, pk=None, column=None, format=None):
+        if column not in BOARD_COLUMNS:
+            raise Http404
+        board = self.get_object()
+        tasks = TaskReadSerializer.setup_eager_loading(
+            Task.objects.filter(board=board, status=column), FieldSelection.from_request(request)
+        )
+        paginator = TaskColumnPagination()
+        page = paginator.paginate_queryset(tasks, request, view=self)
+        serializer = TaskReadSerializer(page, many=True, context={'request': request})
+        response = paginator.get_paginated_response(serializer.data)
+        response.data = sideload(serializer, response.data)
+        return response
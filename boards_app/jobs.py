@@ -0,0 +1,50 @@
+from collections import defaultdict
+
+from boards_app.api.serializers import BoardDetailSerializer
+from boards_app.models import Board
+from core.deletion import chunked_delete
+from core.sharding import shard_for, use_shard
+from jobs_app.queue import PermanentJobError, job_handler, progress_reporter
+from task_app.api.serializers import CommentSerializer
+from task_app.models import Comment
+
+
+@job_handler('export_board')
+def export_board(job):
+    """
+    Export a board with its members, tasks and comments.
+
+    - Payload: {"board_id": <id>}.
+    - Returns the board detail representation where every task also lists
+      its comments; stored as the job result.
+    """
+    board_id = job.payload['board_id']
+    with use_shard(shard_for(board_id)):
+        try:
+            board = BoardDetailSerializer.setup_eager_loading(Board.objects.all()).get(pk=board_id)
+        except Board.DoesNotExist:
+            raise PermanentJobError(f'Board {board_id} does not exist.')
+
+        comments = defaultdict(list)
+        queryset = CommentSerializer.setup_eager_loading(Comment.objects.filter(task__board=board))
+        for comment in queryset.iterator(chunk_size=2000):
+            comments[comment.task_id].append(CommentSerializer(comment).data)
+
+        data = BoardDetailSerializer(board).data
+    for task in data['tasks']:
+        task['comments'] = comments[task['id']]
+    return data
+
+
+@job_handler('delete_board')
+def delete_board(job):
+    """
+    Delete a board with its tasks and comments in chunks.
+
+    - Payload: {"board_id": <id>}.
+    - Reports the rows deleted per model as progress and returns them.
+    - Safe to retry: an interrupted run continues where it stopped.
+    """
+    board_id = job.payload['board_id']
+    with use_shard(shard_for(board_id)):
+        return chunked_delete(Board.objects.filter(pk=board_id), progress=progress_reporter(job))
@@ -0,0 +1,158 @@
+from django.db import models, router, transaction
+
+from auth_app.models import User
+from boards_app.models import Board, BoardMembership
+from core.sharding import fan_out
+from task_app.models import Comment, Task
+
+
+def unknown_user_ids(user_ids):
+    """Return the ids in user_ids without a user, found with one query."""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return []
+    known = set(User.objects.filter(id__in=user_ids).values_list('id', flat=True))
+    return sorted(user_ids - known)
+
+
+def is_member(board, user):
+    """
+    Whether user is the owner or a member of board.
+
+    - One lookup on the unique (board, user) index of the membership rows.
+    """
+    return BoardMembership.objects.filter(board=board, user=user).exists()
+
+
+async def ais_member(board, user):
+    """Async variant of is_member(), for the async views."""
+    return await BoardMembership.objects.filter(board=board, user=user).aexists()
+
+
+def member_rows(board=None):
+    """
+    Return the membership rows with role 'member' joined with their users.
+
+    - Limited to board if given; ordered as the rows were added.
+    """
+    rows = BoardMembership.objects.filter(role=BoardMembership.MEMBER)
+    if board is not None:
+        rows = rows.filter(board=board)
+    return rows.select_related('user').order_by('pk')
+
+
+def prefetch_member_rows():
+    """
+    Prefetch the member_rows of boards (see Board.listed_members).
+
+    - One query for all boards; the owner rows are left out.
+    """
+    return models.Prefetch('memberships', queryset=member_rows(), to_attr='member_rows')
+
+
+def member_boards(user):
+    """
+    Return the boards user owns or is a member of.
+
+    - A plain join on the membership rows; each board appears once, so no
+      DISTINCT is needed.
+    """
+    return Board.objects.filter(memberships__user=user)
+
+
+def shares_board(user, other):
+    """
+    Whether user and other are both owner or member of some board.
+
+    - One EXISTS query over the membership rows (per shard with sharding).
+    """
+    return any(fan_out(
+        lambda: BoardMembership.objects.filter(user=user, board__memberships__user=other).exists()
+    ))
+
+
+def touch_user_boards(user):
+    """
+    Touch the boards that show user: as member, as assignee or reviewer of
+    a task, or as comment author.
+
+    - One UPDATE with a subquery per relation (per shard with sharding).
+    """
+    fan_out(lambda: Board.touch(
+        models.Q(pk__in=BoardMembership.objects.filter(user=user).values('board_id'))
+        | models.Q(pk__in=Task.objects.filter(
+            models.Q(assignee=user) | models.Q(reviewer=user)
+        ).values('board_id'))
+        | models.Q(pk__in=Comment.objects.filter(author=user).values('task__board_id'))
+    ))
+
+
+def apply_member_diff(board, added, removed):
+    """
+    Insert the added and delete the removed membership rows of board.
+
+    - At most one bulk insert and one bulk delete; touches the board when
+      anything changed.
+    - Rows inserted concurrently by another request are ignored, and the
+      owner row is never deleted.
+    """
+    if added:
+        BoardMembership.objects.bulk_create(
+            [BoardMembership(board_id=board.pk, user_id=user_id) for user_id in added],
+            ignore_conflicts=True,
+        )
+    if removed:
+        BoardMembership.objects.filter(
+            board=board, user_id__in=removed, role=BoardMembership.MEMBER
+        ).delete()
+    if added or removed:
+        Board.touch(pk=board.pk)
+
+
+def update_members(board, add=(), remove=()):
+    """
+    Add and remove board members as a diff of the membership rows.
+
+    - Reads the affected rows once, then applies the difference with
+      apply_member_diff(); ids that already are (or are not) members are
+      skipped, and so is removing the owner.
+    - The ids must belong to existing users (see unknown_user_ids()).
+    - Returns (added ids, removed ids), sorted.
+    """
+    add, remove = set(add), set(remove)
+    with transaction.atomic(using=router.db_for_write(BoardMembership)):
+        current = dict(
+            BoardMembership.objects
+            .filter(board=board, user_id__in=add | remove)
+            .values_list('user_id', 'role')
+        )
+        added = sorted(add - remove - current.keys())
+        removed = sorted(
+            user_id for user_id in remove
+            if current.get(user_id) == BoardMembership.MEMBER
+        )
+        apply_member_diff(board, added, removed)
+    return added, removed
+
+
+def set_members(board, member_ids):
+    """
+    Replace the members of board with member_ids.
+
+    - Reads the current member ids once and applies only the difference,
+      instead of rewriting the whole relation.
+    - The owner stays a member whether or not member_ids lists them.
+    - Returns (added ids, removed ids), sorted.
+    """
+    member_ids = set(member_ids)
+    with transaction.atomic(using=router.db_for_write(BoardMembership)):
+        current = dict(
+            BoardMembership.objects.filter(board=board).values_list('user_id', 'role')
+        )
+        added = sorted(member_ids - current.keys())
+        removed = sorted(
+            user_id for user_id, role in current.items()
+            if role == BoardMembership.MEMBER and user_id not in member_ids
+        )
+        apply_member_diff(board, added, removed)
+    return added, removed
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-19 11:04
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0002_board_members_alter_board_owner'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='content_updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,79 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_memberships(apps, schema_editor):
+    """
+    Copy the rows of the old members table and add a row for every owner.
+
+    - Owners that were also listed as members keep a single row, with the
+      owner role.
+    """
+    Board = apps.get_model('boards_app', 'Board')
+    BoardMembership = apps.get_model('boards_app', 'BoardMembership')
+    db_alias = schema_editor.connection.alias
+    owners = dict(Board.objects.using(db_alias).values_list('id', 'owner_id'))
+    rows = {
+        (board_id, owner_id): 'owner' for board_id, owner_id in owners.items()
+    }
+    old_rows = Board.members.through.objects.using(db_alias).values_list('board_id', 'user_id')
+    for board_id, user_id in old_rows.iterator():
+        rows.setdefault((board_id, user_id), 'member')
+    BoardMembership.objects.using(db_alias).bulk_create(
+        [
+            BoardMembership(board_id=board_id, user_id=user_id, role=role)
+            for (board_id, user_id), role in rows.items()
+        ],
+        batch_size=1000,
+    )
+
+
+def restore_members(apps, schema_editor):
+    """Copy the memberships back into the old members table, without owners."""
+    Board = apps.get_model('boards_app', 'Board')
+    BoardMembership = apps.get_model('boards_app', 'BoardMembership')
+    db_alias = schema_editor.connection.alias
+    Through = Board.members.through
+    memberships = (
+        BoardMembership.objects.using(db_alias)
+        .filter(role='member')
+        .values_list('board_id', 'user_id')
+    )
+    Through.objects.using(db_alias).bulk_create(
+        [Through(board_id=board_id, user_id=user_id) for board_id, user_id in memberships.iterator()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0003_board_timestamps'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardMembership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('owner', 'Owner'), ('member', 'Member')], default='member', max_length=10)),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='boards_app.board')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='board_memberships', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('board', 'user'), name='board_membership_unique')],
+            },
+        ),
+        migrations.RunPython(copy_memberships, restore_members),
+        migrations.RemoveField(
+            model_name='board',
+            name='members',
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='members',
+            field=models.ManyToManyField(blank=True, related_name='member_boards', through='boards_app.BoardMembership', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -1,17 +1,41 @@
-from django.db import models
+from django.db import models, router, transaction
+from django.utils import timezone
 from auth_app.models import User
+from core.concurrency import VersionedModel
+from core.sharding import current_shard, new_id, shard_for, use_shard
 
 
-class Board(models.Model):
+class Board(VersionedModel):
     """
     Model representing a project board.
 
     - title: The name of the board.
     - owner: A foreign key to the User who owns the board.
       * If the owner is deleted, all owned boards are also deleted (CASCADE).
-    - members: A many-to-many relationship to Users who are members of the board.
-      * Can be empty (blank=True).
+    - members: A many-to-many relationship to Users through
+      BoardMembership. It includes the owner, whose row has role 'owner';
+      save() writes that row when the board is created or its owner
+      changes. Access checks use these rows (memberships).
+    - member_users(): The users with role 'member', i.e. the members
+      without the owner, as the API lists them. listed_members returns
+      them from the member_rows prefetch of
+      boards_app.membership.prefetch_member_rows() when it was loaded.
+    - updated_at: Timestamp of the last change to the board row.
+    - version: Incremented by every save of the board row; saving a board
+      read at an older version raises VersionConflict
+      (core.concurrency.VersionedModel). Member, task and comment changes
+      do not change it.
+    - content_updated_at: Timestamp of the last change to the board or
+      anything shown with it (members, tasks, comments); set by save() and
+      by touch(), which task and comment writes call.
+    - With sharding, a new board gets an id that maps to the selected
+      shard, or to the next shard in turn (core.sharding.new_id()); the
+      board and everything on it live on that shard.
+    - Indexed on title for the admin's prefix search.
     - __str__: Returns the board's title as its string representation.
+    - touch(*conditions, using=None, **lookups): Sets content_updated_at of
+      the matching boards to now with a single UPDATE, on database using
+      or the one the router picks.
     """
     title = models.CharField(max_length=255)
     owner = models.ForeignKey(
@@ -21,9 +45,122 @@ class Board(models.Model):
     )
     members = models.ManyToManyField(
         User,
+        through='BoardMembership',
         related_name="member_boards",
         blank=True
     )
+    updated_at = models.DateTimeField(auto_now=True)
+    content_updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['title'], name='board_title_idx'),
+        ]
 
     def __str__(self):
         return self.title
+
+    def member_users(self):
+        return User.objects.filter(
+            board_memberships__board=self, board_memberships__role=BoardMembership.MEMBER
+        ).order_by('board_memberships__pk')
+
+    @property
+    def listed_members(self):
+        rows = getattr(self, 'member_rows', None)
+        if rows is None:
+            from boards_app.membership import member_rows
+
+            rows = member_rows(self)
+        return [row.user for row in rows]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        board = super().from_db(db, field_names, values)
+        board._loaded_owner_id = board.__dict__.get('owner_id')
+        return board
+
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.pk is None:
+            self.pk = new_id('boards_app.board', current_shard())
+        with use_shard(shard_for(self.pk)):
+            self._save(*args, **kwargs)
+
+    def _save(self, *args, **kwargs):
+        self.content_updated_at = timezone.now()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'updated_at', 'content_updated_at'}
+        adding = self._state.adding
+        previous_owner_id = getattr(self, '_loaded_owner_id', None)
+        if not adding and self.owner_id == previous_owner_id:
+            super().save(*args, **kwargs)
+            return
+        with transaction.atomic(using=kwargs.get('using') or router.db_for_write(Board, instance=self)):
+            super().save(*args, **kwargs)
+            if adding:
+                BoardMembership.objects.create(
+                    board=self, user_id=self.owner_id, role=BoardMembership.OWNER)
+            else:
+                BoardMembership.set_owner(self, previous_owner_id)
+        self._loaded_owner_id = self.owner_id
+
+    @classmethod
+    def touch(cls, *conditions, using=None, **lookups):
+        return (
+            cls.objects.db_manager(using)
+            .filter(*conditions, **lookups)
+            .update(content_updated_at=timezone.now())
+        )
+
+
+class BoardMembership(models.Model):
+    """
+    Membership of a user in a board (the through model of Board.members).
+
+    - role: 'owner' for the board owner, 'member' for everybody else; every
+      board has exactly one owner row.
+    - A user has at most one row per board (unique on board and user), so
+      an access check is a single index lookup and joining boards through
+      their memberships never needs DISTINCT.
+    - The owner row cannot be removed with the member endpoints
+      (boards_app.membership); it follows Board.owner.
+    - touch_related(queryset, deleting): Touches the boards of the rows of
+      queryset, unless boards are among the models being deleted;
+      ChunkedDeleter calls it for rows it deletes without delete().
+    """
+    OWNER = 'owner'
+    MEMBER = 'member'
+    ROLE_CHOICES = [
+        (OWNER, 'Owner'),
+        (MEMBER, 'Member'),
+    ]
+
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='memberships')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='board_memberships')
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES, default=MEMBER)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['board', 'user'], name='board_membership_unique'),
+        ]
+
+    def __str__(self):
+        return f'{self.user_id} in {self.board_id} ({self.role})'
+
+    @classmethod
+    def touch_related(cls, queryset, deleting=()):
+        if Board not in deleting:
+            Board.touch(pk__in=queryset.values('board_id'), using=queryset.db)
+
+    @classmethod
+    def set_owner(cls, board, previous_owner_id):
+        """
+        Move the owner row of board to its current owner.
+
+        - The previous owner stays on the board as a member.
+        """
+        cls.objects.filter(board=board, user_id=previous_owner_id).update(role=cls.MEMBER)
+        updated = cls.objects.filter(board=board, user_id=board.owner_id).update(role=cls.OWNER)
+        if not updated:
+            cls.objects.create(board=board, user_id=board.owner_id, role=cls.OWNER)
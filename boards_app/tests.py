@@ -5,17 +5,39 @@ Covers:
 - Board listing: ownership, membership, authentication, and response format.
 - Board creation: successful creation, member assignment, owner assignment, and validation errors.
 - Board detail retrieval: access control for owners, members, outsiders, and unauthenticated users.
-- Board update: title changes, member updates, and permission checks.
-- Board deletion: owner-only deletion, member restrictions, and authentication enforcement.
-- Board model: string representation and relationship integrity.
+- Board update: title changes, member updates, permission checks and
+  If-Match on the board version.
+- Board deletion: owner-only deletion, member restrictions, authentication enforcement,
+  chunked cascade deletion and deletion as a background job.
+- Board model: string representation, relationship integrity and the
+  owner membership row.
+- Async board views: parity with the sync views and access control.
+- Board columns: per-status counts and cursor-paginated columns.
+- Sparse fieldsets: ?fields= and ?expand= on board reads.
+- Normalized responses: ?normalize=users on board detail and columns.
+- Compact columnar format: round trips for board detail and columns.
+- Conditional GET: board rollup timestamps, ETag and Last-Modified.
+- Membership: diff-based member updates, add/remove endpoints and
+  unknown user ids.
 """
 
-from django.test import TestCase
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import AsyncClient, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 from rest_framework import status
 from auth_app.models import User
-from boards_app.models import Board
+from boards_app.membership import member_boards, prefetch_member_rows, set_members
+from boards_app.models import Board, BoardMembership
+from core.deletion import chunked_delete
+from core.renderers import from_columns
+from core.testing import token_login
+from task_app.models import Comment, Task
 
 
 class BoardListTests(TestCase):
@@ -51,6 +73,21 @@ class BoardListTests(TestCase):
         )
         self.assertEqual(len(response.data), 2)
 
+    def test_list_joins_memberships_without_distinct(self):
+        board = Board.objects.create(title='Board', owner=self.user)
+        board.members.add(self.user, self.other_user)
+
+        self.client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual([item['id'] for item in response.data], [board.id])
+        self.assertEqual(response.data[0]['member_count'], 1)
+        board_query = next(
+            q['sql'] for q in queries if q['sql'].startswith('SELECT "boards_app_board"."id"')
+        )
+        self.assertNotIn('DISTINCT', board_query)
+
     def test_list_boards_shows_member_boards(self):
         board = Board.objects.create(
             title='Shared Board', owner=self.other_user)
@@ -143,7 +180,7 @@ class BoardCreateTests(TestCase):
             status.HTTP_201_CREATED
         )
         board = Board.objects.get(id=response.data['id'])
-        self.assertEqual(board.members.count(), 0)
+        self.assertEqual(board.member_users().count(), 0)
 
     def test_create_board_owner_is_set(self):
         data = {'title': 'Test Board'}
@@ -288,6 +325,37 @@ class BoardUpdateTests(TestCase):
         self.board.refresh_from_db()
         self.assertEqual(self.board.title, 'New Title')
 
+    def test_update_with_if_match(self):
+        self.client.force_authenticate(user=self.owner)
+        url = reverse('board-detail', kwargs={'pk': self.board.id})
+
+        response = self.client.patch(url, {'title': 'New Title'}, HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['version'], 2)
+
+        response = self.client.patch(url, {'title': 'Stale'}, HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.board.refresh_from_db()
+        self.assertEqual((self.board.title, self.board.version), ('New Title', 2))
+
+    def test_update_with_etag_of_detail_get(self):
+        self.client.force_authenticate(user=self.owner)
+        url = reverse('board-detail', kwargs={'pk': self.board.id})
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.patch(url, {'title': 'New Title'}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], '"2"')
+
+        response = self.client.patch(url, {'title': 'Stale'}, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+    def test_member_changes_keep_board_version(self):
+        set_members(self.board, [self.new_member.id])
+
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.version, 1)
+
     def test_update_board_members(self):
         self.client.force_authenticate(user=self.owner)
         url = reverse('board-detail', kwargs={'pk': self.board.id})
@@ -299,8 +367,8 @@ class BoardUpdateTests(TestCase):
             status.HTTP_200_OK
         )
         self.board.refresh_from_db()
-        self.assertIn(self.new_member, self.board.members.all())
-        self.assertNotIn(self.member, self.board.members.all())
+        self.assertIn(self.new_member, self.board.member_users())
+        self.assertNotIn(self.member, self.board.member_users())
 
     def test_update_board_as_member(self):
         self.client.force_authenticate(user=self.member)
@@ -379,6 +447,43 @@ class BoardDeleteTests(TestCase):
             status.HTTP_401_UNAUTHORIZED
         )
 
+    def test_delete_board_with_tasks_and_comments(self):
+        task = Task.objects.create(title='Task', board=self.board, created_by=self.member)
+        Comment.objects.create(task=task, author=self.member, text='Comment')
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.delete(reverse('board-detail', kwargs={'pk': self.board.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(Comment.objects.exists())
+
+    def test_delete_board_as_background_job(self):
+        Task.objects.create(title='Task', board=self.board, created_by=self.owner)
+        self.client.force_authenticate(user=self.owner)
+        url = reverse('board-detail', kwargs={'pk': self.board.id})
+
+        response = self.client.delete(f'{url}?async=true')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['name'], 'delete_board')
+        self.assertEqual(Board.objects.count(), 1)
+
+        call_command('run_worker', burst=True, stdout=StringIO())
+        job = self.client.get(response['Location']).data
+
+        self.assertEqual(job['status'], 'succeeded')
+        self.assertEqual(job['progress']['task_app.Task'], 1)
+        self.assertEqual(Board.objects.count(), 0)
+
+    def test_async_delete_requires_owner(self):
+        self.client.force_authenticate(user=self.member)
+        url = reverse('board-detail', kwargs={'pk': self.board.id})
+
+        response = self.client.delete(f'{url}?async=true')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
 
 class BoardModelTests(TestCase):
     """Tests for the Board model, including string representation and relationship integrity with users."""
@@ -407,3 +512,643 @@ class BoardModelTests(TestCase):
         self.assertIn(member, board.members.all())
         self.assertIn(board, owner.owned_boards.all())
         self.assertIn(board, member.member_boards.all())
+
+    def test_owner_gets_owner_membership(self):
+        owner = User.objects.create_user(username='owner@test.com', email='owner@test.com')
+        board = Board.objects.create(title='Test', owner=owner)
+
+        self.assertEqual(
+            list(board.memberships.values_list('user_id', 'role')),
+            [(owner.id, BoardMembership.OWNER)],
+        )
+        self.assertEqual(board.member_users().count(), 0)
+        self.assertEqual(list(board.members.all()), [owner])
+        self.assertIn(board, member_boards(owner))
+
+    def test_member_users_leave_out_owner_row(self):
+        owner = User.objects.create_user(username='owner@test.com', email='owner@test.com')
+        member = User.objects.create_user(username='member@test.com', email='member@test.com')
+        board = Board.objects.create(title='Test', owner=owner)
+        board.members.add(owner, member)
+
+        self.assertEqual(list(board.members.all()), [owner, member])
+        self.assertEqual(list(board.member_users()), [member])
+        self.assertEqual(board.listed_members, [member])
+        self.assertEqual(
+            list(board.memberships.values_list('user_id', 'role')),
+            [(owner.id, BoardMembership.OWNER), (member.id, BoardMembership.MEMBER)],
+        )
+        prefetched = Board.objects.prefetch_related(prefetch_member_rows()).get(pk=board.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(prefetched.listed_members, [member])
+
+    def test_changing_owner_moves_owner_membership(self):
+        owner = User.objects.create_user(username='owner@test.com', email='owner@test.com')
+        successor = User.objects.create_user(username='next@test.com', email='next@test.com')
+        board = Board.objects.create(title='Test', owner=owner)
+        board.members.add(successor)
+
+        board = Board.objects.get(pk=board.pk)
+        board.owner = successor
+        board.save()
+
+        self.assertEqual(
+            dict(board.memberships.values_list('user_id', 'role')),
+            {owner.id: BoardMembership.MEMBER, successor.id: BoardMembership.OWNER},
+        )
+
+
+class AsyncBoardViewTests(TestCase):
+    """Tests for the async board list and detail views."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner@test.com',
+            email='owner@test.com',
+            password='pass123',
+            fullname='Board Owner'
+        )
+        self.member = User.objects.create_user(
+            username='member@test.com',
+            email='member@test.com',
+            password='pass123'
+        )
+        self.outsider = User.objects.create_user(
+            username='outsider@test.com',
+            email='outsider@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Test Board', owner=self.owner)
+        self.board.members.add(self.member)
+        Task.objects.create(
+            title='Task', board=self.board, priority='high',
+            assignee=self.member, created_by=self.owner
+        )
+        Board.objects.create(title='Other Board', owner=self.outsider)
+        self.token = Token.objects.create(user=self.member)
+
+    def test_board_list_matches_sync_view(self):
+        token_login(self.client, self.member)
+        sync_response = self.client.get(reverse('board-list'))
+        async_response = self.client.get(reverse('async-board-list'))
+
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(async_response.json(), sync_response.json())
+
+    def test_board_detail_matches_sync_view(self):
+        token_login(self.client, self.member)
+        sync_response = self.client.get(
+            reverse('board-detail', kwargs={'pk': self.board.id}))
+        async_response = self.client.get(
+            reverse('async-board-detail', kwargs={'pk': self.board.id}))
+
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(async_response.json(), sync_response.json())
+        self.assertEqual(len(async_response.json()['tasks']), 1)
+
+    def test_board_detail_as_outsider(self):
+        token_login(self.client, self.outsider)
+        response = self.client.get(
+            reverse('async-board-detail', kwargs={'pk': self.board.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_board_detail_without_members_checks_membership_row(self):
+        url = reverse('async-board-detail', kwargs={'pk': self.board.id})
+        token_login(self.client, self.member)
+        response = self.client.get(url, {'fields': 'id,title'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {'id': self.board.id, 'title': 'Test Board'})
+
+        token_login(self.client, self.outsider)
+        response = self.client.get(url, {'fields': 'id,title'})
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_nonexistent_board(self):
+        token_login(self.client, self.owner)
+        response = self.client.get(
+            reverse('async-board-detail', kwargs={'pk': 9999}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unauthenticated(self):
+        response = self.client.get(reverse('async-board-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_token_authentication_through_async_stack(self):
+        client = AsyncClient()
+        response = await client.get(
+            reverse('async-board-list'),
+            headers={'Authorization': f'Token {self.token.key}'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([board['title'] for board in response.json()], ['Test Board'])
+
+    async def test_invalid_token(self):
+        client = AsyncClient()
+        response = await client.get(
+            reverse('async-board-list'),
+            headers={'Authorization': 'Token invalid'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class BoardColumnTests(TestCase):
+    """Tests for /api/boards/<id>/columns/ and /api/boards/<id>/columns/<status>/."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner@test.com',
+            email='owner@test.com',
+            password='pass123'
+        )
+        self.outsider = User.objects.create_user(
+            username='outsider@test.com',
+            email='outsider@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        for index in range(5):
+            Task.objects.create(title=f'Done {index}', board=self.board, status='done')
+        Task.objects.create(title='Review', board=self.board, status='review')
+        self.client.force_authenticate(user=self.owner)
+
+    def test_column_counts(self):
+        response = self.client.get(reverse('board-columns', kwargs={'pk': self.board.pk}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(column['status'], column['count']) for column in response.data['columns']],
+            [('to-do', 0), ('in-progress', 0), ('review', 1), ('done', 5)]
+        )
+        self.assertTrue(response.data['columns'][3]['url'].endswith(
+            reverse('board-column', kwargs={'pk': self.board.pk, 'column': 'done'})
+        ))
+
+    def test_column_pages(self):
+        url = reverse('board-column', kwargs={'pk': self.board.pk, 'column': 'done'})
+        titles = []
+        response = self.client.get(url, {'page_size': 2})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 2)
+            titles += [task['title'] for task in response.data['results']]
+            if response.data['next'] is None:
+                break
+            response = self.client.get(response.data['next'])
+
+        self.assertEqual(titles, [f'Done {index}' for index in reversed(range(5))])
+
+    def test_unknown_column(self):
+        url = reverse('board-column', kwargs={'pk': self.board.pk, 'column': 'archived'})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_columns_require_membership(self):
+        self.client.force_authenticate(user=self.outsider)
+
+        response = self.client.get(reverse('board-columns', kwargs={'pk': self.board.pk}))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(
+            reverse('board-column', kwargs={'pk': self.board.pk, 'column': 'done'})
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class BoardFieldsetTests(TestCase):
+    """Tests for ?fields= and ?expand= on the board endpoints."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner@test.com',
+            email='owner@test.com',
+            password='pass123',
+            fullname='Board Owner'
+        )
+        self.member = User.objects.create_user(
+            username='member@test.com',
+            email='member@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        self.task = Task.objects.create(
+            title='Task', board=self.board, assignee=self.owner, status='review'
+        )
+        self.detail_url = reverse('board-detail', kwargs={'pk': self.board.pk})
+        self.client.force_authenticate(user=self.owner)
+
+    def test_list_annotates_selected_counts_only(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('board-list'), {'fields': 'id,ticket_count'})
+
+        self.assertEqual(response.data, [{'id': self.board.id, 'ticket_count': 1}])
+        self.assertEqual(queries[-1]['sql'].count('COUNT('), 1)
+
+    def test_detail_nested_task_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self.detail_url, {'fields': 'id,title,tasks.id,tasks.status'}
+            )
+
+        self.assertEqual(response.data, {
+            'id': self.board.id,
+            'title': 'Board',
+            'tasks': [{'id': self.task.id, 'status': 'review'}],
+        })
+        sql = ' '.join(query['sql'] for query in queries)
+        self.assertNotIn('auth_app_user"."fullname', sql)
+        self.assertNotIn('COUNT(', sql)
+
+    def test_detail_collapsed_relations(self):
+        response = self.client.get(self.detail_url, {'expand': 'tasks.assignee'})
+
+        self.assertEqual(response.data['members'], [self.member.id])
+        self.assertEqual(response.data['tasks'][0]['assignee']['fullname'], 'Board Owner')
+        self.assertEqual(response.data['tasks'][0]['reviewer'], None)
+
+        response = self.client.get(self.detail_url, {'fields': 'id,tasks', 'expand': ''})
+        self.assertEqual(response.data, {'id': self.board.id, 'tasks': [self.task.id]})
+
+    def test_async_views_match(self):
+        token_login(self.client, self.owner)
+        for name, async_name, kwargs, params in [
+            ('board-list', 'async-board-list', {}, {'fields': 'id,member_count'}),
+            ('board-detail', 'async-board-detail', {'pk': self.board.pk},
+             {'fields': 'id,members,tasks.title', 'expand': 'tasks'}),
+            ('board-detail', 'async-board-detail', {'pk': self.board.pk},
+             {'fields': 'tasks', 'expand': ''}),
+        ]:
+            sync_response = self.client.get(reverse(name, kwargs=kwargs), params)
+            async_response = self.client.get(reverse(async_name, kwargs=kwargs), params)
+            self.assertEqual(async_response.json(), sync_response.json())
+
+    def test_column_fields(self):
+        url = reverse('board-column', kwargs={'pk': self.board.pk, 'column': 'review'})
+        response = self.client.get(url, {'fields': 'id,title'})
+
+        self.assertEqual(response.data['results'], [{'id': self.task.id, 'title': 'Task'}])
+
+
+class NormalizedBoardResponseTests(TestCase):
+    """Tests for ?normalize=users on the board endpoints."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner@test.com',
+            email='owner@test.com',
+            password='pass123',
+            fullname='Board Owner'
+        )
+        self.member = User.objects.create_user(
+            username='member@test.com',
+            email='member@test.com',
+            password='pass123',
+            fullname='Board Member'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        for index in range(10):
+            Task.objects.create(
+                title=f'Task {index}', board=self.board,
+                assignee=self.owner, reviewer=self.member
+            )
+        self.detail_url = reverse('board-detail', kwargs={'pk': self.board.pk})
+        self.client.force_authenticate(user=self.owner)
+
+    def test_detail_lists_each_user_once(self):
+        nested = self.client.get(self.detail_url)
+        response = self.client.get(self.detail_url, {'normalize': 'users'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['members'], [self.member.id])
+        self.assertEqual(
+            {(task['assignee'], task['reviewer']) for task in response.data['tasks']},
+            {(self.owner.id, self.member.id)}
+        )
+        self.assertEqual(response.data['users'][self.member.id]['fullname'], 'Board Member')
+        self.assertEqual(len(response.data['users']), 2)
+        self.assertLess(len(response.content), len(nested.content))
+
+    def test_normalize_with_fields(self):
+        response = self.client.get(
+            self.detail_url, {'fields': 'id,tasks.assignee', 'normalize': 'users'}
+        )
+
+        self.assertEqual(list(response.data['users']), [self.owner.id])
+        self.assertEqual(response.data['tasks'][0], {'assignee': self.owner.id})
+
+    def test_column_page(self):
+        url = reverse('board-column', kwargs={'pk': self.board.pk, 'column': 'to-do'})
+        response = self.client.get(url, {'normalize': 'users', 'page_size': 2})
+
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
+        self.assertEqual(sorted(response.data['users']), [self.owner.id, self.member.id])
+
+    def test_async_detail_matches(self):
+        token_login(self.client, self.owner)
+        params = {'normalize': 'users'}
+        sync_response = self.client.get(self.detail_url, params)
+        async_response = self.client.get(
+            reverse('async-board-detail', kwargs={'pk': self.board.pk}), params
+        )
+
+        self.assertEqual(async_response.json(), sync_response.json())
+
+
+class CompactBoardFormatTests(TestCase):
+    """Tests for the compact columnar format of the board endpoints."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner@test.com',
+            email='owner@test.com',
+            password='pass123',
+            fullname='Board Owner'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.owner)
+        for index in range(3):
+            Task.objects.create(title=f'Task {index}', board=self.board, assignee=self.owner)
+        self.client.force_authenticate(user=self.owner)
+
+    def test_board_detail_round_trip(self):
+        url = reverse('board-detail', kwargs={'pk': self.board.pk})
+        regular = self.client.get(url)
+        compact = self.client.get(url, HTTP_ACCEPT='application/vnd.kanmind.compact+json')
+
+        data = compact.json()
+        self.assertEqual(data['title'], 'Board')
+        self.assertEqual(len(data['tasks']['rows']), 3)
+        self.assertEqual(from_columns(data), regular.json())
+
+    def test_column_page_round_trip(self):
+        url = reverse('board-column', kwargs={'pk': self.board.pk, 'column': 'to-do'})
+        regular = self.client.get(url, {'page_size': 2})
+        compact = self.client.get(url, {'page_size': 2, 'format': 'compact'})
+
+        data = from_columns(compact.json())
+        self.assertEqual(compact.json()['results']['columns'][0], 'id')
+        self.assertEqual(data['results'], regular.json()['results'])
+        self.assertIn('format=compact', data['next'])
+
+
+class BoardConditionalGetTests(TestCase):
+    """Tests for Board.content_updated_at and 304 responses of the board endpoints."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner@test.com',
+            email='owner@test.com',
+            password='pass123'
+        )
+        self.member = User.objects.create_user(
+            username='member@test.com',
+            email='member@test.com',
+            password='pass123'
+        )
+        self.outsider = User.objects.create_user(
+            username='outsider@test.com',
+            email='outsider@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        self.task = Task.objects.create(title='Task', board=self.board)
+        self.detail_url = reverse('board-detail', kwargs={'pk': self.board.pk})
+        self.client.force_authenticate(user=self.owner)
+
+    def content_updated_at(self):
+        return Board.objects.get(pk=self.board.pk).content_updated_at
+
+    def test_child_writes_touch_board(self):
+        for write in [
+            lambda: self.task.save(),
+            lambda: Comment.objects.create(task=self.task, author=self.owner, text='Hi'),
+            lambda: Comment.objects.get(task=self.task).delete(),
+            lambda: Task.objects.create(title='Other', board=self.board),
+            lambda: Task.objects.get(title='Other').delete(),
+        ]:
+            before = self.content_updated_at()
+            write()
+            self.assertGreater(self.content_updated_at(), before)
+
+    def test_chunked_deletes_touch_board(self):
+        def make_user(name):
+            return User.objects.create_user(username=name, email=name, password='pass123')
+
+        leaver = make_user('leaver@test.com')
+        self.board.members.add(leaver)
+        assignee = make_user('assignee@test.com')
+        Task.objects.filter(pk=self.task.pk).update(assignee=assignee)
+        author = make_user('author@test.com')
+        Comment.objects.bulk_create([Comment(task=self.task, author=author, text='Hi')])
+
+        for user in [leaver, assignee, author]:
+            etag = self.client.get(self.detail_url)['ETag']
+            before = self.content_updated_at()
+            chunked_delete(User.objects.filter(pk=user.pk))
+            self.assertGreater(self.content_updated_at(), before)
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_profile_changes_touch_board(self):
+        Task.objects.filter(pk=self.task.pk).update(assignee=self.outsider)
+        outsider = User.objects.get(pk=self.outsider.pk)
+        for user, field in [(self.member, 'fullname'), (outsider, 'email')]:
+            before = self.content_updated_at()
+            setattr(user, field, 'changed@test.com')
+            user.save()
+            self.assertGreater(self.content_updated_at(), before)
+
+        before = self.content_updated_at()
+        member = User.objects.get(pk=self.member.pk)
+        member.save(update_fields=['last_login'])
+        self.owner.first_name = 'Not shown'
+        self.owner.save()
+        self.assertEqual(self.content_updated_at(), before)
+
+    def test_unchanged_board_returns_304(self):
+        response = self.client.get(self.detail_url)
+        etag = response['ETag']
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        Task.objects.create(title='New', board=self.board)
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get(self.detail_url)['Last-Modified']
+
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_depends_on_representation_and_user(self):
+        etag = self.client.get(self.detail_url)['ETag']
+
+        self.assertNotEqual(self.client.get(self.detail_url, {'fields': 'id'})['ETag'], etag)
+        self.client.force_authenticate(user=self.member)
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_outsider_gets_no_etag(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        self.client.force_authenticate(user=self.outsider)
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_list_changes_when_membership_changes(self):
+        self.client.force_authenticate(user=self.member)
+        etag = self.client.get(reverse('board-list'))['ETag']
+        self.assertEqual(
+            self.client.get(reverse('board-list'), HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+        self.board.members.remove(self.member)
+
+        response = self.client.get(reverse('board-list'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+    def test_column_returns_304(self):
+        url = reverse('board-column', kwargs={'pk': self.board.pk, 'column': 'to-do'})
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class BoardMembershipTests(TestCase):
+    """Tests for boards_app.membership and the member endpoints."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner@test.com',
+            email='owner@test.com',
+            password='pass123'
+        )
+        self.users = [
+            User.objects.create_user(
+                username=f'user{index}@test.com',
+                email=f'user{index}@test.com',
+                password='pass123'
+            )
+            for index in range(4)
+        ]
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(*self.users[:2])
+        self.client.force_authenticate(user=self.owner)
+
+    def member_ids(self):
+        return sorted(self.board.member_users().values_list('id', flat=True))
+
+    def test_set_members_writes_only_the_diff(self):
+        kept, removed, added = self.users[0], self.users[1], self.users[2]
+
+        # Savepoint, current ids, one bulk insert, one bulk delete, board
+        # touch, release.
+        with self.assertNumQueries(6):
+            result = set_members(self.board, [kept.id, added.id])
+
+        self.assertEqual(result, ([added.id], [removed.id]))
+        self.assertEqual(self.member_ids(), sorted([kept.id, added.id]))
+
+    def test_unchanged_members_write_nothing(self):
+        # Savepoint, current ids, release.
+        with self.assertNumQueries(3):
+            set_members(self.board, [user.id for user in self.users[:2]])
+
+    def test_update_reports_unknown_ids(self):
+        url = reverse('board-detail', kwargs={'pk': self.board.pk})
+        response = self.client.patch(
+            url, {'members': [self.users[2].id, 9998, 9999]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['members'], ['Unknown user id(s): 9998, 9999'])
+        self.assertEqual(self.member_ids(), [user.id for user in self.users[:2]])
+
+    def test_create_reports_unknown_ids(self):
+        response = self.client.post(
+            reverse('board-list'), {'title': 'New', 'members': [9999]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Board.objects.filter(title='New').exists())
+
+    def test_add_members(self):
+        url = reverse('board-members-add', kwargs={'pk': self.board.pk})
+        new_ids = [self.users[1].id, self.users[2].id, self.users[3].id]
+
+        response = self.client.post(url, {'members': new_ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'added': new_ids[1:], 'removed': []})
+        self.assertEqual(self.member_ids(), [user.id for user in self.users])
+
+    def test_remove_members(self):
+        url = reverse('board-members-remove', kwargs={'pk': self.board.pk})
+
+        response = self.client.post(
+            url, {'members': [self.users[0].id, self.users[3].id]}, format='json'
+        )
+
+        self.assertEqual(response.data, {'added': [], 'removed': [self.users[0].id]})
+        self.assertEqual(self.member_ids(), [self.users[1].id])
+
+    def test_owner_cannot_be_removed(self):
+        self.assertEqual(set_members(self.board, []), ([], [u.id for u in self.users[:2]]))
+        url = reverse('board-members-remove', kwargs={'pk': self.board.pk})
+
+        response = self.client.post(url, {'members': [self.owner.id]}, format='json')
+
+        self.assertEqual(response.data, {'added': [], 'removed': []})
+        self.assertEqual(self.member_ids(), [])
+        self.assertTrue(self.board.memberships.filter(user=self.owner).exists())
+
+    def test_member_endpoints_validate_input(self):
+        url = reverse('board-members-add', kwargs={'pk': self.board.pk})
+
+        response = self.client.post(url, {'members': [self.users[3].id, 9999]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('9999', str(response.data['members']))
+        self.assertNotIn(self.users[3].id, self.member_ids())
+
+        response = self.client.post(url, {'members': []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_member_endpoints_permissions(self):
+        url = reverse('board-members-add', kwargs={'pk': self.board.pk})
+
+        self.client.force_authenticate(user=self.users[0])
+        response = self.client.post(url, {'members': [self.users[3].id]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=self.users[2])
+        response = self.client.post(url, {'members': [self.users[2].id]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
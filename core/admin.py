@@ -0,0 +1,133 @@
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.utils import get_fields_from_path
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Max, Q
+from django.utils.functional import cached_property
+
+
+INTEGER_PK_TYPES = ('AutoField', 'BigAutoField', 'SmallAutoField', 'BigIntegerField', 'IntegerField')
+
+
+def estimate_row_count(model, using):
+    """
+    Return an estimate of the number of rows in model's table, or None.
+
+    - PostgreSQL and MySQL answer from their table statistics; other
+      databases use the highest integer primary key, one index lookup.
+    - Estimates are off by the rows deleted (or, on PostgreSQL and MySQL,
+      written since the last ANALYZE), which is fine for page links.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)',
+                [connection.ops.quote_name(table)],
+            )
+            row = cursor.fetchone()
+        return row[0] if row and row[0] >= 0 else None
+    if connection.vendor == 'mysql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT table_rows FROM information_schema.tables '
+                'WHERE table_schema = DATABASE() AND table_name = %s',
+                [table],
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+    if model._meta.pk.get_internal_type() in INTEGER_PK_TYPES:
+        return model._base_manager.using(using).aggregate(highest=Max('pk'))['highest'] or 0
+    return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that never counts a whole large table.
+
+    - Up to ADMIN_COUNT_LIMIT rows are counted exactly.
+    - Beyond that, an unfiltered list uses estimate_row_count(), and a
+      filtered or searched list stops counting at the limit, so only its
+      first ADMIN_COUNT_LIMIT rows can be paged to.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        limit = settings.ADMIN_COUNT_LIMIT
+        if not queryset.query.has_filters():
+            estimate = estimate_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate > limit:
+                return estimate
+        return queryset.order_by()[:limit].count()
+
+
+class SelectedRelatedFilter(admin.RelatedFieldListFilter):
+    """
+    Foreign key filter that does not load the related table.
+
+    - The sidebar lists only the selected object instead of every row of
+      the related model, and is hidden while nothing is selected.
+    - Selected through the URL (?board__id__exact=<id>), e.g. from a link on
+      the related object's changelist.
+    """
+
+    def has_output(self):
+        return bool(self.lookup_val or self.lookup_val_isnull)
+
+    def field_choices(self, field, request, model_admin):
+        if not self.lookup_val:
+            return []
+        try:
+            return field.get_choices(include_blank=False, limit_choices_to={'pk__in': self.lookup_val})
+        except (ValidationError, ValueError):
+            return []
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    ModelAdmin for tables with millions of rows.
+
+    - Pages are counted with EstimatedCountPaginator, the unfiltered total
+      is not counted next to filtered results, and filters do not count
+      their choices (facets).
+    - search_fields only allow index friendly lookups, matched against the
+      whole search term:
+      * '=field': exact match; skipped when the term is not a valid value
+        (e.g. letters for an id).
+      * '^field' (or a plain name): case sensitive prefix match, written
+        as a range (field >= term AND field < term + U+10FFFF) so an
+        index on field is used instead of a LIKE scan.
+    - Subclasses should set list_select_related for the foreign keys in
+      list_display, autocomplete_fields for foreign key widgets, and
+      SelectedRelatedFilter for foreign key filters.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    show_facets = admin.ShowFacets.NEVER
+    list_per_page = 50
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        condition = Q()
+        for name in self.get_search_fields(request):
+            if name.startswith('='):
+                path = name[1:]
+                field = get_fields_from_path(self.model, path)[-1]
+                target = getattr(field, 'target_field', field)
+                try:
+                    value = target.to_python(term)
+                except ValidationError:
+                    continue
+                condition |= Q(**{path: value})
+            else:
+                path = name.lstrip('^')
+                condition |= Q(**{f'{path}__gte': term, f'{path}__lt': term + '\U0010ffff'})
+        if not condition:
+            return queryset.none(), False
+        return queryset.filter(condition), False
@@ -0,0 +1,92 @@
+from django.http import JsonResponse
+from django.views import View
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ValidationError
+
+from core.sharding import parse_key, shard_for, use_shard
+
+
+NOT_AUTHENTICATED = 'Authentication credentials were not provided.'
+INVALID_TOKEN = 'Invalid token.'
+PERMISSION_DENIED = 'You do not have permission to perform this action.'
+NOT_FOUND = 'Not found.'
+
+
+async def fetch_all(queryset):
+    """Evaluate a queryset with the async ORM and return a list."""
+    return [obj async for obj in queryset]
+
+
+def set_prefetched(instance, name, objects):
+    """
+    Store objects as the prefetched result of a related manager.
+
+    - Lets serializers read instance.<name>.all() without a query after the
+      related rows were fetched separately (e.g. concurrently).
+    """
+    queryset = getattr(instance, name).all()
+    queryset._result_cache = list(objects)
+    queryset._prefetch_done = True
+    if not hasattr(instance, '_prefetched_objects_cache'):
+        instance._prefetched_objects_cache = {}
+    instance._prefetched_objects_cache[name] = queryset
+
+
+def error_response(detail, status):
+    response = JsonResponse({'detail': detail}, status=status)
+    if status == 401:
+        response['WWW-Authenticate'] = 'Token'
+    return response
+
+
+async def authenticate(request):
+    """
+    Resolve the user of an "Authorization: Token <key>" header.
+
+    - Returns (user, None) on success, or (None, error response).
+    """
+    header = request.headers.get('Authorization', '').split()
+    if len(header) != 2 or header[0].lower() != 'token':
+        return None, error_response(NOT_AUTHENTICATED, 401)
+
+    try:
+        token = await Token.objects.select_related('user').aget(key=header[1])
+    except Token.DoesNotExist:
+        return None, error_response(INVALID_TOKEN, 401)
+    if not token.user.is_active:
+        return None, error_response('User inactive or deleted.', 401)
+    return token.user, None
+
+
+class AsyncAPIView(View):
+    """
+    Base class for async, read-only API views.
+
+    - Authenticates token requests with a single async query (the same
+      "Authorization: Token <key>" header the DRF views accept).
+    - Handlers are async, so under ASGI the request never occupies a
+      worker thread while waiting on the database.
+    - Handlers return JsonResponse objects with DRF-compatible payloads.
+    - A ValidationError (e.g. an unknown ?fields= name) becomes a 400
+      response with its detail, as in DRF.
+    - shard_key(request, **kwargs) names the board or task whose shard the
+      handler runs on (core.sharding.ShardSelectionMixin).
+    """
+    http_method_names = ['get', 'head', 'options']
+
+    def shard_key(self, request, **kwargs):
+        return None
+
+    async def dispatch(self, request, *args, **kwargs):
+        user, error = await authenticate(request)
+        if error is not None:
+            return error
+        request.user = user
+        with use_shard(shard_for(parse_key(self.shard_key(request, **kwargs)))):
+            try:
+                return await super().dispatch(request, *args, **kwargs)
+            except ValidationError as exc:
+                return JsonResponse(exc.detail, status=400, safe=False)
+
+    def render(self, data):
+        return JsonResponse(data, safe=False)
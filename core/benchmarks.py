@@ -0,0 +1,501 @@
+import asyncio
+import logging
+import math
+import statistics
+import threading
+import time
+from collections import Counter, namedtuple
+
+from django.conf import settings
+from django.db import connection, connections, models, transaction
+from django.test import AsyncClient, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.api.serializers import MemberSerializer
+from boards_app.api.serializers import BoardDetailSerializer
+from boards_app.models import Board
+from core.datasets import DATASET_EMAIL_DOMAIN, DATASET_PASSWORD
+from core.middleware import QueryStats
+from core.serializers import clear_field_cache
+from core.throttling import reset_throttles
+from jobs_app.models import Job
+from task_app.api.serializers import TaskReadSerializer
+from task_app.models import ArchivedTask, Comment, Task
+
+
+Scenario = namedtuple('Scenario', ['route', 'method', 'url', 'data'])
+DatasetObjects = namedtuple(
+    'DatasetObjects', ['user', 'board', 'task', 'comment', 'archived_task', 'job']
+)
+
+# Routes that are not part of the KanMind API surface.
+IGNORED_ROUTES = {'api-root'}
+
+
+def api_route_names():
+    """
+    Return the names of all routes mounted below /api/ in core/urls.py.
+
+    - Format-suffix variants share the name of their route; the router
+      root view is skipped.
+    """
+    names = set()
+
+    def walk(patterns, prefix):
+        for pattern in patterns:
+            route = prefix + str(pattern.pattern)
+            if isinstance(pattern, URLResolver):
+                walk(pattern.url_patterns, route)
+            elif isinstance(pattern, URLPattern) and pattern.name:
+                if route.startswith('api/') and pattern.name not in IGNORED_ROUTES:
+                    names.add(pattern.name)
+
+    walk(get_resolver().url_patterns, '')
+    return names
+
+
+def select_dataset_objects():
+    """
+    Pick the objects of the generated dataset that scenarios run against.
+
+    - Returns DatasetObjects(user, board, task, comment, archived_task, job)
+      where the user owns the board and wrote the comment, or None if no
+      dataset has been generated. archived_task is an archived task of the
+      board and job a job of the user, or None if there is none.
+    """
+    comment = (
+        Comment.objects
+        .filter(
+            author__email__endswith=f'@{DATASET_EMAIL_DOMAIN}',
+            task__board__owner=models.F('author'),
+        )
+        .select_related('author', 'task__board')
+        .order_by('id')
+        .first()
+    )
+    if comment is None:
+        return None
+    board = comment.task.board
+    archived_task = ArchivedTask.objects.filter(board=board).order_by('id').first()
+    job = Job.objects.filter(created_by=comment.author).order_by('id').first()
+    return DatasetObjects(comment.author, board, comment.task, comment, archived_task, job)
+
+
+def build_scenarios(user, board, task, comment, archived_task=None, job=None):
+    """
+    Build one request scenario per API route and method.
+
+    - Read scenarios hit the given board, task and comment.
+    - Write scenarios are meant to run inside a rolled-back transaction.
+    - The archive and job status scenarios are skipped without an
+      archived_task or job.
+    """
+    board_url = reverse('board-detail', kwargs={'pk': board.pk})
+    task_url = reverse('task-detail', kwargs={'pk': task.pk})
+    comments_url = reverse('task-comments-list', kwargs={'task_pk': task.pk})
+    comment_url = reverse(
+        'task-comments-detail',
+        kwargs={'task_pk': task.pk, 'pk': comment.pk}
+    )
+    return [
+        Scenario('registration', 'post', reverse('registration'), {
+            'fullname': 'Benchmark User',
+            'email': 'new-benchmark-user@kanmind.test',
+            'password': DATASET_PASSWORD,
+            'repeated_password': DATASET_PASSWORD,
+        }),
+        Scenario('login', 'post', reverse('login'), {
+            'email': user.email,
+            'password': DATASET_PASSWORD,
+        }),
+        Scenario('email-check', 'get', reverse('email-check'), {
+            'email': user.email,
+        }),
+        Scenario('user-provisioning', 'post', reverse('user-provisioning'), {
+            'users': [{
+                'fullname': 'Provisioned User',
+                'email': 'provisioned-benchmark-user@kanmind.test',
+                'password': DATASET_PASSWORD,
+                'boards': [board.pk],
+            }],
+        }),
+        Scenario('board-list', 'get', reverse('board-list'), None),
+        Scenario('board-list', 'post', reverse('board-list'), {
+            'title': 'Benchmark Board',
+            'members': [user.pk],
+        }),
+        Scenario('board-detail', 'get', board_url, None),
+        Scenario('board-detail', 'patch', board_url, {'title': board.title}),
+        Scenario('board-detail', 'delete', board_url, None),
+        Scenario('board-columns', 'get',
+                 reverse('board-columns', kwargs={'pk': board.pk}), None),
+        Scenario('board-column', 'get',
+                 reverse('board-column', kwargs={'pk': board.pk, 'column': 'to-do'}), None),
+        Scenario('board-export', 'post',
+                 reverse('board-export', kwargs={'pk': board.pk}), None),
+        Scenario('board-members-add', 'post',
+                 reverse('board-members-add', kwargs={'pk': board.pk}), {'members': [user.pk]}),
+        Scenario('board-members-remove', 'post',
+                 reverse('board-members-remove', kwargs={'pk': board.pk}), {'members': [user.pk]}),
+        Scenario('task-list', 'get', reverse('task-list'), None),
+        Scenario('task-list', 'post', reverse('task-list'), {
+            'board': board.pk,
+            'title': 'Benchmark Task',
+            'assignee_id': user.pk,
+        }),
+        Scenario('task-detail', 'get', task_url, None),
+        Scenario('task-detail', 'patch', task_url, {'status': 'review'}),
+        Scenario('task-detail', 'delete', task_url, None),
+        Scenario('task-assigned-to-me', 'get', reverse('task-assigned-to-me'), None),
+        Scenario('task-reviewing', 'get', reverse('task-reviewing'), None),
+        Scenario('task-my-tasks', 'get', reverse('task-my-tasks'), None),
+        Scenario('dashboard', 'get', reverse('dashboard'), None),
+        Scenario('task-comments-list', 'get', comments_url, None),
+        Scenario('task-comments-list', 'post', comments_url, {
+            'content': 'Benchmark comment',
+        }),
+        Scenario('task-comments-detail', 'get', comment_url, None),
+        Scenario('task-comments-detail', 'delete', comment_url, None),
+    ] + (
+        build_archive_scenarios(archived_task)
+        + build_job_scenarios(job)
+        + build_async_scenarios(board, task)
+    )
+
+
+def build_archive_scenarios(archived_task):
+    """Build the scenarios of the task archive routes."""
+    if archived_task is None:
+        return []
+    return [
+        Scenario('archived-task-list', 'get', reverse('archived-task-list'), {
+            'board': archived_task.board_id,
+        }),
+        Scenario('archived-task-detail', 'get',
+                 reverse('archived-task-detail', kwargs={'pk': archived_task.pk}), None),
+        Scenario('archived-task-restore', 'post',
+                 reverse('archived-task-restore', kwargs={'pk': archived_task.pk}), None),
+    ]
+
+
+def build_job_scenarios(job):
+    """Build the scenarios of the job status routes."""
+    if job is None:
+        return []
+    return [
+        Scenario('job-list', 'get', reverse('job-list'), None),
+        Scenario('job-detail', 'get', reverse('job-detail', kwargs={'pk': job.pk}), None),
+    ]
+
+
+def build_async_scenarios(board, task):
+    """Build the scenarios of the async read views."""
+    return [
+        Scenario('async-board-list', 'get', reverse('async-board-list'), None),
+        Scenario('async-board-detail', 'get',
+                 reverse('async-board-detail', kwargs={'pk': board.pk}), None),
+        Scenario('async-task-list', 'get', reverse('async-task-list'), None),
+        Scenario('async-task-assigned-to-me', 'get',
+                 reverse('async-task-assigned-to-me'), None),
+        Scenario('async-task-reviewing', 'get', reverse('async-task-reviewing'), None),
+        Scenario('async-task-comments-list', 'get',
+                 reverse('async-task-comments-list', kwargs={'task_pk': task.pk}), None),
+    ]
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class Rollback(Exception):
+    pass
+
+
+def run_scenario(client, scenario):
+    """
+    Run a scenario once and return (response, seconds, query count).
+
+    - Writes are executed inside a transaction that is always rolled back,
+      so the dataset stays unchanged between iterations.
+    """
+    request = getattr(client, scenario.method)
+    query_stats = QueryStats()
+    with connection.execute_wrapper(query_stats):
+        start = time.perf_counter()
+        if scenario.method == 'get':
+            response = request(scenario.url, scenario.data)
+        else:
+            try:
+                with transaction.atomic():
+                    response = request(scenario.url, scenario.data, format='json')
+                    raise Rollback
+            except Rollback:
+                pass
+        elapsed = time.perf_counter() - start
+    return response, elapsed, query_stats.count
+
+
+def get_host():
+    hosts = [host for host in settings.ALLOWED_HOSTS if host != '*']
+    return hosts[0].lstrip('.') if hosts else 'localhost'
+
+
+def get_client(user, staff=False):
+    """
+    Return an API client authenticated with the user's token.
+
+    - staff=True makes the user a staff user first, for scenarios of
+      staff-only routes (bulk provisioning).
+    """
+    if staff and not user.is_staff:
+        user.is_staff = True
+        user.save(update_fields=['is_staff'])
+    token, _ = Token.objects.get_or_create(user=user)
+    client = APIClient(HTTP_HOST=get_host())
+    client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+    return client
+
+
+@override_settings(THROTTLE_ENABLED=False)
+def benchmark(scenarios, client, iterations=20, warmup=2):
+    """
+    Time every scenario and summarize latency and query counts.
+
+    - Returns {"<route> <METHOD>": {...}} with p50/p95/p99/mean latency in
+      milliseconds, the query count of the last run and its status code.
+    - Login and registration throttling is off, so repeated iterations
+      measure the views rather than 429 responses.
+    """
+    results = {}
+    for scenario in scenarios:
+        for _ in range(warmup):
+            run_scenario(client, scenario)
+
+        timings = []
+        for _ in range(iterations):
+            response, elapsed, queries = run_scenario(client, scenario)
+            timings.append(elapsed * 1000)
+
+        results[f'{scenario.route} {scenario.method.upper()}'] = {
+            'route': scenario.route,
+            'method': scenario.method.upper(),
+            'status': response.status_code,
+            'iterations': iterations,
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'mean_ms': round(statistics.fmean(timings), 3),
+            'queries': queries,
+        }
+    return results
+
+
+async def measure_throughput(client, url, headers, requests, concurrency):
+    """
+    Send requests GETs to url with at most concurrency in flight.
+
+    - Returns throughput (requests per second), latency percentiles and
+      the number of non-2xx responses.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = []
+    errors = 0
+
+    async def send():
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(url, headers=headers)
+            timings.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 300:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'rps': round(requests / elapsed, 1),
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p99_ms': round(percentile(timings, 99), 3),
+        'errors': errors,
+    }
+
+
+def compare_sync_async(user, board, task, comment, archived_task=None, job=None,
+                       requests=200, concurrency=50):
+    """
+    Compare the sync DRF read views with their async variants under ASGI.
+
+    - Both variants go through the full ASGI stack (AsyncClient), so the
+      sync views pay for the sync-to-async thread bridge.
+    - Returns {"<route>": {"sync": {...}, "async": {...}}}.
+    """
+    token, _ = Token.objects.get_or_create(user=user)
+    sync_urls = {
+        scenario.route: scenario.url
+        for scenario in build_scenarios(user, board, task, comment, archived_task)
+        if scenario.method == 'get'
+    }
+
+    headers = {'Authorization': f'Token {token.key}'}
+
+    async def run():
+        client = AsyncClient()
+        results = {}
+        for scenario in build_async_scenarios(board, task):
+            route = scenario.route.removeprefix('async-')
+            results[route] = {
+                'sync': await measure_throughput(
+                    client, sync_urls[route], headers, requests, concurrency),
+                'async': await measure_throughput(
+                    client, scenario.url, headers, requests, concurrency),
+            }
+        return results
+
+    # AsyncClient always sends "Host: testserver".
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+        return asyncio.run(run())
+
+
+def flood_logins(email, stop_at, interval, addresses, statuses, lock):
+    """
+    Send failed logins for email every interval seconds until stop_at.
+
+    - Requests rotate over the client addresses; response status codes
+      are counted in statuses.
+    """
+    client = APIClient(HTTP_HOST=get_host())
+    url = reverse('login')
+    data = {'email': email, 'password': 'not-the-password'}
+    next_at = time.perf_counter()
+    sent = 0
+    try:
+        while (now := time.perf_counter()) < stop_at:
+            if now < next_at:
+                time.sleep(min(next_at - now, stop_at - now))
+                continue
+            response = client.post(
+                url, data, format='json', REMOTE_ADDR=addresses[sent % len(addresses)])
+            sent += 1
+            next_at += interval
+            with lock:
+                statuses[response.status_code] += 1
+    finally:
+        connections.close_all()
+
+
+def probe_latency(client, url, stop_at):
+    """GET url back to back until stop_at; return the latencies in ms."""
+    timings = []
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        response = client.get(url)
+        timings.append((time.perf_counter() - start) * 1000)
+        if response.status_code >= 300:
+            raise RuntimeError(f'Probe request failed with {response.status_code}')
+    return timings
+
+
+def measure_login_flood(user, duration=5.0, rate=100, threads=4, addresses=1,
+                        modes=(True, False)):
+    """
+    Measure authenticated API latency while login is flooded.
+
+    - The probe is GET /api/boards/ as user, requested back to back. It
+      runs alone first (baseline), then while threads threads send rate
+      failed logins per second for user's email (password hashing
+      included), once per throttling mode in modes.
+    - Flood requests rotate over addresses client IPs.
+    - Returns {"<phase>": {"probes", "p50_ms", "p95_ms", "p99_ms",
+      "flood": {status: count}}}.
+    """
+    client = get_client(user)
+    url = reverse('board-list')
+    ips = [f'198.51.100.{index % 250 + 1}' for index in range(addresses)]
+
+    def summarize(timings, statuses):
+        return {
+            'probes': len(timings),
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'flood': dict(sorted(statuses.items())),
+        }
+
+    results = {'baseline': summarize(
+        probe_latency(client, url, time.perf_counter() + duration), Counter())}
+    # Every rejected login would log a warning.
+    request_logger = logging.getLogger('django.request')
+    level = request_logger.level
+    request_logger.setLevel(logging.ERROR)
+    try:
+        for throttled in modes:
+            with override_settings(THROTTLE_ENABLED=throttled):
+                reset_throttles()
+                statuses, lock = Counter(), threading.Lock()
+                stop_at = time.perf_counter() + duration
+                flooders = [
+                    threading.Thread(
+                        target=flood_logins,
+                        args=(user.email, stop_at, threads / rate, ips, statuses, lock),
+                    )
+                    for _ in range(threads)
+                ]
+                for flooder in flooders:
+                    flooder.start()
+                timings = probe_latency(client, url, stop_at)
+                for flooder in flooders:
+                    flooder.join()
+            phase = 'flood, throttled' if throttled else 'flood, unthrottled'
+            results[phase] = summarize(timings, statuses)
+    finally:
+        request_logger.setLevel(level)
+    return results
+
+
+def time_per_call(func, iterations):
+    """Return the mean microseconds per call of func over iterations calls."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def measure_serializers(board, task, iterations=500):
+    """
+    Time serializer construction and rendering with and without the field cache.
+
+    - construct: creating the serializer and building its fields; render:
+      creating it and producing .data, nested serializers included.
+    - board and task are loaded with their serializers' eager loading
+      first, so the timings contain no queries.
+    - Returns {"<serializer>": {"construct_us" | "render_us":
+      {"uncached": ..., "cached": ...}}} in microseconds per call.
+    """
+    task = TaskReadSerializer.setup_eager_loading(Task.objects.filter(pk=task.pk)).get()
+    board = BoardDetailSerializer.setup_eager_loading(Board.objects.filter(pk=board.pk)).get()
+    cases = {
+        'MemberSerializer': (MemberSerializer, board.owner),
+        'TaskReadSerializer': (TaskReadSerializer, task),
+        'BoardDetailSerializer': (BoardDetailSerializer, board),
+    }
+
+    results = {}
+    for name, (serializer_class, instance) in cases.items():
+        row = results[name] = {'construct_us': {}, 'render_us': {}}
+        for mode, enabled in (('uncached', False), ('cached', True)):
+            clear_field_cache()
+            with override_settings(SERIALIZER_FIELD_CACHE=enabled):
+                serializer_class(instance).data
+                row['construct_us'][mode] = round(time_per_call(
+                    lambda: serializer_class(instance).fields, iterations), 1)
+                row['render_us'][mode] = round(time_per_call(
+                    lambda: serializer_class(instance).data, iterations), 1)
+    return results
@@ -0,0 +1,130 @@
+from django.conf import settings
+from django.db import models
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class VersionConflict(Exception):
+    """Raised by VersionedModel.save() when the row changed since it was read."""
+
+
+class VersionedModel(models.Model):
+    """
+    Abstract model with optimistic concurrency control.
+
+    - version starts at 1 and every save() of an existing row increments it.
+    - The UPDATE is conditional on the version the instance was read with
+      (WHERE id = ... AND version = ...). A save based on stale data
+      matches no row and raises VersionConflict instead of overwriting the
+      newer row; no row locks are taken beforehand.
+    - A row deleted in the meantime also raises VersionConflict, instead
+      of being inserted again.
+    - Like an IntegrityError, the conflict breaks an enclosing atomic
+      block; callers that handle it inside one need a savepoint.
+    - QuerySet.update() (e.g. Board.touch()) leaves version unchanged.
+    """
+    version = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'version'}
+        super().save(*args, **kwargs)
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        if self._state.adding:
+            return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
+        expected = self.version
+        values = [
+            (field, model, expected + 1 if field.attname == 'version' else value)
+            for field, model, value in values
+        ]
+        if not super()._do_update(
+            base_qs.filter(version=expected), using, pk_val, values, update_fields, forced_update
+        ):
+            raise VersionConflict(f'{self._meta.label} {pk_val} is no longer at version {expected}.')
+        self.version = expected + 1
+        return True
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'The resource was changed by someone else; fetch it again and retry.'
+    default_code = 'precondition_failed'
+
+
+class PreconditionRequired(APIException):
+    status_code = status.HTTP_428_PRECONDITION_REQUIRED
+    default_detail = 'Send an If-Match header with the version of the resource.'
+    default_code = 'precondition_required'
+
+
+def version_etag(version, suffix=''):
+    """
+    Return the strong entity tag of an object at version.
+
+    - "<version>", or "<version>.<suffix>" for one representation of it
+      (core.conditional); If-Match only compares the version part, so
+      every tag issued for the object can be sent back.
+    """
+    return f'"{version}.{suffix}"' if suffix else f'"{version}"'
+
+
+def parse_if_match(header):
+    """
+    Return the versions listed in an If-Match header, or None for '*'.
+
+    - Versions are strong entity tags from version_etag() ("3" or
+      "3.<suffix>"); unquoted numbers are accepted as well. Weak tags
+      (W/"...") never match, as for any If-Match.
+    """
+    versions = set()
+    for tag in header.split(','):
+        tag = tag.strip()
+        if tag == '*':
+            return None
+        if tag.startswith('W/'):
+            continue
+        tag = tag.strip('"').split('.', 1)[0]
+        if tag.isdigit():
+            versions.add(int(tag))
+    return versions
+
+
+class VersionedUpdateMixin:
+    """
+    ViewSet mixin applying If-Match to update and partial_update.
+
+    - If-Match: "<version>" must name the current version of the object,
+      otherwise the request fails with 412 Precondition Failed and nothing
+      is written. The version is part of the object's representation, and
+      the ETag of its detail GET (core.conditional) and of update
+      responses (version_etag()) carry it as well.
+    - A write racing another one between the check and the UPDATE fails
+      with 412 as well (VersionedModel).
+    - Without If-Match the update is applied to the version just read, or
+      rejected with 428 when REQUIRE_IF_MATCH is set.
+    """
+
+    def update(self, request, *args, **kwargs):
+        response = super().update(request, *args, **kwargs)
+        response['ETag'] = version_etag(self.updated_version)
+        return response
+
+    def perform_update(self, serializer):
+        header = self.request.headers.get('If-Match')
+        if header is None:
+            if settings.REQUIRE_IF_MATCH:
+                raise PreconditionRequired()
+        else:
+            versions = parse_if_match(header)
+            if versions is not None and serializer.instance.version not in versions:
+                raise PreconditionFailed()
+        try:
+            super().perform_update(serializer)
+        except VersionConflict:
+            raise PreconditionFailed() from None
+        self.updated_version = serializer.instance.version
@@ -0,0 +1,85 @@
+import hashlib
+from functools import wraps
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+from core.concurrency import version_etag
+
+
+def make_etag(request, last_modified, tag='', version=None):
+    """
+    Return an ETag for the response to request at version last_modified.
+
+    - The user, the full path (query parameters such as ?fields=) and the
+      negotiated media type are part of it, since they change the payload.
+    - Weak, unless version (of a VersionedModel object) is given: then the
+      strong "<version>.<digest>" of core.concurrency.version_etag(), which
+      If-Match accepts for updates of the object.
+    """
+    parts = [
+        str(getattr(request.user, 'pk', '')),
+        request.get_full_path(),
+        getattr(request, 'accepted_media_type', '') or '',
+        last_modified.isoformat() if last_modified else '',
+        str(tag),
+    ]
+    digest = hashlib.md5('|'.join(parts).encode(), usedforsecurity=False).hexdigest()
+    if version is not None:
+        return version_etag(version, digest)
+    return f'W/"{digest}"'
+
+
+def queryset_version(queryset, field):
+    """
+    Return (latest value of field, number of rows) of queryset.
+
+    - One aggregate query; the pair changes whenever a row is written
+      (if writes update field), added or removed.
+    """
+    state = queryset.aggregate(last_modified=Max(field), count=Count('pk', distinct=True))
+    return state['last_modified'], state['count']
+
+
+def conditional(version, last_modified=True):
+    """
+    Decorator answering If-None-Match / If-Modified-Since on view handlers.
+
+    - version names a view method called with the handler's arguments. It
+      returns (last_modified, tag) with a datetime (or None) and any
+      value that changes with the response (e.g. a row count), or None to
+      skip the check (unknown object, no permission); the handler then
+      produces the regular error. Detail views of a VersionedModel add
+      the object's version: (last_modified, tag, version), see make_etag().
+    - The check runs before the handler, so an unchanged resource costs
+      only the version query and is answered with 304 Not Modified.
+    - Successful responses carry ETag and Last-Modified headers.
+    - Last-Modified has one second resolution; clients should prefer the
+      ETag, which If-None-Match compares exactly.
+    - last_modified=False sends no Last-Modified and ignores
+      If-Modified-Since; lists versioned by the latest timestamp of a set
+      of rows need it, since the timestamp goes back when the newest row
+      leaves the set.
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(view, request, *args, **kwargs):
+            state = getattr(view, version)(request, *args, **kwargs)
+            if state is None:
+                return handler(view, request, *args, **kwargs)
+
+            modified, tag, *object_version = state
+            etag = make_etag(request, modified, tag, *object_version)
+            timestamp = int(modified.timestamp()) if modified and last_modified else None
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = handler(view, request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response['ETag'] = etag
+                if timestamp is not None:
+                    response['Last-Modified'] = http_date(timestamp)
+                patch_vary_headers(response, ['Accept', 'Authorization'])
+            return response
+        return wrapper
+    return decorator
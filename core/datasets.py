@@ -0,0 +1,229 @@
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils import timezone
+
+from auth_app.models import User
+from boards_app.models import Board, BoardMembership
+from core.deletion import chunked_delete_copied
+from jobs_app.models import Job
+from task_app.archive import archive_tasks
+from task_app.models import Comment, Task
+
+
+DATASET_EMAIL_DOMAIN = 'bench.kanmind.test'
+DATASET_PASSWORD = 'benchmark-password'
+
+STATUS_WEIGHTS = {
+    'to-do': 30,
+    'in-progress': 20,
+    'review': 10,
+    'done': 40,
+}
+PRIORITY_WEIGHTS = {
+    'low': 30,
+    'medium': 50,
+    'high': 20,
+}
+
+
+def dataset_email(index):
+    return f'user{index:06d}@{DATASET_EMAIL_DOMAIN}'
+
+
+def flush_dataset():
+    """
+    Delete all users created by generate_dataset and their data.
+
+    - Uses chunked deletes, so flushing a large dataset keeps memory and
+      lock times bounded; with sharding the users' board data on every
+      shard goes too. Returns the counts of chunked_delete_copied().
+    """
+    users = User.objects.filter(email__endswith=f'@{DATASET_EMAIL_DOMAIN}')
+    Job.objects.filter(created_by__in=users).delete()
+    return chunked_delete_copied(users)
+
+
+def generate_dataset(
+    users=100,
+    boards=10,
+    members_per_board=10,
+    tasks_per_board=100,
+    comments_per_task=2,
+    archived_tasks_per_board=0,
+    seed=42,
+    batch_size=1000,
+    stdout=None,
+):
+    """
+    Generate a reproducible synthetic dataset with bulk inserts.
+
+    - The same seed produces the same users, boards, tasks and comments.
+    - Users get emails on DATASET_EMAIL_DOMAIN and share one password hash
+      (DATASET_PASSWORD), so the dataset can be flushed and logged into.
+    - Every board gets an owner (with its owner membership row) plus
+      members_per_board other members.
+    - Task status and priority follow STATUS_WEIGHTS and PRIORITY_WEIGHTS;
+      assignees, reviewers and comment authors are board members.
+    - Done tasks are completed within the last TASK_ARCHIVE_AFTER_DAYS
+      days; archived_tasks_per_board older done tasks (with comments) are
+      created on top and moved to the archive tables.
+    - Comment counts per task vary around comments_per_task; every board
+      has at least one comment written by its owner on a hot task.
+    - Every board owner has a finished export_board job for the board.
+    - Returns a dict with the number of created rows per model.
+    - Writes one database only, so it refuses to run with DATABASE_SHARDS.
+    """
+    if settings.DATABASE_SHARDS:
+        raise ImproperlyConfigured('generate_dataset does not support DATABASE_SHARDS.')
+    rng = random.Random(seed)
+    now = timezone.now()
+    today = timezone.localdate()
+    archive_after = settings.TASK_ARCHIVE_AFTER_DAYS
+    password = make_password(DATASET_PASSWORD)
+
+    def log(message):
+        if stdout is not None:
+            stdout.write(message)
+
+    with transaction.atomic():
+        User.objects.bulk_create(
+            [
+                User(
+                    username=dataset_email(index),
+                    email=dataset_email(index),
+                    fullname=f'Bench User {index}',
+                    password=password,
+                )
+                for index in range(users)
+            ],
+            batch_size=batch_size,
+        )
+        user_ids = list(
+            User.objects
+            .filter(email__endswith=f'@{DATASET_EMAIL_DOMAIN}')
+            .order_by('email')
+            .values_list('id', flat=True)
+        )
+        log(f'Created {len(user_ids)} users')
+
+        board_owners = [rng.choice(user_ids) for _ in range(boards)]
+        created_boards = Board.objects.bulk_create(
+            [
+                Board(title=f'Bench Board {index}', owner_id=owner_id)
+                for index, owner_id in enumerate(board_owners)
+            ],
+            batch_size=batch_size,
+        )
+
+        board_members = {}
+        memberships = []
+        for board in created_boards:
+            candidates = [uid for uid in user_ids if uid != board.owner_id]
+            members = rng.sample(candidates, min(members_per_board, len(candidates)))
+            board_members[board.id] = [board.owner_id] + members
+            memberships.append(BoardMembership(
+                board_id=board.id, user_id=board.owner_id, role=BoardMembership.OWNER))
+            memberships.extend(
+                BoardMembership(board_id=board.id, user_id=user_id)
+                for user_id in members
+            )
+        BoardMembership.objects.bulk_create(memberships, batch_size=batch_size)
+        log(f'Created {len(created_boards)} boards with {len(memberships)} memberships')
+
+        statuses = list(STATUS_WEIGHTS)
+        status_weights = list(STATUS_WEIGHTS.values())
+        priorities = list(PRIORITY_WEIGHTS)
+        priority_weights = list(PRIORITY_WEIGHTS.values())
+
+        tasks = []
+        for board in created_boards:
+            people = board_members[board.id]
+            for index in range(tasks_per_board + archived_tasks_per_board):
+                archived = index >= tasks_per_board
+                status = 'done' if archived else rng.choices(statuses, status_weights)[0]
+                completed_at = None
+                if archived:
+                    completed_at = now - timedelta(days=archive_after + rng.randint(1, 365))
+                elif status == 'done':
+                    completed_at = now - timedelta(hours=rng.randint(0, archive_after * 24 - 1))
+                due_date = None
+                if rng.random() < 0.7:
+                    due_date = today + timedelta(days=rng.randint(-30, 60))
+                tasks.append(Task(
+                    title=f'Task {index} on board {board.id}',
+                    description=f'Synthetic task {index}',
+                    board_id=board.id,
+                    status=status,
+                    priority=rng.choices(priorities, priority_weights)[0],
+                    assignee_id=rng.choice(people) if rng.random() < 0.8 else None,
+                    reviewer_id=rng.choice(people) if rng.random() < 0.5 else None,
+                    created_by_id=rng.choice(people),
+                    due_date=due_date,
+                    completed_at=completed_at,
+                ))
+        tasks = Task.objects.bulk_create(tasks, batch_size=batch_size)
+        archived_ids = {
+            task.id for task in tasks
+            if task.completed_at is not None
+            and task.completed_at < now - timedelta(days=archive_after)
+        }
+        log(f'Created {len(tasks) - len(archived_ids)} tasks')
+
+        comments = []
+        boards_with_owner_comment = set()
+        for task in tasks:
+            people = board_members[task.board_id]
+            for index in range(rng.randint(0, comments_per_task * 2)):
+                comments.append(Comment(
+                    task_id=task.id,
+                    author_id=rng.choice(people),
+                    text=f'Synthetic comment {index}',
+                ))
+            if comments_per_task and task.board_id not in boards_with_owner_comment:
+                boards_with_owner_comment.add(task.board_id)
+                comments.append(Comment(
+                    task_id=task.id,
+                    author_id=people[0],
+                    text='Synthetic owner comment',
+                ))
+        Comment.objects.bulk_create(comments, batch_size=batch_size)
+        archived_comments = sum(1 for comment in comments if comment.task_id in archived_ids)
+        log(f'Created {len(comments) - archived_comments} comments')
+
+        archived_list = sorted(archived_ids)
+        for start in range(0, len(archived_list), batch_size):
+            archive_tasks(archived_list[start:start + batch_size], batch_size)
+        log(f'Archived {len(archived_ids)} tasks with {archived_comments} comments')
+
+        jobs = Job.objects.bulk_create(
+            [
+                Job(
+                    name='export_board',
+                    payload={'board_id': board.id},
+                    status=Job.SUCCEEDED,
+                    attempts=1,
+                    created_by_id=board.owner_id,
+                    started_at=now,
+                    finished_at=now,
+                )
+                for board in created_boards
+            ],
+            batch_size=batch_size,
+        )
+        log(f'Created {len(jobs)} jobs')
+
+    return {
+        'users': len(user_ids),
+        'boards': len(created_boards),
+        'memberships': len(memberships),
+        'tasks': len(tasks) - len(archived_ids),
+        'comments': len(comments) - archived_comments,
+        'archived_tasks': len(archived_ids),
+        'archived_comments': archived_comments,
+        'jobs': len(jobs),
+    }
@@ -0,0 +1,118 @@
+import os
+import random
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DatabaseError, connections
+
+
+_replica_reads = ContextVar('replica_reads', default=False)
+_replica_health = {}
+
+PIN_CACHE_PREFIX = 'replica-pin:'
+
+
+def allow_replica_reads(allowed):
+    """
+    Enable or disable replica reads for the current request context.
+
+    - Returns a token that can be passed to reset_replica_reads().
+    """
+    return _replica_reads.set(allowed)
+
+
+def reset_replica_reads(token):
+    _replica_reads.reset(token)
+
+
+def pin_to_primary(client_key):
+    """
+    Pin a client to the primary database for REPLICA_STICKY_SECONDS.
+
+    - Gives the client read-your-writes consistency while replicas catch up.
+    - Pins live in the REPLICA_PIN_CACHE cache, which must be shared by all
+      worker processes; with a per-process cache (LocMemCache) a write only
+      pins the reads served by the same process.
+    """
+    if client_key:
+        caches[settings.REPLICA_PIN_CACHE].set(
+            PIN_CACHE_PREFIX + client_key,
+            True,
+            settings.REPLICA_STICKY_SECONDS
+        )
+
+
+def is_pinned_to_primary(client_key):
+    return bool(client_key) and caches[settings.REPLICA_PIN_CACHE].get(
+        PIN_CACHE_PREFIX + client_key, False
+    )
+
+
+def replica_is_available(alias):
+    """
+    Check whether a replica alias can currently serve reads.
+
+    - Results are cached for REPLICA_RETRY_SECONDS so an unavailable replica
+      is not probed on every query.
+    - SQLite replicas must already exist on disk; connecting would otherwise
+      silently create an empty database file.
+    """
+    now = time.monotonic()
+    checked_at, available = _replica_health.get(alias, (None, False))
+    if checked_at is not None and now - checked_at < settings.REPLICA_RETRY_SECONDS:
+        return available
+
+    try:
+        connection = connections[alias]
+        if connection.vendor == 'sqlite':
+            name = str(connection.settings_dict['NAME'])
+            if not connection.is_in_memory_db() and not os.path.exists(name):
+                raise DatabaseError(f'Replica database {name} does not exist')
+        connection.ensure_connection()
+        available = connection.is_usable()
+    except Exception:
+        available = False
+
+    _replica_health[alias] = (now, available)
+    return available
+
+
+def reset_replica_health():
+    _replica_health.clear()
+
+
+class ReplicaRouter:
+    """
+    Database router sending safe-method API reads to read replicas.
+
+    - Replica reads are only used while ReplicaRoutingMiddleware has enabled
+      them for the current request; everything else uses the primary.
+    - Picks a random available replica from settings.DATABASE_REPLICAS and
+      falls back to the primary when none is available.
+    - Models listed in settings.REPLICA_PRIMARY_MODELS (e.g. auth tokens)
+      are always read from the primary to keep authentication consistent.
+    - All writes go to the primary.
+    """
+    primary = 'default'
+
+    def db_for_read(self, model, **hints):
+        if not _replica_reads.get() or not settings.DATABASE_REPLICAS:
+            return self.primary
+        if model._meta.label_lower in settings.REPLICA_PRIMARY_MODELS:
+            return self.primary
+
+        replicas = [
+            alias for alias in settings.DATABASE_REPLICAS
+            if replica_is_available(alias)
+        ]
+        if not replicas:
+            return self.primary
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return self.primary
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
@@ -0,0 +1,133 @@
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import CASCADE, DO_NOTHING, SET_NULL
+from django.db.models.deletion import get_candidate_relations_to_delete
+from django.utils import timezone
+
+
+def auto_now_values(model):
+    """Return {name: now} for the auto_now fields of model, as save() sets them."""
+    now = timezone.now()
+    return {
+        field.name: now for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False)
+    }
+
+
+class ChunkedDeleter:
+    """
+    Delete rows and everything that cascades from them in bounded chunks.
+
+    - Walks the same reverse relations as Django's deletion collector, but
+      leaf-first and without loading the related rows into memory.
+    - Every chunk of at most chunk_size rows is deleted with one raw
+      DELETE ... WHERE id IN (...) in its own transaction, so locks are
+      held only for one chunk. SET_NULL relations are cleared the same way.
+    - Relations with other on_delete rules (PROTECT, RESTRICT, SET(...))
+      and self-references fall back to QuerySet.delete() per chunk.
+    - Raw deletes skip pre_delete/post_delete signals. Models with a
+      touch_related(queryset, deleting) classmethod (tasks, comments,
+      memberships) get every chunk before it is deleted or cleared, in the
+      chunk's transaction, so the rollup timestamps of their boards change
+      as with delete() and save(). deleting lists the models the chunk
+      cascades from; rows of those need no touch (e.g. the boards being
+      deleted).
+    - Clearing a SET_NULL field also sets the auto_now fields of the row
+      (e.g. Task.updated_at).
+    - Not atomic as a whole: an interrupted run leaves a partly deleted
+      tree that a second run finishes.
+    - progress(label, count) is called after every chunk with the model
+      label (<label>.<field> for cleared SET_NULL fields) and the number
+      of rows handled so far.
+    - delete() works on the database the router picks for the model, or
+      on using; the counts add up over several calls (e.g. one per shard).
+    """
+
+    def __init__(self, chunk_size=None, progress=None):
+        self.chunk_size = chunk_size or settings.DELETE_CHUNK_SIZE
+        self.progress = progress
+        self.counts = {}
+
+    def delete(self, queryset, using=None):
+        """Delete the rows of queryset and their descendants; returns the counts."""
+        self.using = using or router.db_for_write(queryset.model)
+        self._delete(queryset.using(self.using), path=())
+        return self.counts
+
+    def _delete(self, queryset, path):
+        model = queryset.model
+        path = path + (model,)
+        raw = True
+        for relation in get_candidate_relations_to_delete(model._meta):
+            field = relation.field
+            on_delete = field.remote_field.on_delete
+            related = relation.related_model._base_manager.using(self.using).filter(
+                **{f'{field.name}__in': queryset.values(field.target_field.attname)}
+            )
+            if on_delete is DO_NOTHING:
+                continue
+            elif on_delete is CASCADE and relation.related_model not in path:
+                self._delete(related, path)
+            elif on_delete is SET_NULL:
+                self._in_chunks(
+                    related,
+                    lambda chunk, name=field.name: chunk.update(
+                        **{name: None}, **auto_now_values(chunk.model)
+                    ),
+                    path,
+                    label=f'{relation.related_model._meta.label}.{field.name}',
+                )
+            else:
+                raw = False
+
+        if raw:
+            self._in_chunks(queryset, lambda chunk: chunk._raw_delete(self.using), path[:-1])
+        else:
+            self._in_chunks(queryset, lambda chunk: chunk.delete(), path[:-1])
+
+    def _in_chunks(self, queryset, apply, deleting, label=None):
+        model = queryset.model
+        label = label or model._meta.label
+        ids = queryset.order_by().values_list('pk', flat=True)
+        while True:
+            with transaction.atomic(using=self.using):
+                chunk_ids = list(ids[:self.chunk_size])
+                if chunk_ids:
+                    chunk = model._base_manager.using(self.using).filter(pk__in=chunk_ids)
+                    if hasattr(model, 'touch_related'):
+                        model.touch_related(chunk, deleting)
+                    apply(chunk)
+            if not chunk_ids:
+                break
+            self.counts[label] = self.counts.get(label, 0) + len(chunk_ids)
+            if self.progress is not None:
+                self.progress(label, self.counts[label])
+            if len(chunk_ids) < self.chunk_size:
+                break
+
+
+def chunked_delete(queryset, chunk_size=None, progress=None):
+    """
+    Delete queryset with ChunkedDeleter.
+
+    - Returns {model label: rows deleted or updated}.
+    """
+    return ChunkedDeleter(chunk_size, progress).delete(queryset)
+
+
+def chunked_delete_copied(queryset, chunk_size=None, progress=None, shards_only=False):
+    """
+    chunked_delete() for global rows with a copy on every shard (users).
+
+    - Deletes the copies and what cascades from them (boards, tasks,
+      comments) on every shard in DATABASE_SHARDS, then the rows on their
+      own database; the counts add up.
+    - shards_only=True stops after the shards (User.delete() deletes the
+      row itself).
+    """
+    deleter = ChunkedDeleter(chunk_size, progress)
+    for alias in settings.DATABASE_SHARDS:
+        deleter.delete(queryset, using=alias)
+    if shards_only:
+        return deleter.counts
+    return deleter.delete(queryset)
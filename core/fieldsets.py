@@ -0,0 +1,228 @@
+from rest_framework import serializers
+
+
+def parse_paths(value):
+    """
+    Parse a comma separated list of dotted field paths into a tree.
+
+    - 'id,tasks.id,tasks.title' becomes
+      {'id': {}, 'tasks': {'id': {}, 'title': {}}}.
+    """
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for part in path.strip().split('.'):
+            if part:
+                node = node.setdefault(part, {})
+    return tree
+
+
+# Collections that ?normalize= can move related objects into.
+SIDELOADED_COLLECTIONS = ('users',)
+
+
+class FieldSelection:
+    """
+    Fields and nested objects requested with ?fields=, ?expand= and
+    ?normalize=.
+
+    - fields: tree of the requested fields (see parse_paths()); None
+      selects every field. Dotted names select fields of nested objects.
+    - expand: tree of the nested objects rendered in full; the others are
+      rendered as their primary keys. None expands every nested object,
+      an empty tree none of them.
+    - A field listed without sub-fields selects (or expands) the nested
+      object completely.
+    - normalize: collections (e.g. users) whose objects are rendered once
+      in a top-level map and referenced by primary key everywhere else.
+    """
+
+    def __init__(self, fields=None, expand=None, prefix='', normalize=()):
+        self.fields = fields
+        self.expand = expand
+        self.prefix = prefix
+        self.normalize = normalize
+
+    @classmethod
+    def from_request(cls, request):
+        """
+        Return the selection of a GET or HEAD request.
+
+        - Works with DRF and plain Django requests; other methods always
+          select every field, so request bodies are validated in full.
+        """
+        if request is None or request.method not in ('GET', 'HEAD'):
+            return ALL_FIELDS
+        params = getattr(request, 'query_params', request.GET)
+        fields = params.get('fields')
+        expand = params.get('expand')
+        normalize = params.get('normalize', '')
+        return cls(
+            parse_paths(fields) if fields else None,
+            parse_paths(expand) if expand is not None else None,
+            normalize=tuple(name.strip() for name in normalize.split(',') if name.strip()),
+        )
+
+    @property
+    def is_all(self):
+        return self.fields is None and self.expand is None and not self.normalize
+
+    def __contains__(self, name):
+        return self.fields is None or name in self.fields
+
+    def expands(self, name):
+        """Whether the nested object name is selected and rendered in full."""
+        return name in self and (self.expand is None or name in self.expand)
+
+    def child(self, name):
+        """Return the selection inside the nested object name."""
+        return FieldSelection(
+            self.fields.get(name) or None if self.fields is not None else None,
+            self.expand.get(name) or None if self.expand is not None else None,
+            prefix=f'{self.prefix}{name}.',
+            normalize=self.normalize,
+        )
+
+    def validate(self, fields):
+        """Raise a ValidationError for names that are not in fields."""
+        nested = {
+            name for name, field in fields.items()
+            if isinstance(field, serializers.BaseSerializer)
+        }
+        errors = {}
+        unknown = [name for name in self.fields or () if name not in fields]
+        if unknown:
+            errors['fields'] = ['Unknown field(s): ' + ', '.join(
+                self.prefix + name for name in unknown)]
+        unknown = [name for name in self.expand or () if name not in nested]
+        if unknown:
+            errors['expand'] = ['Not expandable: ' + ', '.join(
+                self.prefix + name for name in unknown)]
+        unknown = [name for name in self.normalize if name not in SIDELOADED_COLLECTIONS]
+        if unknown:
+            errors['normalize'] = ['Unknown collection(s): ' + ', '.join(unknown)]
+        if errors:
+            raise serializers.ValidationError(errors)
+
+
+ALL_FIELDS = FieldSelection()
+
+
+def collapse(field):
+    """Return a read-only primary key field replacing a nested serializer."""
+    return serializers.PrimaryKeyRelatedField(
+        source=field.source,
+        many=isinstance(field, serializers.ListSerializer),
+        read_only=True,
+    )
+
+
+class SideloadedField(serializers.Field):
+    """
+    Read-only field rendering related objects as primary keys.
+
+    - The objects are recorded in context['sideloaded'][collection] so
+      sideload() can render each of them once with serializer_class.
+    """
+
+    def __init__(self, collection, serializer_class, many=False, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+        self.collection = collection
+        self.serializer_class = serializer_class
+        self.many = many
+
+    def to_representation(self, value):
+        sideloaded = self.context.setdefault('sideloaded', {})
+        _, objects = sideloaded.setdefault(self.collection, (self.serializer_class, {}))
+        if not self.many:
+            values = [value]
+        else:
+            # A related manager, or a plain list (e.g. Board.listed_members).
+            values = list(value.all() if hasattr(value, 'all') else value)
+        for obj in values:
+            objects.setdefault(obj.pk, obj)
+        if self.many:
+            return [obj.pk for obj in values]
+        return value.pk
+
+
+def sideload(serializer, data=None):
+    """
+    Return the payload of serializer with its sideloaded collections.
+
+    - data defaults to serializer.data; pass a paginated payload to extend
+      it instead.
+    - Without ?normalize= data is returned unchanged. Otherwise lists
+      become {'results': [...], 'users': {...}} and objects get a 'users'
+      key mapping primary keys to the rendered objects.
+    """
+    if data is None:
+        data = serializer.data
+    selection = FieldSelection.from_request(serializer.context.get('request'))
+    if not selection.normalize:
+        return data
+    payload = {'results': data} if isinstance(data, list) else dict(data)
+    sideloaded = serializer.context.get('sideloaded', {})
+    for collection in selection.normalize:
+        serializer_class, objects = sideloaded.get(collection, (None, {}))
+        objects = [objects[pk] for pk in sorted(objects)]
+        rendered = serializer_class(objects, many=True).data if objects else []
+        payload[collection] = {obj.pk: item for obj, item in zip(objects, rendered)}
+    return payload
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin applying a FieldSelection to the serialized fields.
+
+    - The outermost serializer reads the selection from the request in its
+      context (?fields=, ?expand=); nested serializers receive their part
+      of it from their parent.
+    - Unselected fields are dropped; nested serializers that are not
+      expanded become primary keys.
+    - With ?normalize=users, the fields listed in sideloaded_fields
+      ({name: (collection, serializer class)}) render primary keys and
+      their objects are collected for sideload().
+    - Unknown names raise a ValidationError (400).
+    - setup_eager_loading(queryset, selection) of the serializer should skip
+      the joins and annotations of unselected fields.
+    """
+    selection = None
+    sideloaded_fields = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = self.selection
+        if selection is None and self.is_outermost():
+            selection = FieldSelection.from_request(self.context.get('request'))
+        if selection is None or selection.is_all:
+            return fields
+
+        selection.validate(fields)
+        for name in list(fields):
+            field = fields[name]
+            nested = isinstance(field, serializers.BaseSerializer)
+            collection, serializer_class = self.sideloaded_fields.get(name, (None, None))
+            if name not in selection:
+                del fields[name]
+            elif nested and not selection.expands(name):
+                fields[name] = collapse(field)
+            elif collection in selection.normalize:
+                fields[name] = SideloadedField(
+                    collection,
+                    serializer_class,
+                    many=isinstance(field, serializers.ListSerializer),
+                    source=field.source if nested else None,
+                )
+            elif nested:
+                child = getattr(field, 'child', field)
+                if isinstance(child, SparseFieldsetMixin):
+                    child.selection = selection.child(name)
+        return fields
+
+    def is_outermost(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from auth_app.models import User
+from boards_app.models import Board
+from core.deletion import chunked_delete, chunked_delete_copied
+from core.sharding import shard_for, use_shard
+from jobs_app.queue import enqueue
+
+
+class Command(BaseCommand):
+    """
+    Delete a board or a user with all cascading rows in chunks.
+
+    - Example: python manage.py chunked_delete --board 42 --chunk-size 5000
+    - --enqueue hands the deletion to a background job instead.
+    """
+    help = 'Delete a board or a user in bounded chunks.'
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument('--board', type=int, help='Id of the board to delete.')
+        target.add_argument('--user', type=int, help='Id of the user to delete.')
+        parser.add_argument('--chunk-size', type=int, default=settings.DELETE_CHUNK_SIZE)
+        parser.add_argument('--enqueue', action='store_true',
+                            help='Run the deletion as a background job.')
+
+    def handle(self, *args, **options):
+        if options['board'] is not None:
+            name, payload = 'delete_board', {'board_id': options['board']}
+            queryset = Board.objects.filter(pk=options['board'])
+            delete = chunked_delete
+        else:
+            name, payload = 'delete_user', {'user_id': options['user']}
+            queryset = User.objects.filter(pk=options['user'])
+            delete = chunked_delete_copied
+        with use_shard(shard_for(options['board'])):
+            if not queryset.exists():
+                raise CommandError('Nothing to delete.')
+
+            if options['enqueue']:
+                job, _ = enqueue(name, payload)
+                self.stdout.write(self.style.SUCCESS(f'Enqueued job {job.pk}'))
+                return
+
+            def progress(label, count):
+                self.stdout.write(f'{label}: {count}')
+
+            counts = delete(queryset, options['chunk_size'], progress)
+        self.stdout.write(self.style.SUCCESS(
+            'Deleted: ' + ', '.join(f'{count} {label}' for label, count in counts.items())
+        ))
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from auth_app.models import User
+from core.sharding import copy_to_shards
+
+
+class Command(BaseCommand):
+    """
+    Copy every user from the default database to every shard.
+
+    - Needed once when shards are added to a database that already has
+      users; afterwards User.save() keeps the copies up to date.
+    - Migrate the shards first: python manage.py migrate --database shard0
+    - Example: python manage.py copy_users_to_shards --batch-size 2000
+    """
+    help = 'Copy all users to every database in DATABASE_SHARDS.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if not settings.DATABASE_SHARDS:
+            raise CommandError('DATABASE_SHARDS is empty; set DJANGO_DB_SHARDS.')
+        batch, copied = [], 0
+        for user in User.objects.order_by('pk').iterator(chunk_size=options['batch_size']):
+            batch.append(user)
+            if len(batch) == options['batch_size']:
+                copy_to_shards(batch)
+                copied, batch = copied + len(batch), []
+        copy_to_shards(batch)
+        copied += len(batch)
+        self.stdout.write(self.style.SUCCESS(
+            f'Copied {copied} users to {", ".join(settings.DATABASE_SHARDS)}'
+        ))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from core.datasets import flush_dataset, generate_dataset
+
+
+class Command(BaseCommand):
+    """
+    Generate a reproducible synthetic dataset for benchmarks.
+
+    - Removes a previously generated dataset first.
+    - Example: python manage.py generate_dataset --users 2000 --boards 200
+    """
+    help = 'Generate a reproducible synthetic dataset with bulk inserts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--boards', type=int, default=100)
+        parser.add_argument('--members', type=int, default=20,
+                            help='Members per board (besides the owner).')
+        parser.add_argument('--tasks', type=int, default=200,
+                            help='Tasks per board.')
+        parser.add_argument('--comments', type=int, default=3,
+                            help='Average comments per task.')
+        parser.add_argument('--archived', type=int, default=20,
+                            help='Archived done tasks per board.')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        flush_dataset()
+        summary = generate_dataset(
+            users=options['users'],
+            boards=options['boards'],
+            members_per_board=options['members'],
+            tasks_per_board=options['tasks'],
+            comments_per_task=options['comments'],
+            archived_tasks_per_board=options['archived'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            stdout=self.stdout,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            'Dataset generated: ' + ', '.join(f'{n} {name}' for name, n in summary.items())
+        ))
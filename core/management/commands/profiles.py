@@ -0,0 +1,55 @@
+import os
+import pstats
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.profiling import list_profiles, summarize
+
+
+class Command(BaseCommand):
+    """
+    List and summarize the request profiles stored in PROFILING_DIR.
+
+    - One line per profile, newest first: timestamp, method, route, total
+      time and function calls.
+    - --show <name> prints the top functions of one profile.
+    - Example: python manage.py profiles --route board-detail
+    - Example: python manage.py profiles --show 20261019T101500000000Z-GET-board-detail.prof
+    """
+    help = 'List stored request profiles or show one of them.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', help='Profile directory (default: PROFILING_DIR).')
+        parser.add_argument('--route', help='Only list profiles of this route name.')
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--show', metavar='NAME', help='Print the top functions of this profile.')
+        parser.add_argument('--sort', default='cumulative',
+                            help='pstats sort key for --show, e.g. cumulative or tottime.')
+        parser.add_argument('--lines', type=int, default=25, help='Functions printed by --show.')
+
+    def handle(self, *args, **options):
+        directory = options['dir'] or settings.PROFILING_DIR
+        if not directory:
+            raise CommandError('Set PROFILING_DIR or pass --dir.')
+
+        if options['show']:
+            path = os.path.join(str(directory), os.path.basename(options['show']))
+            if not os.path.isfile(path):
+                raise CommandError(f'No profile named {options["show"]}.')
+            stats = pstats.Stats(path, stream=self.stdout)
+            stats.strip_dirs().sort_stats(options['sort']).print_stats(options['lines'])
+            return
+
+        profiles = list_profiles(directory)
+        if options['route']:
+            profiles = [entry for entry in profiles if entry['route'] == options['route']]
+        if not profiles:
+            self.stdout.write('No profiles stored.')
+            return
+        for entry in profiles[:options['limit']]:
+            total, calls, _ = summarize(entry['path'])
+            self.stdout.write(
+                f'{entry["timestamp"]:%Y-%m-%d %H:%M:%S}  {entry["method"]:<6} {entry["route"]:<28} '
+                f'{total * 1000:9.1f} ms {calls:>9} calls  {entry["name"]}'
+            )
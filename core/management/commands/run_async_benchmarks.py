@@ -0,0 +1,54 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmarks import compare_sync_async, select_dataset_objects
+
+
+class Command(BaseCommand):
+    """
+    Compare the throughput of the sync and async read views under ASGI.
+
+    - Requires a dataset created with generate_dataset.
+    - Every read path (board list/detail, task list, assigned-to-me,
+      reviewing, comment list) is requested --requests times with
+      --concurrency requests in flight, first through the sync DRF view
+      and then through its async variant.
+    """
+    help = 'Compare sync and async read view throughput at high concurrency.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500)
+        parser.add_argument('--concurrency', type=int, default=100)
+        parser.add_argument('--output', help='Write JSON results to this file.')
+
+    def handle(self, *args, **options):
+        objects = select_dataset_objects()
+        if objects is None:
+            raise CommandError('No dataset found, run generate_dataset first.')
+
+        results = compare_sync_async(
+            *objects,
+            requests=options['requests'],
+            concurrency=options['concurrency'],
+        )
+
+        self.stdout.write(
+            f'{"route":<26} {"sync rps":>9} {"async rps":>10} {"change":>8} '
+            f'{"sync p99":>9} {"async p99":>10}'
+        )
+        for route, row in results.items():
+            sync, async_ = row['sync'], row['async']
+            change = (async_['rps'] - sync['rps']) / sync['rps'] * 100
+            self.stdout.write(
+                f'{route:<26} {sync["rps"]:>9.1f} {async_["rps"]:>10.1f} '
+                f'{change:>+7.1f}% {sync["p99_ms"]:>9.2f} {async_["p99_ms"]:>10.2f}'
+            )
+            if sync['errors'] or async_['errors']:
+                self.stderr.write(
+                    f'{route}: {sync["errors"]} sync / {async_["errors"]} async errors')
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(results, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Results written to {options["output"]}'))
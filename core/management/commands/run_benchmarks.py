@@ -0,0 +1,112 @@
+import json
+import subprocess
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from auth_app.models import User
+from boards_app.models import Board
+from core.benchmarks import (
+    api_route_names,
+    benchmark,
+    build_scenarios,
+    get_client,
+    select_dataset_objects,
+)
+from core.datasets import DATASET_EMAIL_DOMAIN
+from task_app.models import ArchivedTask, Comment, Task
+
+
+class Command(BaseCommand):
+    """
+    Benchmark every API route against the generated dataset.
+
+    - Requires a dataset created with generate_dataset.
+    - Reports p50/p95/p99 latency and query counts per route and method.
+    - Writes JSON results (--output) and can compare them with an earlier
+      run (--compare) to spot regressions across commits.
+    """
+    help = 'Time every API route and report latency percentiles and query counts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--route', action='append', dest='routes',
+                            help='Only benchmark the given route name(s).')
+        parser.add_argument('--output', help='Write JSON results to this file.')
+        parser.add_argument('--compare', help='JSON results of an earlier run.')
+
+    def handle(self, *args, **options):
+        objects = select_dataset_objects()
+        if objects is None:
+            raise CommandError('No dataset found, run generate_dataset first.')
+
+        scenarios = build_scenarios(*objects)
+        missing = api_route_names() - {s.route for s in scenarios}
+        if missing:
+            self.stderr.write(f'Routes without a benchmark scenario: {sorted(missing)}')
+        if options['routes']:
+            scenarios = [s for s in scenarios if s.route in options['routes']]
+
+        results = benchmark(
+            scenarios,
+            get_client(objects.user, staff=True),
+            iterations=options['iterations'],
+            warmup=options['warmup'],
+        )
+        report = {
+            'meta': {
+                'commit': self.get_commit(),
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'database': settings.DATABASES['default']['ENGINE'],
+                'dataset': {
+                    'users': User.objects.filter(
+                        email__endswith=f'@{DATASET_EMAIL_DOMAIN}').count(),
+                    'boards': Board.objects.count(),
+                    'tasks': Task.objects.count(),
+                    'comments': Comment.objects.count(),
+                    'archived_tasks': ArchivedTask.objects.count(),
+                },
+            },
+            'routes': results,
+        }
+
+        previous = {}
+        if options['compare']:
+            with open(options['compare']) as compare_file:
+                previous = json.load(compare_file)['routes']
+        self.print_table(results, previous)
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Results written to {options["output"]}'))
+
+    def get_commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def print_table(self, results, previous):
+        self.stdout.write(
+            f'{"route":<32} {"status":>6} {"p50 ms":>9} {"p95 ms":>9} '
+            f'{"p99 ms":>9} {"queries":>7}'
+        )
+        for key, row in results.items():
+            line = (
+                f'{key:<32} {row["status"]:>6} {row["p50_ms"]:>9.2f} '
+                f'{row["p95_ms"]:>9.2f} {row["p99_ms"]:>9.2f} {row["queries"]:>7}'
+            )
+            before = previous.get(key)
+            if before:
+                change = (row['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100
+                line += f'  p50 {change:+.1f}%  queries {row["queries"] - before["queries"]:+d}'
+            self.stdout.write(line)
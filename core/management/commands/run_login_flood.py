@@ -0,0 +1,58 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmarks import measure_login_flood, select_dataset_objects
+
+
+class Command(BaseCommand):
+    """
+    Show how a login flood affects authenticated API latency.
+
+    - Requires a dataset created with generate_dataset.
+    - Measures GET /api/boards/ latency alone, during a flood of failed
+      logins with throttling (core.throttling) and, unless --throttled-only,
+      during the same flood without throttling.
+    - Example: python manage.py run_login_flood --duration 10 --rate 200
+    """
+    help = 'Measure authenticated API latency during a login flood.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--duration', type=float, default=5.0,
+                            help='Seconds per phase.')
+        parser.add_argument('--rate', type=float, default=100,
+                            help='Flood requests per second.')
+        parser.add_argument('--threads', type=int, default=4)
+        parser.add_argument('--addresses', type=int, default=1,
+                            help='Client IPs the flood rotates over.')
+        parser.add_argument('--throttled-only', action='store_true')
+        parser.add_argument('--output', help='Write JSON results to this file.')
+
+    def handle(self, *args, **options):
+        objects = select_dataset_objects()
+        if objects is None:
+            raise CommandError('No dataset found, run generate_dataset first.')
+
+        results = measure_login_flood(
+            objects.user,
+            duration=options['duration'],
+            rate=options['rate'],
+            threads=options['threads'],
+            addresses=options['addresses'],
+            modes=(True,) if options['throttled_only'] else (True, False),
+        )
+
+        self.stdout.write(
+            f'{"phase":<20} {"probes":>7} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8}  flood'
+        )
+        for phase, row in results.items():
+            flood = ', '.join(f'{count}x {code}' for code, count in row['flood'].items())
+            self.stdout.write(
+                f'{phase:<20} {row["probes"]:>7} {row["p50_ms"]:>8.2f} '
+                f'{row["p95_ms"]:>8.2f} {row["p99_ms"]:>8.2f}  {flood or "-"}'
+            )
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(results, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Results written to {options["output"]}'))
@@ -0,0 +1,43 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmarks import measure_serializers, select_dataset_objects
+
+
+class Command(BaseCommand):
+    """
+    Microbenchmark serializer construction and rendering.
+
+    - Requires a dataset created with generate_dataset.
+    - Times MemberSerializer, TaskReadSerializer and BoardDetailSerializer
+      without and with the cached fields of core.serializers.
+    - Example: python manage.py run_serializer_benchmarks --iterations 2000
+    """
+    help = 'Time serializer construction and rendering with and without the field cache.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=500)
+        parser.add_argument('--output', help='Write JSON results to this file.')
+
+    def handle(self, *args, **options):
+        objects = select_dataset_objects()
+        if objects is None:
+            raise CommandError('No dataset found, run generate_dataset first.')
+
+        results = measure_serializers(objects.board, objects.task, options['iterations'])
+
+        self.stdout.write(
+            f'{"serializer":<24} {"measure":<10} {"uncached us":>12} {"cached us":>10} {"change":>8}')
+        for name, row in results.items():
+            for measure, timings in row.items():
+                change = (timings['cached'] - timings['uncached']) / timings['uncached'] * 100
+                self.stdout.write(
+                    f'{name:<24} {measure[:-3]:<10} {timings["uncached"]:>12.1f} '
+                    f'{timings["cached"]:>10.1f} {change:>+7.1f}%'
+                )
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(results, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Results written to {options["output"]}'))
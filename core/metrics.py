@@ -0,0 +1,205 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Layout of a per-route stats list:
+# [requests, latency_sum, db_queries, db_time, *latency_bucket_counts]
+REQUESTS, LATENCY_SUM, DB_QUERIES, DB_TIME, BUCKETS = range(5)
+
+
+class MetricsRegistry:
+    """
+    Process-local, lock-light store of per-route request metrics.
+
+    - Every thread records into its own shard, so recording never takes a
+      lock; the lock is only held when a new thread registers its shard.
+    - snapshot() merges all shards into one {(route, method): stats} dict.
+    - Bucket counts are stored non-cumulative and accumulated on export.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def record(self, route, method, duration, db_queries, db_time):
+        shard = self._shard()
+        stats = shard.get((route, method))
+        if stats is None:
+            stats = [0, 0.0, 0, 0.0] + [0] * (len(self.buckets) + 1)
+            shard[(route, method)] = stats
+
+        stats[REQUESTS] += 1
+        stats[LATENCY_SUM] += duration
+        stats[DB_QUERIES] += db_queries
+        stats[DB_TIME] += db_time
+        for index, bound in enumerate(self.buckets):
+            if duration <= bound:
+                stats[BUCKETS + index] += 1
+                break
+        else:
+            stats[BUCKETS + len(self.buckets)] += 1
+
+    def snapshot(self):
+        with self._lock:
+            shards = list(self._shards)
+
+        merged = {}
+        for shard in shards:
+            for key, stats in shard.copy().items():
+                merge_stats(merged, key, list(stats))
+        return merged
+
+    def reset(self):
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+
+
+def merge_stats(merged, key, stats):
+    current = merged.get(key)
+    if current is None:
+        merged[key] = stats
+    else:
+        merged[key] = [a + b for a, b in zip(current, stats)]
+
+
+class FileAggregator:
+    """
+    File-backed aggregation for preforked workers.
+
+    - Each process periodically writes its snapshot to
+      <directory>/metrics-<pid>.json (atomic rename, no locking).
+    - collect() merges the snapshots of all processes.
+    """
+
+    def __init__(self, directory, flush_interval):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._last_flush = 0.0
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, f'metrics-{os.getpid()}.json')
+
+    def maybe_flush(self, registry):
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush(registry)
+
+    def flush(self, registry):
+        self._last_flush = time.monotonic()
+        os.makedirs(self.directory, exist_ok=True)
+        rows = [
+            [route, method, stats]
+            for (route, method), stats in registry.snapshot().items()
+        ]
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as tmp:
+            json.dump(rows, tmp)
+        os.replace(tmp_path, self.path)
+
+    def collect(self):
+        merged = {}
+        for name in os.listdir(self.directory):
+            if not (name.startswith('metrics-') and name.endswith('.json')):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as snapshot:
+                    rows = json.load(snapshot)
+            except (OSError, ValueError):
+                continue
+            for route, method, stats in rows:
+                merge_stats(merged, (route, method), stats)
+        return merged
+
+
+registry = MetricsRegistry()
+_aggregator = None
+
+
+def get_aggregator():
+    """Return the FileAggregator if settings.METRICS_DIR is configured."""
+    global _aggregator
+    directory = settings.METRICS_DIR
+    if not directory:
+        return None
+    if _aggregator is None or _aggregator.directory != str(directory):
+        _aggregator = FileAggregator(str(directory), settings.METRICS_FLUSH_SECONDS)
+    return _aggregator
+
+
+def collect():
+    aggregator = get_aggregator()
+    if aggregator is None:
+        return registry.snapshot()
+    aggregator.flush(registry)
+    return aggregator.collect()
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_prometheus(snapshot, buckets=LATENCY_BUCKETS):
+    """Render a metrics snapshot in the Prometheus text exposition format."""
+    families = {
+        'requests': [],
+        'latency': [],
+        'queries': [],
+        'db_time': [],
+    }
+    for (route, method), stats in sorted(snapshot.items()):
+        labels = f'route="{_escape(route)}",method="{_escape(method)}"'
+        families['requests'].append(
+            f'kanmind_http_requests_total{{{labels}}} {stats[REQUESTS]}')
+
+        cumulative = 0
+        for index, bound in enumerate(buckets):
+            cumulative += stats[BUCKETS + index]
+            families['latency'].append(
+                f'kanmind_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+        families['latency'].append(
+            f'kanmind_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats[REQUESTS]}')
+        families['latency'].append(
+            f'kanmind_http_request_duration_seconds_sum{{{labels}}} {stats[LATENCY_SUM]:.6f}')
+        families['latency'].append(
+            f'kanmind_http_request_duration_seconds_count{{{labels}}} {stats[REQUESTS]}')
+
+        families['queries'].append(
+            f'kanmind_db_queries_total{{{labels}}} {stats[DB_QUERIES]}')
+        families['db_time'].append(
+            f'kanmind_db_query_duration_seconds_total{{{labels}}} {stats[DB_TIME]:.6f}')
+
+    lines = [
+        '# HELP kanmind_http_requests_total Total HTTP requests per route.',
+        '# TYPE kanmind_http_requests_total counter',
+        *families['requests'],
+        '# HELP kanmind_http_request_duration_seconds HTTP request latency per route.',
+        '# TYPE kanmind_http_request_duration_seconds histogram',
+        *families['latency'],
+        '# HELP kanmind_db_queries_total Database queries executed per route.',
+        '# TYPE kanmind_db_queries_total counter',
+        *families['queries'],
+        '# HELP kanmind_db_query_duration_seconds_total Time spent in database queries per route.',
+        '# TYPE kanmind_db_query_duration_seconds_total counter',
+        *families['db_time'],
+    ]
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,369 @@
+import hashlib
+import logging
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from types import SimpleNamespace
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from core import metrics, profiling
+from core.db_routers import (
+    allow_replica_reads,
+    is_pinned_to_primary,
+    pin_to_primary,
+    reset_replica_reads,
+)
+
+
+logger = logging.getLogger('kanmind.nplusone')
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def get_client_key(request):
+    """
+    Identify the client of a request without touching the database.
+
+    - Uses the Authorization header (API tokens) or the session cookie.
+    - Returns a hashed key, or None for anonymous clients.
+    """
+    credential = request.META.get('HTTP_AUTHORIZATION')
+    if not credential:
+        credential = request.COOKIES.get('sessionid')
+    if not credential:
+        return None
+    return hashlib.sha256(credential.encode()).hexdigest()
+
+
+class AsyncCapableMiddleware:
+    """
+    Base class for middleware running in sync (WSGI) and async (ASGI) stacks.
+
+    - Subclasses implement wrap(request), a context manager around the rest
+      of the stack; the response is available as call.response afterwards.
+    - Under ASGI the chain stays async, so async views do not fall back to
+      a thread through the sync-to-async bridge.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with self.wrap(request) as call:
+            call.response = self.get_response(request)
+        return call.response
+
+    async def __acall__(self, request):
+        with self.wrap(request) as call:
+            call.response = await self.get_response(request)
+        return call.response
+
+    @contextmanager
+    def wrap(self, request):
+        yield SimpleNamespace(response=None)
+
+
+class ReplicaRoutingMiddleware(AsyncCapableMiddleware):
+    """
+    Middleware enabling replica reads for safe-method API requests.
+
+    - GET/HEAD/OPTIONS requests below /api/ may read from replicas, unless
+      the client wrote recently and is still pinned to the primary.
+    - Successful writes pin the client to the primary for
+      REPLICA_STICKY_SECONDS (read-your-writes).
+    """
+
+    @contextmanager
+    def wrap(self, request):
+        client_key = get_client_key(request)
+        use_replica = (
+            request.method in SAFE_METHODS
+            and request.path.startswith('/api/')
+            and not is_pinned_to_primary(client_key)
+        )
+
+        call = SimpleNamespace(response=None)
+        token = allow_replica_reads(use_replica)
+        try:
+            yield call
+        finally:
+            reset_replica_reads(token)
+
+        if request.method not in SAFE_METHODS and call.response.status_code < 400:
+            pin_to_primary(client_key)
+
+
+class QueryStats:
+    """Execute wrapper counting queries and the time spent running them."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+_query_wrappers = ContextVar('query_wrappers', default=())
+
+
+def run_query_wrappers(execute, sql, params, many, context):
+    """
+    Execute wrapper running the wrappers of wrap_all_connections().
+
+    - Installed once on every connection (install_query_wrappers()); the
+      wrappers to run come from the current context, so the queries of the
+      async ORM, which run in sync_to_async threads with a copy of the
+      request's context, are wrapped as well.
+    """
+    for wrapper in reversed(_query_wrappers.get()):
+        execute = partial(wrapper, execute)
+    return execute(sql, params, many, context)
+
+
+def install_query_wrappers(connection, **kwargs):
+    """
+    Add run_query_wrappers() to connection, once.
+
+    - Receiver of connection_created (CoreConfig.ready()), so connections
+      opened by any thread get it.
+    """
+    if run_query_wrappers not in connection.execute_wrappers:
+        connection.execute_wrappers.append(run_query_wrappers)
+
+
+@contextmanager
+def wrap_all_connections(wrapper):
+    """
+    Run an execute wrapper around every query of the block, on any database.
+
+    - Covers the queries of the current context in any thread, including
+      those of async views (see run_query_wrappers()).
+    """
+    for alias in connections:
+        install_query_wrappers(connections[alias])
+    token = _query_wrappers.set((*_query_wrappers.get(), wrapper))
+    try:
+        yield
+    finally:
+        _query_wrappers.reset(token)
+
+
+class MetricsMiddleware(AsyncCapableMiddleware):
+    """
+    Middleware recording per-route request metrics.
+
+    - Records request count, latency, DB query count and DB time, keyed by
+      the resolved route name (e.g. board-list) and the HTTP method.
+    - Requests that do not resolve to a route are recorded as "unmatched".
+    - Disabled when settings.METRICS_ENABLED is False.
+    """
+
+    @contextmanager
+    def wrap(self, request):
+        call = SimpleNamespace(response=None)
+        if not settings.METRICS_ENABLED:
+            yield call
+            return
+
+        query_stats = QueryStats()
+        start = time.perf_counter()
+        with wrap_all_connections(query_stats):
+            yield call
+        duration = time.perf_counter() - start
+
+        match = getattr(request, 'resolver_match', None)
+        route = match.view_name if match and match.view_name else 'unmatched'
+        metrics.registry.record(
+            route, request.method, duration, query_stats.count, query_stats.duration
+        )
+
+        aggregator = metrics.get_aggregator()
+        if aggregator is not None:
+            aggregator.maybe_flush(metrics.registry)
+
+
+class ProfilingMiddleware(AsyncCapableMiddleware):
+    """
+    Middleware running single requests under cProfile on demand.
+
+    - Only when PROFILING_DIR is set, the request sends X-Profile: 1 (or
+      ?profile=1) and it comes from a staff user's token or session.
+    - The profile is stored with core.profiling.save_profile() under the
+      resolved route name (e.g. board-detail), and the response gets an
+      X-Profile-Id header with the file name; "manage.py profiles" lists
+      and summarizes the stored files.
+    - Other requests only pay for the header and query-string check.
+    - Under ASGI, coroutines of other requests running on the same event
+      loop show up in the profile as well, and the staff check uses
+      core.profiling.ais_staff_request() so it does not block the loop.
+    """
+
+    @contextmanager
+    def wrap(self, request):
+        requested = profiling.is_requested(request) and profiling.is_staff_request(request)
+        with self.profiled(request, requested) as call:
+            yield call
+
+    async def __acall__(self, request):
+        requested = profiling.is_requested(request) and await profiling.ais_staff_request(request)
+        with self.profiled(request, requested) as call:
+            call.response = await self.get_response(request)
+        return call.response
+
+    @contextmanager
+    def profiled(self, request, requested):
+        call = SimpleNamespace(response=None)
+        profile = profiling.start_profile() if requested else None
+        if profile is None:
+            yield call
+            return
+        try:
+            yield call
+        finally:
+            profile.disable()
+
+        match = getattr(request, 'resolver_match', None)
+        route = match.view_name if match and match.view_name else 'unmatched'
+        call.response['X-Profile-Id'] = profiling.save_profile(profile, route, request.method)
+
+
+class NPlusOneDetected(Exception):
+    """Raised by NPlusOneMiddleware when NPLUSONE_RAISE is enabled."""
+
+
+_IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_sql(sql):
+    """
+    Reduce a SQL statement to its shape.
+
+    - Literals become "?" and IN lists of any length become "IN (...)", so
+      queries that only differ by their parameters share a shape.
+    """
+    shape = _IN_LIST.sub('IN (...)', sql)
+    shape = _LITERALS.sub('?', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+
+def project_stack(limit=8):
+    """
+    Return the innermost project frames of the current Python stack.
+
+    - Frames from installed packages and from this module are skipped, so
+      the stack points at the serializer or view that issued the query.
+    """
+    base_dir = str(settings.BASE_DIR)
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None and len(frames) < limit:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(base_dir)
+            and 'site-packages' not in filename
+            and filename != __file__
+        ):
+            frames.append(
+                f'{os.path.relpath(filename, base_dir)}:{frame.f_lineno} '
+                f'in {frame.f_code.co_name}'
+            )
+        frame = frame.f_back
+    return tuple(frames)
+
+
+class QueryShapeRecorder:
+    """
+    Execute wrapper grouping executed SQL by statement shape.
+
+    - Shapes are counted per database: the same query once per shard of a
+      fan-out (core.sharding) is not an N+1 pattern. Shapes of other
+      databases than the default one are prefixed with "[<alias>] ".
+    """
+
+    def __init__(self):
+        self.shapes = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        shape = normalize_sql(sql)
+        alias = context['connection'].alias
+        if alias != DEFAULT_DB_ALIAS:
+            shape = f'[{alias}] {shape}'
+        entry = self.shapes.get(shape)
+        if entry is None:
+            entry = self.shapes[shape] = {'count': 0, 'stacks': {}}
+        entry['count'] += 1
+        stack = project_stack()
+        entry['stacks'][stack] = entry['stacks'].get(stack, 0) + 1
+        return execute(sql, params, many, context)
+
+    def repeated(self, threshold):
+        """Return (shape, count, stack) for shapes executed threshold+ times."""
+        findings = []
+        for shape, entry in self.shapes.items():
+            if entry['count'] < threshold:
+                continue
+            stack = max(entry['stacks'], key=entry['stacks'].get)
+            findings.append((shape, entry['count'], stack))
+        return sorted(findings, key=lambda finding: -finding[1])
+
+
+class NPlusOneMiddleware(AsyncCapableMiddleware):
+    """
+    Development-time detector for N+1 query patterns.
+
+    - Active when settings.NPLUSONE_ENABLED is set (defaults to DEBUG).
+    - Groups the SQL of a request by normalized statement shape and flags
+      shapes executed NPLUSONE_THRESHOLD or more times, e.g. a
+      SerializerMethodField calling obj.members.count() per board.
+    - Logs every finding with the project stack that triggered it to the
+      "kanmind.nplusone" logger.
+    - With NPLUSONE_RAISE the request fails with NPlusOneDetected, which
+      lets tests catch regressions.
+    """
+
+    @contextmanager
+    def wrap(self, request):
+        call = SimpleNamespace(response=None)
+        if not settings.NPLUSONE_ENABLED:
+            yield call
+            return
+
+        recorder = QueryShapeRecorder()
+        with wrap_all_connections(recorder):
+            yield call
+
+        findings = recorder.repeated(settings.NPLUSONE_THRESHOLD)
+        if findings:
+            report = self.format_report(request, findings)
+            logger.warning(report)
+            if settings.NPLUSONE_RAISE:
+                raise NPlusOneDetected(report)
+
+    def format_report(self, request, findings):
+        lines = [f'Possible N+1 queries in {request.method} {request.path}:']
+        for shape, count, stack in findings:
+            lines.append(f'- {count}x {shape}')
+            lines.extend(f'    {frame}' for frame in stack)
+        return '\n'.join(lines)
@@ -0,0 +1,15 @@
+from django.db import models
+
+
+class IdSequence(models.Model):
+    """
+    A named counter on the default database handing out ids.
+
+    - Used by core.sharding to give boards and tasks ids that are unique
+      across all shards; value is the last number handed out.
+    """
+    name = models.CharField(max_length=100, primary_key=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f'{self.name}: {self.value}'
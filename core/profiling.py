@@ -0,0 +1,138 @@
+import cProfile
+import os
+import pstats
+import re
+from datetime import datetime, timezone
+
+from django.conf import settings
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+
+
+TIMESTAMP_FORMAT = '%Y%m%dT%H%M%S%fZ'
+_FILENAME = re.compile(r'^(?P<timestamp>\d{8}T\d{12}Z)-(?P<method>[A-Z]+)-(?P<route>.+)\.prof$')
+_UNSAFE = re.compile(r'[^\w.-]')
+
+
+def is_requested(request):
+    """
+    Whether request asks to be profiled (X-Profile: 1 header or ?profile=1).
+
+    - Only reads the header and the query string, so requests that do not
+      ask cost nothing more.
+    """
+    flag = request.META.get('HTTP_X_PROFILE') or request.GET.get('profile')
+    return bool(settings.PROFILING_DIR) and flag in ('1', 'true')
+
+
+def _token_key(request):
+    """
+    Return the key of an "Authorization: Token <key>" header, or None.
+
+    - Undecodable keys become '', which matches no token.
+    """
+    header = get_authorization_header(request).split()
+    if len(header) != 2 or header[0].lower() != b'token':
+        return None
+    try:
+        return header[1].decode()
+    except UnicodeError:
+        return ''
+
+
+def is_staff_request(request):
+    """
+    Whether request carries a staff user's API token or session.
+
+    - Runs before DRF authenticates the request, so the token is looked up
+      here (one query, only for requests asking to be profiled).
+    """
+    key = _token_key(request)
+    if key is not None:
+        try:
+            user, _ = TokenAuthentication().authenticate_credentials(key)
+        except AuthenticationFailed:
+            return False
+        return user.is_staff
+    user = getattr(request, 'user', None)
+    return bool(user is not None and user.is_authenticated and user.is_staff)
+
+
+async def ais_staff_request(request):
+    """
+    Async variant of is_staff_request() for the ASGI stack.
+
+    - Looks the token up with aget() and the session user with
+      request.auser(), so no ORM call runs in the event loop.
+    """
+    key = _token_key(request)
+    if key is not None:
+        try:
+            token = await Token.objects.select_related('user').aget(key=key)
+        except Token.DoesNotExist:
+            return False
+        return token.user.is_active and token.user.is_staff
+    auser = getattr(request, 'auser', None)
+    user = await auser() if auser is not None else None
+    return bool(user is not None and user.is_authenticated and user.is_staff)
+
+
+def start_profile():
+    """
+    Start and return a cProfile.Profile, or None if another profiler is active.
+    """
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        return None
+    return profile
+
+
+def save_profile(profile, route, method, when=None):
+    """
+    Write the pstats data of profile to PROFILING_DIR and return the file name.
+
+    - Named <UTC timestamp>-<method>-<route>.prof, so list_profiles() needs
+      no index and `python -m pstats <file>` opens any of them.
+    - Keeps the newest PROFILING_MAX_FILES files and deletes older ones.
+    """
+    when = when or datetime.now(timezone.utc)
+    directory = str(settings.PROFILING_DIR)
+    os.makedirs(directory, exist_ok=True)
+    name = f'{when.strftime(TIMESTAMP_FORMAT)}-{method}-{_UNSAFE.sub("_", route)}.prof'
+    profile.dump_stats(os.path.join(directory, name))
+    for old in list_profiles(directory)[settings.PROFILING_MAX_FILES:]:
+        os.remove(old['path'])
+    return name
+
+
+def list_profiles(directory=None):
+    """
+    Return the stored profiles, newest first.
+
+    - Each entry has name, path, timestamp (UTC datetime), method and route.
+    """
+    directory = str(directory or settings.PROFILING_DIR)
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for name in os.listdir(directory):
+        match = _FILENAME.match(name)
+        if match is None:
+            continue
+        profiles.append({
+            'name': name,
+            'path': os.path.join(directory, name),
+            'timestamp': datetime.strptime(match['timestamp'], TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc),
+            'method': match['method'],
+            'route': match['route'],
+        })
+    return sorted(profiles, key=lambda entry: entry['name'], reverse=True)
+
+
+def summarize(path):
+    """Return (total seconds, function calls, primitive calls) of a profile file."""
+    stats = pstats.Stats(path)
+    return stats.total_tt, stats.total_calls, stats.prim_calls
@@ -0,0 +1,64 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+
+def to_columns(data):
+    """
+    Convert every list of objects in data into the compact columnar form.
+
+    - A non-empty list of objects that all have the same keys becomes
+      {"columns": [key, ...], "rows": [[value, ...], ...]}, values in
+      column order. Nested values are converted the same way.
+    - Empty lists, lists of other values and lists of objects with
+      differing keys are kept as they are.
+    """
+    if isinstance(data, dict):
+        return {key: to_columns(value) for key, value in data.items()}
+    if isinstance(data, list):
+        if data and all(isinstance(item, dict) for item in data):
+            columns = list(data[0])
+            if all(item.keys() == data[0].keys() for item in data):
+                return {
+                    'columns': columns,
+                    'rows': [[to_columns(item[column]) for column in columns] for item in data],
+                }
+        return [to_columns(item) for item in data]
+    return data
+
+
+def from_columns(data):
+    """
+    Inverse of to_columns(): turn every {"columns", "rows"} object back into
+    a list of objects.
+    """
+    if isinstance(data, dict):
+        if data.keys() == {'columns', 'rows'}:
+            return [
+                dict(zip(data['columns'], (from_columns(value) for value in row)))
+                for row in data['rows']
+            ]
+        return {key: from_columns(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [from_columns(item) for item in data]
+    return data
+
+
+class CompactJSONRenderer(JSONRenderer):
+    """
+    JSON renderer sending lists of objects as a column header plus rows.
+
+    - Selected with "Accept: application/vnd.kanmind.compact+json", the
+      ?format=compact parameter or the .compact format suffix.
+    - The payload is the regular response passed through to_columns(), so
+      key names are sent once per list instead of once per object;
+      from_columns() restores the regular response.
+    """
+    media_type = 'application/vnd.kanmind.compact+json'
+    format = 'compact'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(to_columns(data), accepted_media_type, renderer_context)
+
+
+# Renderers of the views offering the compact format; JSON stays the default.
+COMPACT_RENDERER_CLASSES = [*api_settings.DEFAULT_RENDERER_CLASSES, CompactJSONRenderer]
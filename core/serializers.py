@@ -0,0 +1,36 @@
+import copy
+
+from django.conf import settings
+
+
+_field_cache = {}
+
+
+def clear_field_cache():
+    """Forget the fields stored by CachedFieldsMixin, e.g. between benchmarks."""
+    _field_cache.clear()
+
+
+class CachedFieldsMixin:
+    """
+    Serializer mixin building the fields of a serializer class only once.
+
+    - ModelSerializer.get_fields() introspects the model and builds every
+      field from scratch for each serializer instance, nested serializers
+      included. With this mixin the first instance of a class stores its
+      unbound fields; later instances get deep copies of them, the way
+      DRF already copies declared fields.
+    - Only for serializers whose get_fields() does not depend on the
+      instance, the data or the context. Mixins that adjust the fields per
+      request (SparseFieldsetMixin) go before this one, so they work on the
+      copy.
+    - SERIALIZER_FIELD_CACHE = False builds the fields every time.
+    """
+
+    def get_fields(self):
+        if not settings.SERIALIZER_FIELD_CACHE:
+            return super().get_fields()
+        fields = _field_cache.get(type(self))
+        if fields is None:
+            fields = _field_cache[type(self)] = super().get_fields()
+        return copy.deepcopy(fields)
@@ -49,17 +49,23 @@ INSTALLED_APPS = [
     'auth_app',
     'boards_app',
     'task_app',
+    'jobs_app',
+    'core',
 ]
 
 MIDDLEWARE = [
+    'core.middleware.MetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
+    'core.middleware.NPlusOneMiddleware',
 ]
 
 ROOT_URLCONF = 'core.urls'
@@ -92,6 +98,58 @@ DATABASES = {
     }
 }
 
+# Read replicas, e.g. DJANGO_DB_REPLICAS=replica1,replica2
+# Locally every replica alias is backed by its own SQLite file
+# (db.<alias>.sqlite3); tests mirror the replicas onto the default database.
+
+DATABASE_REPLICAS = [
+    alias.strip()
+    for alias in os.getenv('DJANGO_DB_REPLICAS', '').split(',')
+    if alias.strip()
+]
+
+for alias in DATABASE_REPLICAS:
+    DATABASES[alias] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / f'db.{alias}.sqlite3',
+        'TEST': {'MIRROR': 'default'},
+    }
+
+# Board shards, e.g. DJANGO_DB_SHARDS=shard0,shard1
+# Boards with their memberships, tasks and comments live on the shard
+# chosen by board id (core.sharding); users, tokens, jobs and sessions stay
+# on the default database. Locally every shard alias is backed by its own
+# SQLite file (db.<alias>.sqlite3). The list must not change once boards
+# exist, as ids map to shards by their position in it.
+
+DATABASE_SHARDS = [
+    alias.strip()
+    for alias in os.getenv('DJANGO_DB_SHARDS', '').split(',')
+    if alias.strip()
+]
+
+for alias in DATABASE_SHARDS:
+    DATABASES[alias] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / f'db.{alias}.sqlite3',
+    }
+
+DATABASE_ROUTERS = ['core.sharding.ShardRouter', 'core.db_routers.ReplicaRouter']
+
+# Seconds a client keeps reading from the primary after a write.
+REPLICA_STICKY_SECONDS = 5
+
+# Cache alias holding those pins. With replicas and more than one worker
+# process it must name a cache shared by all of them (e.g. Redis or
+# Memcached); the default LocMemCache only pins reads of the same process.
+REPLICA_PIN_CACHE = os.getenv('REPLICA_PIN_CACHE', 'default')
+
+# Seconds an unavailable replica is skipped before it is probed again.
+REPLICA_RETRY_SECONDS = 30
+
+# Models that are always read from the primary.
+REPLICA_PRIMARY_MODELS = ['authtoken.token', 'sessions.session']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -144,3 +202,105 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
 }
+
+# Per-route request metrics exposed at /metrics (Prometheus text format).
+
+METRICS_ENABLED = True
+
+# Directory shared by preforked workers, e.g. METRICS_DIR=/tmp/kanmind-metrics
+# Leave unset to keep metrics process-local.
+METRICS_DIR = os.getenv('METRICS_DIR')
+
+# Seconds between writes of a worker's snapshot to METRICS_DIR.
+METRICS_FLUSH_SECONDS = 5
+
+# Bearer token of the metrics scraper, e.g. METRICS_TOKEN=<random string>.
+# Without it, only staff users can read /metrics.
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
+# Development-time N+1 query detection (core.middleware.NPlusOneMiddleware).
+
+NPLUSONE_ENABLED = DEBUG
+
+# Number of executions of the same statement shape within one request
+# that is reported as a possible N+1 pattern.
+NPLUSONE_THRESHOLD = 3
+
+# Fail the request with NPlusOneDetected instead of only logging a warning.
+NPLUSONE_RAISE = False
+
+# Per-request cProfile capture (core.middleware.ProfilingMiddleware): staff
+# requests sending "X-Profile: 1" or ?profile=1 are profiled into this
+# directory, e.g. PROFILING_DIR=/var/tmp/kanmind-profiles. Unset turns the
+# trigger off. Only the newest PROFILING_MAX_FILES profiles are kept.
+PROFILING_DIR = os.getenv('PROFILING_DIR')
+PROFILING_MAX_FILES = 200
+
+# Done tasks completed more than this many days ago are moved to the
+# archive tables by "manage.py archive_tasks" (task_app.archive).
+
+TASK_ARCHIVE_AFTER_DAYS = 30
+
+# Tasks moved per archive transaction.
+TASK_ARCHIVE_BATCH_SIZE = 500
+
+# Background jobs (jobs_app), run by "manage.py run_worker".
+
+# Attempts per job before it is marked as failed.
+JOB_MAX_ATTEMPTS = 5
+
+# Delay before the first retry, doubled for every further attempt.
+JOB_RETRY_BACKOFF_SECONDS = 10
+JOB_RETRY_BACKOFF_MAX_SECONDS = 3600
+
+# Running jobs locked for longer are considered lost and run again.
+# Workers refresh the lock of a running job every JOB_HEARTBEAT_SECONDS,
+# which must stay well below the timeout.
+JOB_LOCK_TIMEOUT_SECONDS = 600
+JOB_HEARTBEAT_SECONDS = 60
+
+# Seconds a worker waits when no job is due.
+JOB_POLL_SECONDS = 1.0
+
+# Rows per transaction when deleting boards and users (core.deletion).
+DELETE_CHUNK_SIZE = 1000
+
+# /api/dashboard/: default and maximum "due soon" window in days, and
+# seconds a user's dashboard is cached.
+DASHBOARD_DUE_SOON_DAYS = 7
+DASHBOARD_MAX_DAYS = 90
+DASHBOARD_CACHE_SECONDS = 30
+
+# Bulk user provisioning (auth_app.provisioning): processes hashing the
+# passwords (0 for one per CPU), minimum passwords per process before a
+# pool is started, rows per bulk insert, and maximum rows per
+# POST /api/users/bulk/ request ("manage.py provision_users" has no limit).
+PROVISIONING_HASH_WORKERS = int(os.getenv('PROVISIONING_HASH_WORKERS', '0'))
+PROVISIONING_HASH_MIN_PER_WORKER = 8
+PROVISIONING_BATCH_SIZE = 1000
+PROVISIONING_MAX_ROWS = 1000
+
+# Token bucket throttling of login, registration and bulk provisioning
+# (core.throttling): '<requests>/<period>' per client IP, email or user. Buckets live in this
+# process unless THROTTLE_CACHE names a cache shared by all workers.
+THROTTLE_ENABLED = True
+THROTTLE_BUCKETS = {
+    'login': {'ip': '30/min', 'email': '5/min'},
+    'registration': {'ip': '10/min', 'email': '3/min'},
+    'provisioning': {'ip': '30/h', 'user': '10/h'},
+}
+THROTTLE_CACHE = os.getenv('THROTTLE_CACHE') or None
+THROTTLE_LOCAL_MAX_KEYS = 100_000
+
+# Admin changelists (core.admin.EstimatedCountPaginator): rows counted
+# exactly; larger unfiltered lists show the table estimate and larger
+# filtered lists stop counting here.
+ADMIN_COUNT_LIMIT = 10_000
+
+# Build the fields of a serializer class once and copy them for every
+# instance (core.serializers.CachedFieldsMixin).
+SERIALIZER_FIELD_CACHE = True
+
+# Reject task and board updates without an If-Match header (428) instead of
+# applying them to the version just read (core.concurrency).
+REQUIRE_IF_MATCH = False
@@ -0,0 +1,287 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import F
+
+from core.conditional import queryset_version
+from core.models import IdSequence
+
+
+# Models stored on the shard of their board, with the field holding the
+# board id (or the id of a task, which maps to the same shard).
+SHARD_KEYS = {
+    'boards_app.board': 'pk',
+    'boards_app.boardmembership': 'board_id',
+    'task_app.task': 'board_id',
+    'task_app.comment': 'task_id',
+    'task_app.archivedtask': 'board_id',
+    'task_app.archivedcomment': 'task_id',
+}
+
+# Global models with a copy on every shard, so that shard queries can join
+# them (e.g. select_related('assignee')).
+COPIED_MODELS = {'auth_app.user'}
+
+_current_shard = ContextVar('current_shard', default=None)
+
+
+class ShardNotSelected(Exception):
+    """Raised by ShardRouter for board data queried without a shard."""
+
+
+def shard_for(key):
+    """
+    Return the shard alias holding the board or task with id key.
+
+    - Board and task ids are handed out by new_id(), so id % shard count
+      is the index of the board's shard in DATABASE_SHARDS.
+    - Returns None without sharding or without a key.
+    """
+    shards = settings.DATABASE_SHARDS
+    if not shards or key is None:
+        return None
+    return shards[int(key) % len(shards)]
+
+
+def parse_key(value):
+    """Return value as a board or task id, or None if it is not one."""
+    value = str(value) if value is not None else ''
+    return int(value) if value.isdigit() else None
+
+
+def current_shard():
+    return _current_shard.get()
+
+
+@contextmanager
+def use_shard(alias):
+    """
+    Send the board data queries of the block to shard alias.
+
+    - Queries that carry a board, task or comment instance (related
+      managers, save(), delete()) find their shard without this.
+    - alias None leaves the current selection unchanged.
+    """
+    if alias is None:
+        yield
+        return
+    token = _current_shard.set(alias)
+    try:
+        yield
+    finally:
+        _current_shard.reset(token)
+
+
+def _fan_out_aliases():
+    shard = _current_shard.get()
+    if not settings.DATABASE_SHARDS or shard is not None:
+        return [None]
+    return settings.DATABASE_SHARDS
+
+
+def fan_out(func, *args, **kwargs):
+    """
+    Call func once per shard, with that shard selected; return the results.
+
+    - With a shard already selected, or without sharding, func is called
+      once as is, so fan-out costs nothing in an unsharded setup.
+    - func must evaluate its querysets: a queryset picks its database when
+      it runs, not when it is built.
+    """
+    results = []
+    for alias in _fan_out_aliases():
+        with use_shard(alias):
+            results.append(func(*args, **kwargs))
+    return results
+
+
+async def afan_out(func, *args, **kwargs):
+    """Like fan_out() for a coroutine function func; the shards are queried in turn."""
+    results = []
+    for alias in _fan_out_aliases():
+        with use_shard(alias):
+            results.append(await func(*args, **kwargs))
+    return results
+
+
+def merge(results, key=None, reverse=False):
+    """
+    Concatenate the per-shard lists of fan_out() into one list.
+
+    - Sorted by key when rows of more than one shard are merged; a single
+      shard's list keeps the database order.
+    """
+    if len(results) == 1:
+        return list(results[0])
+    rows = [row for result in results for row in result]
+    if key is not None:
+        rows.sort(key=key, reverse=reverse)
+    return rows
+
+
+def fan_out_serialize(serializer_class, queryset, context, key=None, reverse=False):
+    """
+    Serialize queryset on every shard and merge the rendered items.
+
+    - key(obj) orders the merged items, like the queryset's ordering does
+      on one database.
+    - Returns (serializer of the last shard, items); the serializers
+      share context, so sideload() of the returned one covers all shards.
+    """
+    def serialize():
+        objects = list(queryset.all())
+        serializer = serializer_class(objects, many=True, context=context)
+        return serializer, list(zip(objects, serializer.data))
+
+    results = fan_out(serialize)
+    pairs = merge(
+        [pairs for _, pairs in results],
+        key=None if key is None else lambda pair: key(pair[0]),
+        reverse=reverse,
+    )
+    return results[-1][0], [item for _, item in pairs]
+
+
+def fan_out_version(queryset, field):
+    """queryset_version() over every shard: the latest field value and the total count."""
+    states = fan_out(queryset_version, queryset, field)
+    modified = [last_modified for last_modified, _ in states if last_modified is not None]
+    return max(modified, default=None), sum(count for _, count in states)
+
+
+def next_value(name):
+    """
+    Increment the IdSequence name and return its new value.
+
+    - One UPDATE and one SELECT in a transaction on the default database;
+      concurrent callers wait for the row lock and get distinct values.
+    """
+    using = router.db_for_write(IdSequence)
+    with transaction.atomic(using=using):
+        sequences = IdSequence.objects.using(using).filter(name=name)
+        if not sequences.update(value=F('value') + 1):
+            _, created = IdSequence.objects.using(using).get_or_create(name=name, defaults={'value': 1})
+            if not created:
+                sequences.update(value=F('value') + 1)
+        return sequences.values_list('value', flat=True).get()
+
+
+def new_id(name, shard=None):
+    """
+    Return a new id for model label name that maps to shard.
+
+    - Ids are number * shard count + shard index, with number from the
+      IdSequence name, so they are unique across shards and shard_for(id)
+      is shard. Without shard, the shards are used in turn.
+    - Returns None without sharding (the database assigns the id).
+    """
+    shards = settings.DATABASE_SHARDS
+    if not shards:
+        return None
+    number = next_value(name)
+    index = shards.index(shard) if shard is not None else number % len(shards)
+    return number * len(shards) + index
+
+
+def copy_to_shards(objects):
+    """
+    Write copies of global rows (users) to every shard.
+
+    - One upsert per shard; existing copies are overwritten.
+    - Called by User.save() and after bulk inserts of users.
+    """
+    objects = list(objects)
+    if not settings.DATABASE_SHARDS or not objects:
+        return
+    model = type(objects[0])
+    fields = model._meta.concrete_fields
+    copies = [model(**{field.attname: getattr(obj, field.attname) for field in fields}) for obj in objects]
+    for alias in settings.DATABASE_SHARDS:
+        features = connections[alias].features
+        model._base_manager.using(alias).bulk_create(
+            copies,
+            update_conflicts=True,
+            unique_fields=[model._meta.pk.name] if features.supports_update_conflicts_with_target else None,
+            update_fields=[field.name for field in fields if not field.primary_key],
+        )
+
+
+class ShardRouter:
+    """
+    Database router placing board data on the shard of its board.
+
+    - Active when settings.DATABASE_SHARDS lists shard aliases; otherwise
+      it defers to the next router.
+    - Boards, memberships, tasks, comments and their archive rows
+      (SHARD_KEYS) live on shard_for(board id). The shard comes from the
+      instance a query concerns (its database, or its board or task id),
+      else from use_shard(); without either ShardNotSelected is raised.
+    - Everything else (users, tokens, jobs, sessions) lives on the default
+      database; the next router decides (ReplicaRouter). Users also have a
+      copy on every shard (copy_to_shards()), which is read when the query
+      comes from a shard row (task.assignee, board.members).
+    - Every database gets the full schema, so a shard can join its copy
+      of the users.
+    """
+
+    def shard(self, model, hints):
+        instance = hints.get('instance')
+        label = model._meta.label_lower
+        if instance is not None and instance._state.db in settings.DATABASE_SHARDS:
+            if label in SHARD_KEYS or label in COPIED_MODELS:
+                return instance._state.db
+        if label not in SHARD_KEYS:
+            return None
+        if instance is not None:
+            key_field = SHARD_KEYS.get(instance._meta.label_lower)
+            key = getattr(instance, key_field) if key_field else None
+            if key is not None:
+                return shard_for(key)
+        shard = _current_shard.get()
+        if shard is None:
+            raise ShardNotSelected(
+                f'No shard selected for {model._meta.label}; use core.sharding.use_shard() or fan_out().'
+            )
+        return shard
+
+    def db_for_read(self, model, **hints):
+        if not settings.DATABASE_SHARDS:
+            return None
+        return self.shard(model, hints)
+
+    def db_for_write(self, model, **hints):
+        if not settings.DATABASE_SHARDS or model._meta.label_lower not in SHARD_KEYS:
+            return None
+        return self.shard(model, hints)
+
+
+class ShardSelectionMixin:
+    """
+    View mixin selecting the shard of the board a request is about.
+
+    - shard_key(request, **kwargs) returns the board or task id named by
+      the URL or the request data, or None; the shard of that id is
+      selected for the whole request (use_shard()).
+    - The shard is selected once the request is authenticated, and only
+      with sharding; without a key, handlers fan out (fan_out()).
+    """
+
+    def shard_key(self, request, **kwargs):
+        return None
+
+    def initial(self, request, *args, **kwargs):
+        self._shard_token = None
+        super().initial(request, *args, **kwargs)
+        if settings.DATABASE_SHARDS:
+            alias = shard_for(parse_key(self.shard_key(request, **kwargs)))
+            if alias is not None:
+                self._shard_token = _current_shard.set(alias)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, '_shard_token', None)
+        if token is not None:
+            _current_shard.reset(token)
+            self._shard_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
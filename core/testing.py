@@ -0,0 +1,167 @@
+import os
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+
+from core.benchmarks import (
+    api_route_names,
+    build_scenarios,
+    get_client,
+    run_scenario,
+    select_dataset_objects,
+)
+from core.datasets import flush_dataset, generate_dataset
+
+
+DATASET_SIZES = {
+    'small': dict(
+        users=12, boards=2, members_per_board=3,
+        tasks_per_board=3, comments_per_task=1, archived_tasks_per_board=1, seed=1
+    ),
+    'large': dict(
+        users=40, boards=4, members_per_board=12,
+        tasks_per_board=25, comments_per_task=4, archived_tasks_per_board=5, seed=1
+    ),
+}
+
+
+def token_login(client, user):
+    """
+    Authenticate an APIClient with the user's API token.
+
+    - The async views only accept real tokens, not force_authenticate().
+    """
+    token, _ = Token.objects.get_or_create(user=user)
+    client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+
+def format_queries(queries):
+    return '\n'.join(
+        f'  {number}. {query["sql"]}'
+        for number, query in enumerate(queries, start=1)
+    )
+
+
+class QueryBudgetMixin:
+    """
+    TestCase mixin asserting per-route query budgets.
+
+    - query_budgets maps (route name, HTTP method) to the maximum number of
+      queries, either as an int or as {dataset size: int}.
+    - Every route in core/urls.py is exercised against every dataset in
+      dataset_sizes using the scenarios from core.benchmarks.
+    - A route fails if it exceeds its budget or if its query count grows
+      with the dataset size; the failure message lists the executed SQL.
+    """
+    query_budgets = {}
+    dataset_sizes = DATASET_SIZES
+
+    def get_budget(self, key, size):
+        budget = self.query_budgets[key]
+        if isinstance(budget, dict):
+            return budget[size]
+        return budget
+
+    @override_settings(THROTTLE_ENABLED=False)
+    def measure_routes(self, size):
+        """
+        Generate the dataset for size and capture the SQL of every scenario.
+
+        - Login and registration throttling is off while measuring.
+        """
+        flush_dataset()
+        generate_dataset(**self.dataset_sizes[size])
+        # Measure cold caches (e.g. the dashboard) on every dataset.
+        cache.clear()
+        objects = select_dataset_objects()
+        client = get_client(objects.user, staff=True)
+
+        captured = {}
+        for scenario in build_scenarios(*objects):
+            with CaptureQueriesContext(connection) as queries:
+                response, _, _ = run_scenario(client, scenario)
+            self.assertLess(
+                response.status_code, 400,
+                f'{scenario.route} {scenario.method.upper()} failed '
+                f'with {response.status_code}'
+            )
+            captured[(scenario.route, scenario.method.upper())] = [
+                query for query in queries.captured_queries
+                if not query['sql'].startswith(('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT'))
+            ]
+        return captured
+
+    def assertEveryRouteHasBudget(self):
+        covered = {route for route, _ in self.query_budgets}
+        missing = api_route_names() - covered
+        self.assertFalse(missing, f'Routes without a query budget: {sorted(missing)}')
+
+    def assertQueryBudgets(self):
+        self.assertEveryRouteHasBudget()
+        counts = {}
+        for size in self.dataset_sizes:
+            for key, queries in self.measure_routes(size).items():
+                label = f'{key[0]} {key[1]} ({size} dataset)'
+                self.assertIn(key, self.query_budgets, f'No query budget for {label}')
+                budget = self.get_budget(key, size)
+                self.assertLessEqual(
+                    len(queries), budget,
+                    f'{label} executed {len(queries)} queries, budget is {budget}:\n'
+                    + format_queries(queries)
+                )
+                counts.setdefault(key, []).append((size, queries))
+
+        for key, runs in counts.items():
+            (first_size, first), *others = runs
+            for size, queries in others:
+                self.assertEqual(
+                    len(queries), len(first),
+                    f'{key[0]} {key[1]} query count grows with the dataset: '
+                    f'{len(first)} ({first_size}) vs {len(queries)} ({size}):\n'
+                    + format_queries(queries)
+                )
+
+
+class ShardedTestCase(TestCase):
+    """
+    TestCase running with DATABASE_SHARDS set to shard_aliases.
+
+    - Every shard is a temporary SQLite file, migrated once per class.
+    - The shards join databases only once the class is set up, so the test
+      runner does not try to create them; each test then runs in a
+      rolled back transaction on every shard, as on the default database.
+      Create shard data in setUp(), not in setUpTestData().
+    """
+    shard_aliases = ['shard0', 'shard1']
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.unsharded_databases = cls.databases
+        cls.databases = {*cls.databases, *cls.shard_aliases}
+        cls.shard_directory = tempfile.mkdtemp()
+        for alias in cls.shard_aliases:
+            connections.settings[alias] = {
+                **connections.settings[DEFAULT_DB_ALIAS],
+                'NAME': os.path.join(cls.shard_directory, f'{alias}.sqlite3'),
+            }
+            call_command('migrate', database=alias, verbosity=0)
+        cls.shard_settings = override_settings(DATABASE_SHARDS=cls.shard_aliases)
+        cls.shard_settings.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.shard_settings.disable()
+        for alias in cls.shard_aliases:
+            connections[alias].close()
+            del connections[alias]
+            del connections.settings[alias]
+        shutil.rmtree(cls.shard_directory)
+        cls.databases = cls.unsharded_databases
+        super().tearDownClass()
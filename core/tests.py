@@ -0,0 +1,1150 @@
+"""
+Test suite for the core project package.
+
+Covers:
+- Read-replica router: replica selection, stickiness after writes,
+  primary-only models and fallback to the primary.
+- Metrics: per-route recording, Prometheus exposition and the
+  file-backed aggregator.
+- Synthetic datasets and the endpoint benchmark suite.
+- Query budgets for every API route.
+- Development-time N+1 detection.
+- Opt-in per-request cProfile capture and the profiles command.
+- Chunked cascade deletion of boards and users.
+- Sparse fieldsets: parsing of ?fields= and ?expand=.
+- Compact columnar JSON: conversion in both directions.
+- Serializer field cache (core.serializers) and its microbenchmark.
+- Token buckets (core.throttling) and the login flood load test.
+- Admin changelists: estimated counts, joined rows, index friendly search
+  and filters that do not load related tables.
+- Board sharding: placement by board id, shard selection per request,
+  fan-out lists and user copies on two SQLite shards.
+"""
+
+import json
+import sqlite3
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache, caches
+from django.core.paginator import Paginator
+from django.core.management import call_command
+from django.db import connection, connections
+from django.db.utils import ConnectionHandler
+from django.test.utils import CaptureQueriesContext
+from django.test import AsyncClient, RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from auth_app.models import User
+from boards_app.models import Board, BoardMembership
+from core import db_routers, metrics
+from core.admin import EstimatedCountPaginator
+from core.benchmarks import (
+    api_route_names,
+    build_scenarios,
+    measure_login_flood,
+    measure_serializers,
+    percentile,
+    select_dataset_objects,
+)
+from core.datasets import DATASET_EMAIL_DOMAIN, generate_dataset
+from core.deletion import chunked_delete, chunked_delete_copied
+from core.fieldsets import ALL_FIELDS, FieldSelection, parse_paths
+from core.middleware import NPlusOneDetected, get_client_key, normalize_sql
+from core.profiling import list_profiles
+from core.renderers import from_columns, to_columns
+from core.serializers import clear_field_cache
+from core.sharding import ShardNotSelected, new_id, shard_for, use_shard
+from core.testing import QueryBudgetMixin, ShardedTestCase, token_login
+from core.throttling import LocalBucketStore, parse_rate, take_token
+from boards_app.membership import shares_board
+from task_app.api.serializers import CommentSerializer, TaskReadSerializer
+from task_app.archive import archive_done_tasks
+from task_app.models import ArchivedTask, Comment, Task
+
+
+class ReplicaRouterTests(TestCase):
+    """Tests for ReplicaRouter using SQLite files standing in for replicas."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        tmp_path = Path(self.tmp.name)
+        for name in ('replica1', 'replica2'):
+            sqlite3.connect(tmp_path / f'{name}.sqlite3').close()
+
+        handler = ConnectionHandler({
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': tmp_path / 'primary.sqlite3',
+            },
+            'local_replica1': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': tmp_path / 'replica1.sqlite3',
+            },
+            'local_replica2': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': tmp_path / 'replica2.sqlite3',
+            },
+            'local_missing': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': tmp_path / 'missing' / 'replica.sqlite3',
+            },
+        })
+        self.addCleanup(handler.close_all)
+        patcher = mock.patch.object(db_routers, 'connections', handler)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        db_routers.reset_replica_health()
+        self.addCleanup(db_routers.reset_replica_health)
+        cache.clear()
+        self.router = db_routers.ReplicaRouter()
+
+    def read_with_replicas(self, model=Board):
+        token = db_routers.allow_replica_reads(True)
+        try:
+            return self.router.db_for_read(model)
+        finally:
+            db_routers.reset_replica_reads(token)
+
+    @override_settings(DATABASE_REPLICAS=['local_replica1', 'local_replica2'])
+    def test_reads_use_replica_when_enabled(self):
+        self.assertIn(
+            self.read_with_replicas(),
+            ['local_replica1', 'local_replica2']
+        )
+
+    @override_settings(DATABASE_REPLICAS=['local_replica1', 'local_replica2'])
+    def test_reads_use_primary_outside_request(self):
+        self.assertEqual(self.router.db_for_read(Board), 'default')
+
+    @override_settings(DATABASE_REPLICAS=['local_replica1'])
+    def test_writes_use_primary(self):
+        token = db_routers.allow_replica_reads(True)
+        try:
+            self.assertEqual(self.router.db_for_write(Board), 'default')
+        finally:
+            db_routers.reset_replica_reads(token)
+
+    @override_settings(DATABASE_REPLICAS=['local_replica1'])
+    def test_primary_only_models(self):
+        self.assertEqual(self.read_with_replicas(Token), 'default')
+
+    @override_settings(DATABASE_REPLICAS=['local_missing', 'local_replica2'])
+    def test_unavailable_replica_is_skipped(self):
+        for _ in range(5):
+            self.assertEqual(self.read_with_replicas(), 'local_replica2')
+
+    @override_settings(DATABASE_REPLICAS=['local_missing'])
+    def test_fallback_to_primary(self):
+        self.assertEqual(self.read_with_replicas(), 'default')
+
+
+class ReplicaStickinessTests(TestCase):
+    """Tests for read-your-writes pinning by ReplicaRoutingMiddleware."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='owner@test.com',
+            email='owner@test.com',
+            password='pass123'
+        )
+        token = Token.objects.create(user=self.user)
+        self.auth = f'Token {token.key}'
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth)
+        self.client_key = get_client_key(
+            mock.Mock(META={'HTTP_AUTHORIZATION': self.auth}, COOKIES={})
+        )
+
+    def test_write_pins_client_to_primary(self):
+        self.assertFalse(db_routers.is_pinned_to_primary(self.client_key))
+
+        response = self.client.post(reverse('board-list'), {'title': 'New'})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(db_routers.is_pinned_to_primary(self.client_key))
+
+    def test_read_does_not_pin_client(self):
+        response = self.client.get(reverse('board-list'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(db_routers.is_pinned_to_primary(self.client_key))
+
+    def test_failed_write_does_not_pin_client(self):
+        response = self.client.post(reverse('board-list'), {})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(db_routers.is_pinned_to_primary(self.client_key))
+
+    @override_settings(
+        CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+            'pins': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'pins',
+            },
+        },
+        REPLICA_PIN_CACHE='pins',
+    )
+    def test_pins_live_in_replica_pin_cache(self):
+        response = self.client.post(reverse('board-list'), {'title': 'New'})
+
+        self.assertEqual(response.status_code, 201)
+        key = db_routers.PIN_CACHE_PREFIX + self.client_key
+        self.assertTrue(caches['pins'].get(key))
+        self.assertIsNone(caches['default'].get(key))
+        self.assertTrue(db_routers.is_pinned_to_primary(self.client_key))
+
+
+class MetricsTests(TestCase):
+    """Tests for MetricsMiddleware and the /metrics endpoint."""
+
+    def setUp(self):
+        metrics.registry.reset()
+        self.addCleanup(metrics.registry.reset)
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='owner@test.com',
+            email='owner@test.com',
+            password='pass123'
+        )
+        Board.objects.create(title='Board', owner=self.user)
+        self.client.force_authenticate(user=self.user)
+
+    def test_records_requests_per_route(self):
+        self.client.get(reverse('board-list'))
+        self.client.get(reverse('board-list'))
+
+        stats = metrics.registry.snapshot()[('board-list', 'GET')]
+        self.assertEqual(stats[metrics.REQUESTS], 2)
+        self.assertGreater(stats[metrics.DB_QUERIES], 0)
+        self.assertGreater(stats[metrics.LATENCY_SUM], 0)
+
+    def test_unresolved_requests_are_grouped(self):
+        self.client.get('/does-not-exist/')
+
+        self.assertIn(('unmatched', 'GET'), metrics.registry.snapshot())
+
+    @override_settings(METRICS_TOKEN='scrape-secret')
+    def test_metrics_endpoint_prometheus_format(self):
+        self.client.get(reverse('task-assigned-to-me'))
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-secret')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        body = response.content.decode()
+        labels = 'route="task-assigned-to-me",method="GET"'
+        self.assertIn('# TYPE kanmind_http_request_duration_seconds histogram', body)
+        self.assertIn(f'kanmind_http_requests_total{{{labels}}} 1', body)
+        self.assertIn(
+            f'kanmind_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1',
+            body
+        )
+        self.assertIn(f'kanmind_db_queries_total{{{labels}}}', body)
+
+    @override_settings(METRICS_TOKEN='scrape-secret')
+    def test_metrics_endpoint_rejects_other_clients(self):
+        Token.objects.create(user=self.user)
+        anonymous = APIClient()
+
+        self.assertEqual(anonymous.get('/metrics').status_code, 403)
+        self.assertEqual(anonymous.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        self.assertEqual(
+            anonymous.get('/metrics', HTTP_AUTHORIZATION=f'Token {self.user.auth_token.key}').status_code, 403
+        )
+
+    @override_settings(METRICS_TOKEN=None)
+    def test_metrics_endpoint_allows_staff_without_token(self):
+        self.assertEqual(APIClient().get('/metrics').status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        token = Token.objects.create(user=self.user)
+        response = APIClient().get('/metrics', HTTP_AUTHORIZATION=f'Token {token.key}')
+
+        self.assertEqual(response.status_code, 200)
+
+    async def test_records_queries_of_async_views(self):
+        token = await Token.objects.acreate(user=self.user)
+        response = await AsyncClient().get(
+            reverse('async-board-list'), headers={'Authorization': f'Token {token.key}'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        stats = metrics.registry.snapshot()[('async-board-list', 'GET')]
+        self.assertEqual(stats[metrics.DB_QUERIES], 2)
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_metrics_disabled(self):
+        self.client.get(reverse('board-list'))
+
+        self.assertEqual(metrics.registry.snapshot(), {})
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+
+
+class MetricsRegistryTests(TestCase):
+    """Tests for histogram bucketing and the file-backed aggregator."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = metrics.MetricsRegistry(buckets=(0.1, 1.0))
+        registry.record('board-list', 'GET', 0.05, 1, 0.01)
+        registry.record('board-list', 'GET', 0.5, 1, 0.01)
+        registry.record('board-list', 'GET', 5.0, 1, 0.01)
+
+        body = metrics.render_prometheus(registry.snapshot(), buckets=(0.1, 1.0))
+
+        labels = 'route="board-list",method="GET"'
+        self.assertIn(f'_bucket{{{labels},le="0.1"}} 1', body)
+        self.assertIn(f'_bucket{{{labels},le="1.0"}} 2', body)
+        self.assertIn(f'_bucket{{{labels},le="+Inf"}} 3', body)
+        self.assertIn(f'kanmind_db_queries_total{{{labels}}} 3', body)
+
+    def test_file_aggregator_merges_workers(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        aggregator = metrics.FileAggregator(tmp.name, flush_interval=0)
+
+        registry = metrics.MetricsRegistry()
+        registry.record('board-list', 'GET', 0.01, 4, 0.002)
+        aggregator.flush(registry)
+        other_worker = Path(tmp.name) / 'metrics-99999999.json'
+        other_worker.write_text(Path(aggregator.path).read_text())
+
+        merged = aggregator.collect()
+
+        stats = merged[('board-list', 'GET')]
+        self.assertEqual(stats[metrics.REQUESTS], 2)
+        self.assertEqual(stats[metrics.DB_QUERIES], 8)
+
+
+class DatasetGeneratorTests(TestCase):
+    """Tests for the synthetic dataset generator."""
+
+    def dataset_fingerprint(self):
+        return (
+            list(Board.objects.order_by('id').values_list('title', 'owner__email')),
+            list(
+                Task.objects.order_by('id')
+                .values_list('status', 'priority', 'assignee__email', 'due_date')
+            ),
+            Comment.objects.count(),
+        )
+
+    def test_generates_requested_sizes(self):
+        summary = generate_dataset(
+            users=20, boards=3, members_per_board=5,
+            tasks_per_board=10, comments_per_task=2
+        )
+
+        self.assertEqual(summary['users'], 20)
+        self.assertEqual(Board.objects.count(), 3)
+        self.assertEqual(Task.objects.count(), 30)
+        self.assertEqual(summary['comments'], Comment.objects.count())
+        for board in Board.objects.all():
+            self.assertEqual(board.member_users().count(), 5)
+            self.assertNotIn(board.owner, board.member_users())
+
+    def test_same_seed_is_reproducible(self):
+        options = dict(users=15, boards=2, members_per_board=4, tasks_per_board=20)
+        generate_dataset(seed=7, **options)
+        first = self.dataset_fingerprint()
+
+        call_command(
+            'generate_dataset', users=15, boards=2, members=4, tasks=20,
+            comments=2, archived=0, seed=7, stdout=StringIO()
+        )
+
+        self.assertEqual(self.dataset_fingerprint(), first)
+        self.assertEqual(
+            User.objects.filter(email__endswith=DATASET_EMAIL_DOMAIN).count(), 15
+        )
+
+    def test_assignees_are_board_members(self):
+        generate_dataset(users=20, boards=2, members_per_board=3, tasks_per_board=30)
+
+        for task in Task.objects.exclude(assignee=None).select_related('board'):
+            allowed = set(task.board.members.values_list('id', flat=True))
+            self.assertIn(task.assignee_id, allowed)
+
+
+class BenchmarkTests(TestCase):
+    """Tests for the endpoint benchmark suite."""
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([3.0], 99), 3.0)
+
+    def test_run_benchmarks_covers_every_route(self):
+        generate_dataset(
+            users=10, boards=2, members_per_board=3,
+            tasks_per_board=5, comments_per_task=3, seed=1
+        )
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        output = Path(tmp.name) / 'bench.json'
+
+        call_command(
+            'run_benchmarks', iterations=2, warmup=0,
+            route=['board-list', 'board-detail', 'task-comments-detail'],
+            output=str(output), stdout=StringIO(), stderr=StringIO()
+        )
+
+        report = json.loads(output.read_text())
+        routes = report['routes']
+        self.assertEqual(report['meta']['dataset']['tasks'], 10)
+        self.assertEqual(
+            set(routes),
+            {
+                'board-list GET', 'board-list POST', 'board-detail GET',
+                'board-detail PATCH', 'board-detail DELETE',
+                'task-comments-detail GET', 'task-comments-detail DELETE',
+            }
+        )
+        for row in routes.values():
+            self.assertLess(row['status'], 400)
+            self.assertLessEqual(row['p50_ms'], row['p99_ms'])
+            self.assertGreater(row['queries'], 0)
+        self.assertEqual(Board.objects.count(), 2)
+
+    def test_every_api_route_has_a_scenario(self):
+        generate_dataset(
+            users=5, boards=1, members_per_board=2,
+            tasks_per_board=1, comments_per_task=1, archived_tasks_per_board=1, seed=3
+        )
+
+        scenarios = build_scenarios(*select_dataset_objects())
+
+        self.assertEqual(api_route_names() - {s.route for s in scenarios}, set())
+
+    def test_measure_serializers(self):
+        generate_dataset(users=5, boards=1, members_per_board=2, tasks_per_board=3, seed=4)
+        objects = select_dataset_objects()
+
+        results = measure_serializers(objects.board, objects.task, iterations=2)
+
+        self.assertEqual(
+            set(results), {'MemberSerializer', 'TaskReadSerializer', 'BoardDetailSerializer'})
+        for row in results.values():
+            for timings in row.values():
+                self.assertGreater(timings['uncached'], 0)
+                self.assertGreater(timings['cached'], 0)
+
+
+@override_settings(NPLUSONE_ENABLED=True, NPLUSONE_RAISE=True)
+class QueryBudgetTests(QueryBudgetMixin, TestCase):
+    """
+    Query budgets for every API route, checked on two dataset sizes.
+
+    - The N+1 detector is enabled, so repeated queries also fail the run.
+    """
+
+    query_budgets = {
+        ('registration', 'POST'): 6,
+        ('login', 'POST'): 3,
+        ('email-check', 'GET'): 2,
+        ('user-provisioning', 'POST'): 2,
+        ('board-list', 'GET'): 3,
+        ('board-list', 'POST'): 6,
+        ('board-detail', 'GET'): 5,
+        ('board-detail', 'PATCH'): 5,
+        ('board-detail', 'DELETE'): 14,
+        ('board-export', 'POST'): 3,
+        ('board-members-add', 'POST'): 6,
+        ('board-members-remove', 'POST'): 6,
+        ('board-columns', 'GET'): 4,
+        ('board-column', 'GET'): 4,
+        ('task-list', 'GET'): 3,
+        ('task-list', 'POST'): 6,
+        ('task-detail', 'GET'): 4,
+        ('task-detail', 'PATCH'): 6,
+        ('task-detail', 'DELETE'): 6,
+        ('task-assigned-to-me', 'GET'): 3,
+        ('task-reviewing', 'GET'): 3,
+        ('task-my-tasks', 'GET'): 3,
+        ('dashboard', 'GET'): 2,
+        ('task-comments-list', 'GET'): 3,
+        ('task-comments-list', 'POST'): 4,
+        ('task-comments-detail', 'GET'): 3,
+        ('task-comments-detail', 'DELETE'): 4,
+        ('archived-task-list', 'GET'): 2,
+        ('archived-task-detail', 'GET'): 4,
+        ('archived-task-restore', 'POST'): 11,
+        ('job-list', 'GET'): 2,
+        ('job-detail', 'GET'): 2,
+        ('async-board-list', 'GET'): 2,
+        ('async-board-detail', 'GET'): 4,
+        ('async-task-list', 'GET'): 2,
+        ('async-task-assigned-to-me', 'GET'): 2,
+        ('async-task-reviewing', 'GET'): 2,
+        ('async-task-comments-list', 'GET'): 2,
+    }
+
+    def test_query_budgets(self):
+        self.assertQueryBudgets()
+
+    def test_exceeded_budget_reports_sql(self):
+        self.query_budgets = dict(self.query_budgets)
+        self.query_budgets[('board-detail', 'GET')] = {'small': 1, 'large': 5}
+
+        with self.assertRaises(AssertionError) as context:
+            self.assertQueryBudgets()
+
+        message = str(context.exception)
+        self.assertIn('board-detail GET (small dataset) executed 5 queries', message)
+        self.assertIn('1. SELECT', message)
+
+
+def author_name_per_comment(serializer, obj):
+    """Deliberate N+1: loads the author of every comment separately."""
+    return User.objects.get(pk=obj.author_id).username
+
+
+@override_settings(NPLUSONE_ENABLED=True, NPLUSONE_THRESHOLD=3)
+class ProfilingTests(TestCase):
+    """Tests for ProfilingMiddleware and the profiles command."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        settings = override_settings(PROFILING_DIR=self.tmp.name, PROFILING_MAX_FILES=2)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.staff = User.objects.create_user('staff@test.com', 'staff@test.com', 'pass123', is_staff=True)
+        self.user = User.objects.create_user('user@test.com', 'user@test.com', 'pass123')
+        self.board = Board.objects.create(title='Board', owner=self.staff)
+        self.board.members.add(self.user)
+        self.url = reverse('board-detail', kwargs={'pk': self.board.pk})
+        self.client = APIClient()
+
+    def get(self, user, url=None, **extra):
+        token, _ = Token.objects.get_or_create(user=user)
+        return self.client.get(url or self.url, HTTP_AUTHORIZATION=f'Token {token.key}', **extra)
+
+    def test_staff_request_is_profiled(self):
+        response = self.get(self.staff, HTTP_X_PROFILE='1')
+
+        self.assertEqual(response.status_code, 200)
+        [profile] = list_profiles()
+        self.assertEqual((profile['method'], profile['route']), ('GET', 'board-detail'))
+        self.assertEqual(response['X-Profile-Id'], profile['name'])
+
+    def test_query_flag_and_retention(self):
+        for _ in range(3):
+            self.get(self.staff, self.url + '?profile=1')
+
+        self.assertEqual(len(list_profiles()), 2)
+
+    def test_not_triggered_without_flag_or_staff(self):
+        with mock.patch('core.profiling.cProfile.Profile') as profile:
+            self.assertNotIn('X-Profile-Id', self.get(self.staff))
+            self.assertNotIn('X-Profile-Id', self.get(self.user, HTTP_X_PROFILE='1'))
+            with override_settings(PROFILING_DIR=None):
+                self.assertNotIn('X-Profile-Id', self.get(self.staff, HTTP_X_PROFILE='1'))
+
+        profile.assert_not_called()
+        self.assertEqual(list_profiles(), [])
+
+    async def test_async_staff_request_is_profiled(self):
+        url = reverse('async-board-detail', kwargs={'pk': self.board.pk})
+        for user in (self.user, self.staff):
+            token = await Token.objects.acreate(user=user)
+            response = await AsyncClient().get(
+                url, headers={'Authorization': f'Token {token.key}', 'X-Profile': '1'}
+            )
+            self.assertEqual(response.status_code, 200)
+
+        [profile] = list_profiles()
+        self.assertEqual((profile['method'], profile['route']), ('GET', 'async-board-detail'))
+        self.assertEqual(response['X-Profile-Id'], profile['name'])
+
+    def test_command_lists_and_shows_profiles(self):
+        name = self.get(self.staff, HTTP_X_PROFILE='1')['X-Profile-Id']
+        out = StringIO()
+
+        call_command('profiles', route='board-detail', stdout=out)
+        self.assertIn(name, out.getvalue())
+        self.assertIn('GET', out.getvalue())
+
+        out = StringIO()
+        call_command('profiles', show=name, lines=5, stdout=out)
+        self.assertIn('function calls', out.getvalue())
+
+
+class NPlusOneDetectorTests(TestCase):
+    """Tests for NPlusOneMiddleware and SQL shape normalization."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='user@test.com',
+            email='user@test.com',
+            password='pass123'
+        )
+        board = Board.objects.create(title='Board', owner=self.user)
+        self.task = Task.objects.create(
+            title='Task', board=board, created_by=self.user)
+        for index in range(4):
+            Comment.objects.create(
+                task=self.task, author=self.user, text=f'Comment {index}')
+        self.url = reverse('task-comments-list', kwargs={'task_pk': self.task.id})
+        self.client.force_authenticate(user=self.user)
+
+    def test_normalize_sql(self):
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE a = %s AND b IN (%s, %s) AND c = 'x' LIMIT 21"),
+            'SELECT * FROM t WHERE a = %s AND b IN (...) AND c = ? LIMIT ?'
+        )
+        self.assertEqual(
+            normalize_sql('SELECT * FROM t WHERE b IN (%s)'),
+            normalize_sql('SELECT * FROM t WHERE b IN (%s, %s, %s)')
+        )
+
+    def test_clean_request_is_not_reported(self):
+        with self.assertNoLogs('kanmind.nplusone'):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch.object(CommentSerializer, 'get_author', author_name_per_comment)
+    def test_repeated_queries_are_logged_with_stack(self):
+        with self.assertLogs('kanmind.nplusone', level='WARNING') as logs:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        report = logs.output[0]
+        self.assertIn('4x SELECT', report)
+        self.assertIn('"auth_app_user"', report)
+        self.assertIn('core/tests.py', report)
+        self.assertIn('author_name_per_comment', report)
+
+    @override_settings(NPLUSONE_RAISE=True)
+    @mock.patch.object(CommentSerializer, 'get_author', author_name_per_comment)
+    def test_raise_fails_the_request(self):
+        with self.assertLogs('kanmind.nplusone', level='WARNING'):
+            with self.assertRaises(NPlusOneDetected):
+                self.client.get(self.url)
+
+    @override_settings(NPLUSONE_THRESHOLD=1)
+    async def test_sees_queries_of_async_views(self):
+        token = await Token.objects.acreate(user=self.user)
+        with self.assertLogs('kanmind.nplusone', level='WARNING') as logs:
+            response = await AsyncClient().get(
+                reverse('async-task-comments-list', kwargs={'task_pk': self.task.id}),
+                headers={'Authorization': f'Token {token.key}'}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('"task_app_comment"', logs.output[0])
+
+    @override_settings(NPLUSONE_ENABLED=False, NPLUSONE_RAISE=True)
+    @mock.patch.object(CommentSerializer, 'get_author', author_name_per_comment)
+    def test_disabled_detector(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+
+
+class ChunkedDeletionTests(TestCase):
+    """Tests for core.deletion and the chunked_delete command."""
+
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username='owner@test.com', email='owner@test.com', password='pass123'
+        )
+        self.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com', password='pass123'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+        self.board.members.add(self.member)
+        for index in range(5):
+            task = Task.objects.create(
+                title=f'Task {index}', board=self.board,
+                assignee=self.member, created_by=self.owner
+            )
+            for author in (self.owner, self.member):
+                Comment.objects.create(task=task, author=author, text='Comment')
+
+        self.other_board = Board.objects.create(title='Other', owner=self.member)
+        self.other_task = Task.objects.create(
+            title='Other task', board=self.other_board,
+            assignee=self.owner, created_by=self.member
+        )
+        Comment.objects.create(task=self.other_task, author=self.owner, text='Owner comment')
+
+    def test_delete_board_in_chunks(self):
+        progress = []
+
+        counts = chunked_delete(
+            Board.objects.filter(pk=self.board.pk), chunk_size=3,
+            progress=lambda label, count: progress.append((label, count))
+        )
+
+        self.assertEqual(counts['task_app.Comment'], 10)
+        self.assertEqual(counts['task_app.Task'], 5)
+        self.assertEqual(counts['boards_app.Board'], 1)
+        self.assertIn(('task_app.Comment', 3), progress)
+        self.assertIn(('task_app.Comment', 10), progress)
+        self.assertFalse(Board.objects.filter(pk=self.board.pk).exists())
+        self.assertEqual(Task.objects.get().pk, self.other_task.pk)
+        self.assertEqual(Comment.objects.count(), 1)
+
+    def test_delete_user_cascades_and_nulls(self):
+        counts = chunked_delete(User.objects.filter(pk=self.owner.pk), chunk_size=2)
+
+        self.assertFalse(Board.objects.filter(pk=self.board.pk).exists())
+        self.other_task.refresh_from_db()
+        self.assertIsNone(self.other_task.assignee_id)
+        self.assertEqual(counts['task_app.Task.assignee'], 1)
+        self.assertFalse(Comment.objects.filter(author=self.owner).exists())
+        self.assertTrue(User.objects.filter(pk=self.member.pk).exists())
+        self.assertFalse(User.objects.filter(pk=self.owner.pk).exists())
+
+    def test_cleared_fields_update_timestamps(self):
+        task_updated_at = self.other_task.updated_at
+        board_updated_at = self.other_board.content_updated_at
+
+        chunked_delete(User.objects.filter(pk=self.owner.pk))
+
+        self.other_task.refresh_from_db()
+        self.other_board.refresh_from_db()
+        self.assertGreater(self.other_task.updated_at, task_updated_at)
+        self.assertGreater(self.other_board.content_updated_at, board_updated_at)
+
+    def test_matches_django_cascade(self):
+        ArchivedTask.objects.create(id=1000, title='Archived', board=self.board)
+        expected = set(Task.objects.exclude(board=self.board).values_list('id', flat=True))
+
+        chunked_delete(User.objects.filter(pk=self.owner.pk))
+
+        self.assertEqual(set(Task.objects.values_list('id', flat=True)), expected)
+        self.assertFalse(ArchivedTask.objects.exists())
+        self.assertFalse(Board.members.through.objects.filter(board=self.board.pk).exists())
+
+    def test_command(self):
+        out = StringIO()
+
+        call_command('chunked_delete', board=self.board.pk, chunk_size=4, stdout=out)
+
+        self.assertIn('task_app.Comment: 4', out.getvalue())
+        self.assertIn('Deleted: ', out.getvalue())
+        self.assertFalse(Board.objects.filter(pk=self.board.pk).exists())
+
+
+class FieldSelectionTests(TestCase):
+    """Tests for core.fieldsets.FieldSelection."""
+
+    def test_parse_paths(self):
+        self.assertEqual(
+            parse_paths('id, tasks.id,tasks.assignee.fullname,,'),
+            {'id': {}, 'tasks': {'id': {}, 'assignee': {'fullname': {}}}}
+        )
+
+    def test_selection(self):
+        selection = FieldSelection(parse_paths('id,tasks.id'), parse_paths(''))
+
+        self.assertIn('id', selection)
+        self.assertNotIn('title', selection)
+        self.assertFalse(selection.expands('tasks'))
+        self.assertEqual(selection.child('tasks').fields, {'id': {}})
+        self.assertEqual(selection.child('tasks').prefix, 'tasks.')
+
+    def test_whole_nested_object(self):
+        selection = FieldSelection(parse_paths('tasks'), parse_paths('tasks'))
+
+        self.assertTrue(selection.expands('tasks'))
+        self.assertTrue(selection.child('tasks').is_all)
+
+    def test_only_reads_select_fields(self):
+        request = RequestFactory().post('/api/tasks/?fields=id')
+        self.assertIs(FieldSelection.from_request(request), ALL_FIELDS)
+
+        request = RequestFactory().get('/api/tasks/?fields=id&expand=')
+        selection = FieldSelection.from_request(request)
+        self.assertEqual((selection.fields, selection.expand), ({'id': {}}, {}))
+
+
+class CompactFormatTests(TestCase):
+    """Tests for core.renderers.to_columns() and from_columns()."""
+
+    def test_lists_of_objects_become_columns(self):
+        data = {
+            'id': 1,
+            'tasks': [
+                {'id': 1, 'assignee': {'id': 2}, 'tags': [{'name': 'a'}]},
+                {'id': 2, 'assignee': None, 'tags': []},
+            ],
+        }
+
+        self.assertEqual(to_columns(data), {
+            'id': 1,
+            'tasks': {
+                'columns': ['id', 'assignee', 'tags'],
+                'rows': [
+                    [1, {'id': 2}, {'columns': ['name'], 'rows': [['a']]}],
+                    [2, None, []],
+                ],
+            },
+        })
+        self.assertEqual(from_columns(to_columns(data)), data)
+
+    def test_other_lists_are_kept(self):
+        data = [[1, 2], [], [{'id': 1}, {'title': 'x'}], ['a']]
+
+        self.assertEqual(to_columns(data), data)
+        self.assertEqual(from_columns(data), data)
+
+
+class AdminChangelistTests(TestCase):
+    """Tests for core.admin and the model admins built on it."""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin@example.com', 'admin@example.com', 'pw')
+        self.client.force_login(self.admin)
+        self.alpha = Board.objects.create(title='Alpha', owner=self.admin)
+        self.beta = Board.objects.create(title='Beta', owner=self.admin)
+        self.fix = Task.objects.create(title='Fix login', board=self.alpha, assignee=self.admin)
+        Task.objects.create(title='Bug fix', board=self.beta, description='Fix it')
+
+    def changelist(self, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('admin:task_app_task_changelist'), params or {})
+        self.assertEqual(response.status_code, 200)
+        return response, [query['sql'] for query in queries.captured_queries]
+
+    def titles(self, response):
+        return sorted(task.title for task in response.context['cl'].result_list)
+
+    def test_paginator_estimates_unfiltered_and_caps_filtered(self):
+        for index in range(4):
+            Task.objects.create(title=f'Task {index}', board=self.alpha)
+        highest = Task.objects.order_by('-id').first().id
+        Task.objects.filter(title='Task 0').delete()
+
+        with override_settings(ADMIN_COUNT_LIMIT=3):
+            self.assertEqual(EstimatedCountPaginator(Task.objects.all(), 2).count, highest)
+            self.assertEqual(EstimatedCountPaginator(Task.objects.filter(board=self.alpha), 2).count, 3)
+        with override_settings(ADMIN_COUNT_LIMIT=100):
+            self.assertEqual(EstimatedCountPaginator(Task.objects.all(), 2).count, 5)
+        self.assertEqual(Paginator(Task.objects.all(), 2).count, 5)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        _, before = self.changelist()
+        for index in range(10):
+            user = User.objects.create_user(f'user{index}@example.com')
+            board = Board.objects.create(title=f'Board {index}', owner=user)
+            Task.objects.create(
+                title=f'Task {index}', board=board, assignee=user, reviewer=self.admin, created_by=user)
+
+        _, after = self.changelist()
+
+        self.assertEqual(len(after), len(before))
+        self.assertFalse(any(sql.startswith('SELECT DISTINCT') for sql in after))
+
+    def test_search_is_a_prefix_range_on_indexed_fields(self):
+        response, queries = self.changelist({'q': 'Fix'})
+
+        self.assertEqual(self.titles(response), ['Fix login'])
+        self.assertFalse(any(' LIKE ' in sql for sql in queries))
+        response, _ = self.changelist({'q': str(self.fix.id)})
+        self.assertEqual(self.titles(response), ['Fix login'])
+
+    def test_board_filter_lists_only_the_selected_board(self):
+        response, _ = self.changelist({'board__id__exact': self.alpha.id})
+
+        self.assertEqual(self.titles(response), ['Fix login'])
+        board_filter = next(spec for spec in response.context['cl'].filter_specs if spec.title == 'board')
+        self.assertEqual([label for _, label in board_filter.lookup_choices], ['Alpha'])
+        response, _ = self.changelist()
+        self.assertNotIn('board', [spec.title for spec in response.context['cl'].filter_specs])
+
+    def test_autocomplete_uses_prefix_search(self):
+        response = self.client.get(reverse('admin:autocomplete'), {
+            'app_label': 'task_app', 'model_name': 'task', 'field_name': 'board', 'term': 'Al',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['text'] for item in response.json()['results']], ['Alpha'])
+
+
+class SerializerFieldCacheTests(TestCase):
+    """Tests for core.serializers.CachedFieldsMixin."""
+
+    def setUp(self):
+        clear_field_cache()
+        self.addCleanup(clear_field_cache)
+        user = User.objects.create_user('owner@test.com', 'owner@test.com', 'pass123')
+        board = Board.objects.create(title='Board', owner=user)
+        self.task = Task.objects.create(title='Task', board=board, assignee=user)
+        self.task.comments_count = 0
+
+    def count_builds(self):
+        original = serializers.ModelSerializer.get_fields
+        return mock.patch.object(
+            serializers.ModelSerializer, 'get_fields', autospec=True, side_effect=original)
+
+    def test_fields_are_built_once_per_class(self):
+        with self.count_builds() as get_fields:
+            first = TaskReadSerializer(self.task).data
+            second = TaskReadSerializer(self.task).data
+
+        self.assertEqual(first, second)
+        built = [type(call.args[0]).__name__ for call in get_fields.call_args_list]
+        self.assertEqual(sorted(built), ['MemberSerializer', 'TaskReadSerializer'])
+
+    def test_instances_get_their_own_fields(self):
+        first, second = TaskReadSerializer(self.task), TaskReadSerializer(self.task)
+
+        self.assertIsNot(first.fields['title'], second.fields['title'])
+        self.assertIs(first.fields['assignee'].parent, first)
+        request = RequestFactory().get('/api/tasks/?fields=id,title')
+        sparse = TaskReadSerializer(self.task, context={'request': request})
+        self.assertEqual(list(sparse.fields), ['id', 'title'])
+        self.assertIn('assignee', TaskReadSerializer(self.task).fields)
+
+    @override_settings(SERIALIZER_FIELD_CACHE=False)
+    def test_disabled_cache_builds_every_time(self):
+        with self.count_builds() as get_fields:
+            TaskReadSerializer(self.task).fields
+            TaskReadSerializer(self.task).fields
+
+        self.assertEqual(get_fields.call_count, 2)
+
+
+class TokenBucketTests(TestCase):
+    """Tests for the token bucket arithmetic and the process-local store."""
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate('5/min'), (5, 5 / 60))
+        self.assertEqual(parse_rate('10/s'), (10, 10))
+
+    def test_bucket_refills_over_time(self):
+        state = None
+        for _ in range(3):
+            allowed, state, _ = take_token(state, 100.0, 3, 1.0)
+            self.assertTrue(allowed)
+
+        allowed, state, wait = take_token(state, 100.0, 3, 1.0)
+        self.assertFalse(allowed)
+        self.assertEqual(wait, 1.0)
+
+        allowed, state, _ = take_token(state, 101.5, 3, 1.0)
+        self.assertTrue(allowed)
+        self.assertEqual(state, (0.5, 101.5))
+
+    def test_local_store_drops_least_recently_used_bucket(self):
+        store = LocalBucketStore(max_keys=2)
+        store.take('a', 1, 0.001)
+        store.take('b', 1, 0.001)
+        self.assertFalse(store.take('a', 1, 0.001)[0])
+
+        store.take('c', 1, 0.001)
+
+        self.assertEqual(list(store.buckets), ['a', 'c'])
+        self.assertTrue(store.take('b', 1, 0.001)[0])
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class LoginFloodTests(TransactionTestCase):
+    """Tests for the login flood load test (threads need committed data)."""
+
+    def test_flood_is_rejected_when_throttled(self):
+        generate_dataset(users=6, boards=1, members_per_board=2, tasks_per_board=3, seed=1)
+        user = select_dataset_objects().user
+
+        results = measure_login_flood(user, duration=0.3, rate=60, threads=2)
+
+        self.assertEqual(list(results), ['baseline', 'flood, throttled', 'flood, unthrottled'])
+        self.assertGreater(results['baseline']['probes'], 0)
+        self.assertGreater(results['flood, throttled']['flood'].get(429, 0), 0)
+        self.assertNotIn(429, results['flood, unthrottled']['flood'])
+        for row in results.values():
+            self.assertLessEqual(row['p50_ms'], row['p99_ms'])
+
+
+class ShardingTests(ShardedTestCase):
+    """Tests for core.sharding with boards on two SQLite shards."""
+
+    def setUp(self):
+        super().setUp()
+        self.owner = User.objects.create_user(
+            username='owner@test.com', email='owner@test.com', password='pass123'
+        )
+        self.member = User.objects.create_user(
+            username='member@test.com', email='member@test.com', password='pass123'
+        )
+        self.client = APIClient()
+        token_login(self.client, self.owner)
+
+    def create_board(self, title):
+        response = self.client.post(
+            reverse('board-list'), {'title': title, 'members': [self.member.id]}, format='json'
+        )
+        self.assertEqual(response.status_code, 201, response.data)
+        return response.data['id']
+
+    def create_task(self, board_id, title, **fields):
+        data = {
+            'board': board_id, 'title': title,
+            'assignee_id': self.member.id, 'reviewer_id': self.owner.id, **fields,
+        }
+        response = self.client.post(reverse('task-list'), data, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        return Task.objects.using(shard_for(board_id)).get(board_id=board_id, title=title)
+
+    def test_new_ids_map_to_their_shard(self):
+        self.assertEqual(shard_for(new_id('test', 'shard1')), 'shard1')
+        self.assertEqual(shard_for(new_id('test', 'shard0')), 'shard0')
+        self.assertEqual({shard_for(new_id('test')) for _ in range(2)}, {'shard0', 'shard1'})
+
+    def test_board_data_without_shard_is_rejected(self):
+        with self.assertRaises(ShardNotSelected):
+            Task.objects.count()
+        with use_shard('shard0'):
+            self.assertEqual(Task.objects.count(), 0)
+
+    def test_boards_are_placed_by_id(self):
+        board_ids = [self.create_board('First'), self.create_board('Second')]
+
+        self.assertEqual({shard_for(board_id) for board_id in board_ids}, {'shard0', 'shard1'})
+        for board_id in board_ids:
+            shard = shard_for(board_id)
+            self.assertTrue(Board.objects.using(shard).filter(pk=board_id).exists())
+            self.assertEqual(
+                set(BoardMembership.objects.using(shard).filter(board_id=board_id)
+                    .values_list('user_id', 'role')),
+                {(self.owner.id, 'owner'), (self.member.id, 'member')},
+            )
+        self.assertFalse(Board.objects.using('default').exists())
+
+    def test_board_routes_merge_and_select_shards(self):
+        board_ids = [self.create_board('First'), self.create_board('Second')]
+        token_login(self.client, self.member)
+
+        response = self.client.get(reverse('board-list'))
+
+        self.assertEqual([board['id'] for board in response.data], sorted(board_ids))
+        self.assertEqual(
+            self.client.get(reverse('board-list'), HTTP_IF_NONE_MATCH=response['ETag']).status_code,
+            304,
+        )
+        for board_id in board_ids:
+            detail = self.client.get(reverse('board-detail', kwargs={'pk': board_id}))
+            self.assertEqual(detail.status_code, 200)
+            self.assertEqual([member['id'] for member in detail.data['members']], [self.member.id])
+
+        response = self.client.get(reverse('async-board-list'))
+        self.assertEqual([board['id'] for board in response.json()], sorted(board_ids))
+
+    def test_task_and_comment_routes_use_the_board_shard(self):
+        self.create_board('First')
+        board_id = self.create_board('Second')
+        task = self.create_task(board_id, 'Task')
+        self.assertEqual(shard_for(task.pk), shard_for(board_id))
+        url = reverse('task-detail', kwargs={'pk': task.pk})
+
+        self.assertEqual(self.client.get(url).data['assignee']['id'], self.member.id)
+        response = self.client.patch(url, {'status': 'review'}, format='json', HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, 200, response.data)
+        comments = reverse('task-comments-list', kwargs={'task_pk': task.pk})
+        self.assertEqual(self.client.post(comments, {'content': 'Looks good'}).status_code, 201)
+        self.assertEqual(len(self.client.get(comments).data), 1)
+
+        with use_shard(shard_for(board_id)):
+            task.refresh_from_db()
+            self.assertEqual((task.status, task.version), ('review', 2))
+            self.assertEqual(Comment.objects.get().task_id, task.pk)
+
+    def test_cross_board_lists_fan_out(self):
+        board_ids = [self.create_board('First'), self.create_board('Second')]
+        tasks = [self.create_task(board_id, f'Task {board_id}') for board_id in board_ids]
+        newest_first = sorted((task.pk for task in tasks), reverse=True)
+        token_login(self.client, self.member)
+
+        response = self.client.get(reverse('task-assigned-to-me'))
+        self.assertEqual([task['id'] for task in response.data], newest_first)
+        response = self.client.get(reverse('async-task-assigned-to-me'))
+        self.assertEqual([task['id'] for task in response.json()], newest_first)
+        response = self.client.get(reverse('task-my-tasks'))
+        self.assertEqual([board['id'] for board in response.data['boards']], sorted(board_ids))
+        response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.data['assigned']['total'], 2)
+        self.assertEqual(len(response.data['boards']), 2)
+
+        token_login(self.client, self.owner)
+        response = self.client.get(reverse('task-reviewing'))
+        self.assertEqual([task['id'] for task in response.data], newest_first)
+
+    def test_users_are_copied_to_every_shard(self):
+        self.owner.fullname = 'Owner'
+        self.owner.save()
+
+        for alias in self.shard_aliases:
+            self.assertEqual(User.objects.using(alias).get(pk=self.owner.pk).fullname, 'Owner')
+
+        self.member.delete()
+        for alias in self.shard_aliases:
+            self.assertFalse(User.objects.using(alias).filter(pk=self.member.pk).exists())
+
+    def test_shares_board_checks_every_shard(self):
+        stranger = User.objects.create_user(username='x@test.com', email='x@test.com', password='x')
+        self.create_board('First')
+
+        self.assertTrue(shares_board(self.member, self.owner))
+        self.assertFalse(shares_board(stranger, self.owner))
+
+    def test_delete_user_clears_every_shard(self):
+        board_ids = [self.create_board('First'), self.create_board('Second')]
+        for board_id in board_ids:
+            self.create_task(board_id, 'Task')
+
+        counts = chunked_delete_copied(User.objects.filter(pk=self.owner.pk))
+
+        self.assertEqual(counts['boards_app.Board'], 2)
+        self.assertFalse(User.objects.filter(pk=self.owner.pk).exists())
+        for alias in self.shard_aliases:
+            self.assertFalse(Board.objects.using(alias).exists())
+            self.assertFalse(User.objects.using(alias).filter(pk=self.owner.pk).exists())
+
+    @override_settings(DELETE_CHUNK_SIZE=1)
+    def test_user_delete_clears_shards_in_chunks(self):
+        board_id = self.create_board('First')
+        self.create_task(board_id, 'One')
+        self.create_task(board_id, 'Two')
+        alias = shard_for(board_id)
+
+        with CaptureQueriesContext(connections[alias]) as queries:
+            self.owner.delete()
+
+        task_deletes = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith('DELETE FROM "task_app_task"')
+        ]
+        self.assertEqual(len(task_deletes), 2)
+        self.assertFalse(Board.objects.using(alias).exists())
+        self.assertFalse(User.objects.using(alias).filter(pk=self.owner.pk).exists())
+        self.assertFalse(User.objects.filter(pk=self.owner.pk).exists())
+
+    def test_archive_runs_on_every_shard(self):
+        board_ids = [self.create_board('First'), self.create_board('Second')]
+        for board_id in board_ids:
+            self.create_task(board_id, 'Done', status='done')
+
+        archived = archive_done_tasks(older_than=timedelta(0), now=timezone.now() + timedelta(days=1))
+
+        self.assertEqual(archived, 2)
+        for board_id in board_ids:
+            self.assertTrue(ArchivedTask.objects.using(shard_for(board_id)).filter(board_id=board_id).exists())
+        self.assertEqual(len(self.client.get(reverse('archived-task-list')).data), 2)
+
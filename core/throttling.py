@@ -0,0 +1,182 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """
+    Parse '<requests>/<period>' (e.g. '5/min') into (capacity, refill rate).
+
+    - capacity is the burst size, the refill rate is in tokens per second.
+    """
+    count, period = rate.split('/')
+    capacity = int(count)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+def take_token(state, now, capacity, refill_rate):
+    """
+    Refill the bucket state (tokens, timestamp) up to now and take a token.
+
+    - Returns (allowed, new state, seconds until the next token).
+    """
+    tokens, updated = state if state is not None else (capacity, now)
+    tokens = min(capacity, tokens + (now - updated) * refill_rate)
+    if tokens >= 1:
+        return True, (tokens - 1, now), 0
+    return False, (tokens, now), (1 - tokens) / refill_rate
+
+
+class LocalBucketStore:
+    """
+    Token buckets kept in this process.
+
+    - Bounded to max_keys buckets; the least recently used bucket is
+      dropped first (which is the same as a full bucket).
+    - Thread safe; every worker process has its own buckets, so the
+      effective limit is multiplied by the number of processes.
+    """
+
+    def __init__(self, max_keys):
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def take(self, key, capacity, refill_rate):
+        with self.lock:
+            allowed, self.buckets[key], wait = take_token(
+                self.buckets.get(key), time.monotonic(), capacity, refill_rate)
+            self.buckets.move_to_end(key)
+            if len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+        return allowed, wait
+
+    def clear(self):
+        with self.lock:
+            self.buckets.clear()
+
+
+class CacheBucketStore:
+    """
+    Token buckets kept in a Django cache shared by all processes.
+
+    - One get and one set per bucket; concurrent requests may both take the
+      last token, so limits are approximate under contention.
+    - Entries expire once the bucket would be full again.
+    - clear() only makes this process start over with new keys; other
+      processes keep their buckets until they expire.
+    """
+
+    def __init__(self, alias):
+        self.cache = caches[alias]
+        self.generation = 0
+
+    def take(self, key, capacity, refill_rate):
+        key = f'throttle:{self.generation}:{key}'
+        allowed, state, wait = take_token(self.cache.get(key), time.time(), capacity, refill_rate)
+        self.cache.set(key, state, timeout=int(capacity / refill_rate) + 1)
+        return allowed, wait
+
+    def clear(self):
+        self.generation += 1
+
+
+_store = None
+
+
+def get_store():
+    """Return the bucket store selected by THROTTLE_CACHE."""
+    global _store
+    if _store is None:
+        if settings.THROTTLE_CACHE:
+            _store = CacheBucketStore(settings.THROTTLE_CACHE)
+        else:
+            _store = LocalBucketStore(settings.THROTTLE_LOCAL_MAX_KEYS)
+    return _store
+
+
+def reset_throttles():
+    """Empty every bucket, e.g. between tests."""
+    get_store().clear()
+
+
+def reset_store(*, setting, **kwargs):
+    global _store
+    if setting in ('THROTTLE_CACHE', 'THROTTLE_LOCAL_MAX_KEYS'):
+        _store = None
+
+
+setting_changed.connect(reset_store)
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    DRF throttle with one token bucket per client IP, email or user.
+
+    - The buckets of a scope are configured in THROTTLE_BUCKETS, e.g.
+      {'login': {'ip': '20/min', 'email': '5/min'}}; every request takes a
+      token from each of them. User buckets count per authenticated user.
+    - Runs before the view, so rejected requests neither hash a password
+      nor touch the database. The IP bucket is checked first, so a flood
+      from one address is rejected before the body is parsed.
+    - Rejections are answered by DRF with 429 and a Retry-After header.
+    - The client IP is REMOTE_ADDR; X-Forwarded-For is only used when
+      REST_FRAMEWORK['NUM_PROXIES'] declares the trusted proxies.
+    - THROTTLE_ENABLED = False turns every bucket off.
+    """
+    scope = None
+
+    def allow_request(self, request, view):
+        self.retry_after = None
+        if not settings.THROTTLE_ENABLED:
+            return True
+        store = get_store()
+        buckets = settings.THROTTLE_BUCKETS.get(self.scope, {})
+        for kind, rate in sorted(buckets.items(), key=lambda bucket: bucket[0] != 'ip'):
+            ident = self.get_bucket_ident(kind, request)
+            if not ident:
+                continue
+            allowed, wait = store.take(f'{self.scope}:{kind}:{ident}', *parse_rate(rate))
+            if not allowed:
+                self.retry_after = wait
+                return False
+        return True
+
+    def get_bucket_ident(self, kind, request):
+        if kind == 'ip':
+            return self.get_ident(request)
+        if kind == 'user':
+            return request.user.pk if request.user.is_authenticated else None
+        if kind == 'email':
+            email = request.data.get('email') if hasattr(request.data, 'get') else None
+            return email.strip().lower() if isinstance(email, str) else None
+        raise ValueError(f'Unknown throttle bucket: {kind}')
+
+    def get_ident(self, request):
+        if api_settings.NUM_PROXIES is None:
+            return request.META.get('REMOTE_ADDR')
+        return super().get_ident(request)
+
+    def wait(self):
+        return self.retry_after
+
+
+class LoginThrottle(TokenBucketThrottle):
+    scope = 'login'
+
+
+class RegistrationThrottle(TokenBucketThrottle):
+    scope = 'registration'
+
+
+class ProvisioningThrottle(TokenBucketThrottle):
+    scope = 'provisioning'
@@ -16,6 +16,7 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from core.views import metrics_view
 
 
 urlpatterns = [
@@ -23,4 +24,6 @@ urlpatterns = [
     path('api/', include('auth_app.api.urls')),
     path('api/', include('task_app.api.urls')),
     path('api/', include('boards_app.api.urls')),
+    path('api/', include('jobs_app.api.urls')),
+    path('metrics', metrics_view, name='metrics'),
 ]
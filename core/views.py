@@ -0,0 +1,40 @@
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+
+from core import metrics
+from core.profiling import is_staff_request
+
+
+def is_metrics_client(request):
+    """
+    Whether request may read /metrics.
+
+    - With METRICS_TOKEN set, the scraper sends Authorization: Bearer <token>.
+    - Staff users are allowed as well, by API token or admin session.
+    """
+    token = settings.METRICS_TOKEN
+    if token:
+        scheme, _, credentials = request.headers.get('Authorization', '').partition(' ')
+        if scheme.lower() == 'bearer' and hmac.compare_digest(credentials.strip().encode(), token.encode()):
+            return True
+    return is_staff_request(request)
+
+
+def metrics_view(request):
+    """
+    Expose the per-route request metrics in Prometheus text format.
+
+    - Merges the snapshots of all workers when METRICS_DIR is configured.
+    - Returns 404 when metrics are disabled and 403 for clients other than
+      the scraper (METRICS_TOKEN) and staff users.
+    """
+    if not settings.METRICS_ENABLED:
+        raise Http404
+    if not is_metrics_client(request):
+        return HttpResponseForbidden('Metrics require the metrics token or a staff user.')
+    return HttpResponse(
+        metrics.render_prometheus(metrics.collect()),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
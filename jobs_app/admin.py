@@ -0,0 +1,28 @@
+from django.contrib import admin
+from core.admin import LargeTableAdmin
+from jobs_app.models import Job
+from jobs_app.queue import handlers
+
+
+class JobNameFilter(admin.SimpleListFilter):
+    """Filter by job name, offering the registered handlers instead of a DISTINCT scan."""
+    title = 'name'
+    parameter_name = 'name'
+
+    def lookups(self, request, model_admin):
+        return [(name, name) for name in sorted(handlers)]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(name=self.value())
+        return queryset
+
+
+@admin.register(Job)
+class JobAdmin(LargeTableAdmin):
+    list_display = ('id', 'name', 'status', 'attempts', 'run_after', 'created_by', 'finished_at')
+    list_select_related = ('created_by',)
+    list_filter = ('status', JobNameFilter)
+    search_fields = ('=id', '=idempotency_key')
+    sortable_by = ('id',)
+    autocomplete_fields = ('created_by',)
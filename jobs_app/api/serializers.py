@@ -0,0 +1,36 @@
+from rest_framework import serializers
+from jobs_app.models import Job
+
+
+class JobSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for job status.
+
+    - Exposes: id, name, status, attempts, max_attempts, run_after,
+      progress, result, error, created_at, started_at, finished_at.
+    - result is only filled once the job succeeded; error holds the
+      traceback of the last failed attempt.
+    """
+
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'name', 'status', 'attempts', 'max_attempts', 'run_after',
+            'progress', 'result', 'error', 'created_at', 'started_at', 'finished_at'
+        ]
+        read_only_fields = fields
+
+
+class JobListSerializer(JobSerializer):
+    """
+    Job status without progress and result, for listing jobs.
+
+    - Results (e.g. board exports) can be large; fetch them per job.
+    """
+
+    class Meta(JobSerializer.Meta):
+        fields = [
+            field for field in JobSerializer.Meta.fields
+            if field not in ('progress', 'result')
+        ]
+        read_only_fields = fields
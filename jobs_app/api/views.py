@@ -0,0 +1,59 @@
+from django.urls import reverse
+from rest_framework import status, viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from jobs_app.models import Job
+from jobs_app.queue import enqueue
+from .serializers import JobListSerializer, JobSerializer
+
+
+def enqueue_job_response(request, name, payload, max_attempts=None):
+    """
+    Enqueue a job for request.user and return its status.
+
+    - An "Idempotency-Key" request header makes retries of the request
+      return the job created first (200) instead of enqueueing it again.
+    - New jobs return 202 Accepted with a Location header pointing to the
+      job status endpoint.
+    """
+    key = request.headers.get('Idempotency-Key')
+    job, created = enqueue(
+        name,
+        payload,
+        idempotency_key=f'{request.user.pk}:{name}:{key}' if key else None,
+        user=request.user,
+        max_attempts=max_attempts,
+    )
+    return Response(
+        JobSerializer(job).data,
+        status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK,
+        headers={'Location': reverse('job-detail', kwargs={'pk': job.pk})},
+    )
+
+
+class JobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet for polling the status of background jobs.
+
+    - Requires authentication for all actions.
+    - Queryset is restricted to jobs enqueued by the requesting user;
+      other jobs return 404.
+    - list: jobs without their progress and result, optionally filtered with
+      ?status=<status>.
+    - retrieve: a single job including its result.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        queryset = Job.objects.filter(created_by=self.request.user)
+        if self.action == 'list':
+            queryset = queryset.defer('payload', 'progress', 'result')
+            job_status = self.request.query_params.get('status')
+            if job_status:
+                queryset = queryset.filter(status=job_status)
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return JobListSerializer
+        return JobSerializer
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from jobs_app.worker import CONCURRENCY_MODELS, Worker
+
+
+class Command(BaseCommand):
+    """
+    Run background jobs from the database queue.
+
+    - Example: python manage.py run_worker --concurrency 4 --model processes
+    - --burst exits once no job is due, e.g. for cron or tests.
+    """
+    help = 'Run background jobs from the database queue.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=1)
+        parser.add_argument('--model', choices=CONCURRENCY_MODELS, default='threads',
+                            help='Run jobs in threads or in child processes.')
+        parser.add_argument('--poll-interval', type=float, default=settings.JOB_POLL_SECONDS,
+                            help='Seconds to wait when no job is due.')
+        parser.add_argument('--burst', action='store_true',
+                            help='Exit once no job is due.')
+
+    def handle(self, *args, **options):
+        worker = Worker(
+            concurrency=options['concurrency'],
+            model=options['model'],
+            poll_interval=options['poll_interval'],
+            burst=options['burst'],
+        )
+        self.stdout.write(
+            f'Starting {options["concurrency"]} worker(s) using {options["model"]}'
+        )
+        processed = worker.run()
+        if processed is not None:
+            self.stdout.write(self.style.SUCCESS(f'Ran {processed} jobs'))
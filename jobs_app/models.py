@@ -0,0 +1,77 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from auth_app.models import User
+
+
+class Job(models.Model):
+    """
+    Model representing a background job; the table is the job queue.
+
+    Fields:
+    - name: Name of the registered handler (see jobs_app.queue.job_handler).
+    - payload: JSON arguments passed to the handler.
+    - status: queued, running, succeeded or failed.
+    - attempts: Number of times a worker picked up the job.
+    - max_attempts: Attempts before the job is marked as failed.
+    - run_after: The job is not picked up before this time (retry backoff).
+    - idempotency_key: Optional unique key; enqueueing the same key twice
+      returns the existing job.
+    - result: JSON result returned by the handler.
+    - progress: JSON progress reported while the job runs.
+    - error: Traceback of the last failed attempt.
+    - created_by: User who enqueued the job (nullable).
+    - locked_by / locked_at: Worker that is running the job and since when.
+    - created_at, started_at, finished_at: Lifecycle timestamps.
+
+    Meta:
+    - ordering: newest jobs first (descending id).
+    - index on (status, run_after) for the worker's polling query.
+
+    __str__:
+    - Returns "<name> #<id> (<status>)".
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (SUCCEEDED, 'Succeeded'),
+        (FAILED, 'Failed'),
+    ]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=1)
+    run_after = models.DateTimeField(default=timezone.now)
+    idempotency_key = models.CharField(max_length=255, unique=True, null=True, blank=True)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    progress = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True)
+    created_by = models.ForeignKey(
+        User,
+        null=True,
+        blank=True,
+        related_name="jobs",
+        on_delete=models.SET_NULL
+    )
+    locked_by = models.CharField(max_length=255, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Job"
+        verbose_name_plural = "Jobs"
+        ordering = ['-id']
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='job_status_run_after_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
@@ -0,0 +1,211 @@
+import logging
+import threading
+import traceback
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from jobs_app.models import Job
+
+
+logger = logging.getLogger('kanmind.jobs')
+
+handlers = {}
+
+
+class PermanentJobError(Exception):
+    """Raised by a handler for failures that retrying cannot fix."""
+
+
+def job_handler(name):
+    """
+    Register the decorated function as the handler of jobs called name.
+
+    - Handlers are called with the Job and return a JSON-serializable
+      result; they live in the jobs.py module of their app.
+    """
+    def register(func):
+        handlers[name] = func
+        return func
+    return register
+
+
+def enqueue(name, payload=None, idempotency_key=None, user=None,
+            max_attempts=None, run_after=None):
+    """
+    Add a job to the queue.
+
+    - With an idempotency_key, a job enqueued earlier under the same key
+      is returned instead of creating a second one.
+    - Returns (job, created).
+    """
+    if name not in handlers:
+        raise ValueError(f'No job handler registered for "{name}".')
+    fields = dict(
+        name=name,
+        payload=payload or {},
+        created_by=user,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_after=run_after or timezone.now(),
+    )
+    if idempotency_key is None:
+        return Job.objects.create(**fields), True
+    try:
+        with transaction.atomic():
+            return Job.objects.create(idempotency_key=idempotency_key, **fields), True
+    except IntegrityError:
+        return Job.objects.get(idempotency_key=idempotency_key), False
+
+
+def progress_reporter(job):
+    """
+    Return a progress(key, value) callback that stores progress on the job.
+
+    - Every call writes job.progress with a single UPDATE, so clients can
+      follow long running jobs through the job status endpoint.
+    - The same UPDATE refreshes the lock while the job is still held by its
+      worker (see heartbeat()).
+    """
+    def report(key, value):
+        job.progress[key] = value
+        Job.objects.filter(pk=job.pk, locked_by=job.locked_by).update(
+            progress=job.progress, locked_at=timezone.now()
+        )
+    return report
+
+
+def refresh_lock(job):
+    """
+    Set locked_at of a running job to now, if job.locked_by still holds it.
+
+    - Returns False once the lock was lost (the job timed out and was
+      failed or claimed by another worker).
+    """
+    return bool(
+        Job.objects.filter(pk=job.pk, status=Job.RUNNING, locked_by=job.locked_by)
+        .update(locked_at=timezone.now())
+    )
+
+
+@contextmanager
+def heartbeat(job):
+    """
+    Refresh the lock of job every JOB_HEARTBEAT_SECONDS while the block runs.
+
+    - Runs in a background thread with its own database connection, so
+      handlers that do not report progress keep their lock as well and are
+      not run a second time by another worker after JOB_LOCK_TIMEOUT_SECONDS.
+    """
+    stop = threading.Event()
+
+    def beat():
+        try:
+            while not stop.wait(settings.JOB_HEARTBEAT_SECONDS):
+                try:
+                    if not refresh_lock(job):
+                        logger.warning('Job %s lost its lock.', job)
+                        return
+                except DatabaseError as exc:
+                    logger.warning('Job %s heartbeat failed: %s', job, exc)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=beat, name=f'job-heartbeat-{job.pk}', daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def retry_delay(attempts):
+    """Exponential backoff: JOB_RETRY_BACKOFF_SECONDS doubled per attempt."""
+    delay = settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(delay, settings.JOB_RETRY_BACKOFF_MAX_SECONDS))
+
+
+def claim_job(worker_id, now=None):
+    """
+    Claim the next due job for worker_id and mark it as running.
+
+    - Claiming is a conditional UPDATE (status unchanged since the job
+      was read), so concurrent workers never run the same job and no
+      SELECT ... FOR UPDATE support is needed.
+    - Running jobs whose lock is older than JOB_LOCK_TIMEOUT_SECONDS
+      belong to a lost worker and are picked up again, or failed once they
+      used up their attempts.
+    - Returns the claimed Job, or None if nothing is due.
+    """
+    now = now or timezone.now()
+    stale = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+    Job.objects.filter(
+        status=Job.RUNNING, locked_at__lt=stale, attempts__gte=F('max_attempts')
+    ).update(status=Job.FAILED, error='Worker lost.', finished_at=now)
+
+    due = (
+        Q(status=Job.QUEUED, run_after__lte=now)
+        | Q(status=Job.RUNNING, locked_at__lt=stale)
+    )
+    candidates = Job.objects.filter(due).order_by('run_after', 'id')
+    for job_id in candidates.values_list('id', flat=True)[:10]:
+        claimed = Job.objects.filter(due, pk=job_id).update(
+            status=Job.RUNNING,
+            attempts=F('attempts') + 1,
+            locked_by=worker_id,
+            locked_at=now,
+            started_at=now,
+        )
+        if claimed:
+            return Job.objects.get(pk=job_id)
+    return None
+
+
+def run_job(job):
+    """
+    Run a claimed job with its handler and store the outcome.
+
+    - Success stores the handler's return value as result.
+    - Failures are retried after retry_delay() until max_attempts is
+      reached; PermanentJobError and unknown handlers fail immediately.
+    - The lock is refreshed while the handler runs (heartbeat()). The
+      outcome is only stored while the worker still holds the lock; a job
+      that timed out and was failed or claimed again keeps that state.
+    """
+    handler = handlers.get(job.name)
+    worker_id = job.locked_by
+    try:
+        if handler is None:
+            raise PermanentJobError(f'No job handler registered for "{job.name}".')
+        with heartbeat(job):
+            result = handler(job)
+    except Exception as exc:
+        job.error = traceback.format_exc()
+        if isinstance(exc, PermanentJobError) or job.attempts >= job.max_attempts:
+            job.status = Job.FAILED
+            job.finished_at = timezone.now()
+            logger.error('Job %s failed: %s', job, exc)
+        else:
+            job.status = Job.QUEUED
+            job.run_after = timezone.now() + retry_delay(job.attempts)
+            logger.warning('Job %s failed, retrying at %s: %s', job, job.run_after, exc)
+    else:
+        job.status = Job.SUCCEEDED
+        job.result = result
+        job.error = ''
+        job.finished_at = timezone.now()
+
+    job.locked_by = ''
+    job.locked_at = None
+    fields = ['status', 'result', 'error', 'run_after', 'finished_at', 'locked_by', 'locked_at']
+    stored = Job.objects.filter(pk=job.pk, status=Job.RUNNING, locked_by=worker_id).update(
+        **{name: getattr(job, name) for name in fields}
+    )
+    if not stored:
+        logger.warning('Job %s lost its lock to another worker; outcome discarded.', job)
+        job.refresh_from_db()
+    return job
@@ -0,0 +1,297 @@
+"""
+Test suite for the jobs_app.
+
+Covers:
+- Enqueueing: idempotency keys and unknown handlers.
+- Running jobs: results, retries with backoff, permanent failures, jobs
+  of lost workers and lock heartbeats.
+- Worker: run_worker command and concurrent thread workers.
+- Job endpoints: board export, job list and job detail.
+"""
+
+import time
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from auth_app.models import User
+from boards_app.models import Board
+from jobs_app.models import Job
+from jobs_app.queue import (
+    PermanentJobError,
+    claim_job,
+    enqueue,
+    job_handler,
+    progress_reporter,
+    retry_delay,
+    run_job,
+)
+from jobs_app.worker import Worker
+from task_app.models import Comment, Task
+
+
+calls = []
+
+
+@job_handler('test_record')
+def record(job):
+    calls.append(job.payload['value'])
+    return {'value': job.payload['value']}
+
+
+@job_handler('test_flaky')
+def flaky(job):
+    if job.attempts < 2:
+        raise RuntimeError('Temporary failure')
+    return 'ok'
+
+
+@job_handler('test_permanent')
+def permanent(job):
+    raise PermanentJobError('Cannot be retried')
+
+
+@job_handler('test_slow')
+def slow(job):
+    time.sleep(job.payload['seconds'])
+    return Job.objects.values_list('locked_at', flat=True).get(pk=job.pk)
+
+
+class JobQueueTests(TestCase):
+    """Tests for enqueue(), claim_job() and run_job()."""
+
+    def setUp(self):
+        calls.clear()
+
+    def test_idempotency_key_returns_existing_job(self):
+        first, created = enqueue('test_record', {'value': 1}, idempotency_key='key')
+        second, created_again = enqueue('test_record', {'value': 2}, idempotency_key='key')
+
+        self.assertTrue(created)
+        self.assertFalse(created_again)
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_unknown_handler(self):
+        with self.assertRaises(ValueError):
+            enqueue('does_not_exist')
+
+    def test_run_job_stores_result(self):
+        job, _ = enqueue('test_record', {'value': 7})
+
+        job = run_job(claim_job('worker'))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.SUCCEEDED)
+        self.assertEqual(job.result, {'value': 7})
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNotNone(job.finished_at)
+        self.assertIsNone(claim_job('worker'))
+
+    @override_settings(JOB_RETRY_BACKOFF_SECONDS=10, JOB_RETRY_BACKOFF_MAX_SECONDS=25)
+    def test_retry_delay_doubles_up_to_max(self):
+        self.assertEqual(
+            [retry_delay(attempt).total_seconds() for attempt in range(1, 5)],
+            [10, 20, 25, 25]
+        )
+
+    def test_failed_job_is_retried_after_backoff(self):
+        job, _ = enqueue('test_flaky', max_attempts=3)
+
+        with self.assertLogs('kanmind.jobs', 'WARNING'):
+            run_job(claim_job('worker'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.QUEUED)
+        self.assertIn('Temporary failure', job.error)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIsNone(claim_job('worker'))
+
+        run_job(claim_job('worker', now=job.run_after))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.SUCCEEDED)
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(job.error, '')
+
+    def test_job_fails_after_max_attempts(self):
+        job, _ = enqueue('test_flaky', max_attempts=1)
+
+        with self.assertLogs('kanmind.jobs', 'ERROR'):
+            run_job(claim_job('worker'))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+
+    def test_permanent_error_is_not_retried(self):
+        job, _ = enqueue('test_permanent', max_attempts=5)
+
+        with self.assertLogs('kanmind.jobs', 'ERROR'):
+            run_job(claim_job('worker'))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(job.attempts, 1)
+
+    @override_settings(JOB_LOCK_TIMEOUT_SECONDS=60)
+    def test_job_of_lost_worker_is_claimed_again(self):
+        job, _ = enqueue('test_record', {'value': 1}, max_attempts=2)
+        claim_job('lost-worker')
+        later = timezone.now() + timedelta(seconds=61)
+
+        self.assertIsNone(claim_job('worker'))
+        claimed = claim_job('worker', now=later)
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.attempts, 2)
+
+        Job.objects.filter(pk=job.pk).update(locked_at=timezone.now())
+        self.assertIsNone(claim_job('worker', now=later + timedelta(seconds=61)))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+
+    def test_progress_refreshes_lock(self):
+        enqueue('test_record', {'value': 1})
+        job = claim_job('worker')
+        stale = timezone.now() - timedelta(hours=1)
+        Job.objects.filter(pk=job.pk).update(locked_at=stale)
+
+        progress_reporter(job)('rows', 10)
+
+        job.refresh_from_db()
+        self.assertEqual(job.progress, {'rows': 10})
+        self.assertGreater(job.locked_at, stale)
+
+    def test_worker_that_lost_lock_keeps_job_state(self):
+        enqueue('test_record', {'value': 1}, max_attempts=1)
+        job = claim_job('slow-worker')
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.FAILED, error='Worker lost.', finished_at=timezone.now()
+        )
+
+        with self.assertLogs('kanmind.jobs', 'WARNING'):
+            job = run_job(job)
+
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(job.error, 'Worker lost.')
+        self.assertIsNone(job.result)
+        self.assertEqual(calls, [1])
+
+    def test_run_worker_command(self):
+        for value in range(3):
+            enqueue('test_record', {'value': value})
+        out = StringIO()
+
+        call_command('run_worker', burst=True, stdout=out)
+
+        self.assertIn('Ran 3 jobs', out.getvalue())
+        self.assertEqual(sorted(calls), [0, 1, 2])
+        self.assertFalse(Job.objects.exclude(status=Job.SUCCEEDED).exists())
+
+
+class ThreadWorkerTests(TransactionTestCase):
+    """Concurrent thread workers never run a job twice."""
+
+    def test_jobs_are_claimed_once(self):
+        calls.clear()
+        for value in range(20):
+            enqueue('test_record', {'value': value})
+
+        with self.assertLogs('kanmind.jobs', 'INFO'):
+            processed = Worker(
+                concurrency=4, model='threads', poll_interval=0.01, burst=True
+            ).run()
+
+        # The shared in-memory test database may report "table is locked"
+        # to a worker; its job then waits for the lock timeout.
+        self.assertGreater(processed, 0)
+        self.assertEqual(len(calls), len(set(calls)))
+        self.assertEqual(Job.objects.filter(status=Job.SUCCEEDED).count(), processed)
+        self.assertFalse(Job.objects.filter(attempts__gt=1).exists())
+
+
+class HeartbeatTests(TransactionTestCase):
+    """Running jobs keep their lock while the handler runs."""
+
+    @override_settings(JOB_HEARTBEAT_SECONDS=0.05)
+    def test_heartbeat_refreshes_lock(self):
+        enqueue('test_slow', {'seconds': 0.3})
+        job = claim_job('worker')
+        stale = timezone.now() - timedelta(hours=1)
+        Job.objects.filter(pk=job.pk).update(locked_at=stale)
+        job.locked_at = stale
+
+        job = run_job(job)
+
+        self.assertEqual(job.status, Job.SUCCEEDED)
+        self.assertGreater(Job._meta.get_field('locked_at').to_python(job.result), stale)
+
+
+class JobEndpointTests(TestCase):
+    """Tests for POST /api/boards/<id>/export/ and /api/jobs/."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='user@test.com',
+            email='user@test.com',
+            password='pass123'
+        )
+        self.outsider = User.objects.create_user(
+            username='outsider@test.com',
+            email='outsider@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        task = Task.objects.create(title='Task', board=self.board, created_by=self.user)
+        Comment.objects.create(task=task, author=self.user, text='Comment')
+        self.export_url = reverse('board-export', kwargs={'pk': self.board.pk})
+        self.client.force_authenticate(user=self.user)
+
+    def test_export_board_job(self):
+        response = self.client.post(self.export_url)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['status'], Job.QUEUED)
+        self.assertEqual(
+            response['Location'], reverse('job-detail', kwargs={'pk': response.data['id']})
+        )
+
+        call_command('run_worker', burst=True, stdout=StringIO())
+        response = self.client.get(response['Location'])
+
+        self.assertEqual(response.data['status'], Job.SUCCEEDED)
+        export = response.data['result']
+        self.assertEqual(export['title'], 'Board')
+        self.assertEqual(
+            [comment['content'] for comment in export['tasks'][0]['comments']], ['Comment']
+        )
+
+    def test_export_idempotency_key(self):
+        first = self.client.post(self.export_url, HTTP_IDEMPOTENCY_KEY='abc')
+        second = self.client.post(self.export_url, HTTP_IDEMPOTENCY_KEY='abc')
+
+        self.assertEqual(first.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data['id'], second.data['id'])
+
+    def test_export_requires_membership(self):
+        self.client.force_authenticate(user=self.outsider)
+
+        response = self.client.post(self.export_url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_jobs_are_private(self):
+        job_id = self.client.post(self.export_url).data['id']
+
+        response = self.client.get(reverse('job-list'))
+        self.assertEqual([job['id'] for job in response.data], [job_id])
+        self.assertNotIn('result', response.data[0])
+
+        self.client.force_authenticate(user=self.outsider)
+        self.assertEqual(self.client.get(reverse('job-list')).data, [])
+        response = self.client.get(reverse('job-detail', kwargs={'pk': job_id}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,135 @@
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+
+import django
+from django.db import DatabaseError, close_old_connections, connections
+
+from jobs_app.queue import claim_job, run_job
+
+
+logger = logging.getLogger('kanmind.jobs')
+
+CONCURRENCY_MODELS = ('threads', 'processes')
+
+
+def work(worker_id, poll_interval, burst=False, stop=None):
+    """
+    Claim and run jobs until stop is set.
+
+    - Waits poll_interval seconds whenever the queue has no due job; in
+      burst mode it returns instead.
+    - Database errors (e.g. a locked SQLite file) are logged and retried
+      after poll_interval; a job interrupted by one is picked up again
+      once its lock times out.
+    - Returns the number of jobs run.
+    """
+    stop = stop or threading.Event()
+    processed = 0
+    try:
+        while not stop.is_set():
+            close_old_connections()
+            try:
+                job = claim_job(worker_id)
+                if job is not None:
+                    logger.info('%s running %s', worker_id, job)
+                    run_job(job)
+                    processed += 1
+                    continue
+            except DatabaseError as exc:
+                logger.warning('%s database error: %s', worker_id, exc)
+                stop.wait(poll_interval)
+                continue
+            if burst:
+                break
+            stop.wait(poll_interval)
+    finally:
+        connections.close_all()
+    return processed
+
+
+def get_worker_id(name):
+    return f'{socket.gethostname()}:{os.getpid()}:{name}'
+
+
+def _process_main(name, poll_interval, burst):
+    # Required where processes are spawned instead of forked.
+    django.setup()
+    try:
+        work(get_worker_id(name), poll_interval, burst)
+    except KeyboardInterrupt:
+        pass
+
+
+class Worker:
+    """
+    Job worker with a configurable concurrency model.
+
+    - threads: concurrency threads in this process; suited to I/O bound
+      jobs and to SQLite, where all threads share one file.
+    - processes: concurrency child processes, each running one loop;
+      suited to CPU bound jobs.
+    - concurrency 1 with threads runs the loop in the calling thread.
+    """
+
+    def __init__(self, concurrency=1, model='threads', poll_interval=1.0, burst=False):
+        if model not in CONCURRENCY_MODELS:
+            raise ValueError(f'Unknown concurrency model "{model}".')
+        self.concurrency = concurrency
+        self.model = model
+        self.poll_interval = poll_interval
+        self.burst = burst
+        self.stop = threading.Event()
+
+    def run(self):
+        if self.model == 'processes':
+            return self.run_processes()
+        if self.concurrency == 1:
+            return work(get_worker_id('threads-0'), self.poll_interval, self.burst, self.stop)
+        return self.run_threads()
+
+    def run_threads(self):
+        processed = [0] * self.concurrency
+
+        def target(index):
+            processed[index] = work(
+                get_worker_id(f'threads-{index}'), self.poll_interval, self.burst, self.stop
+            )
+
+        threads = [
+            threading.Thread(target=target, args=(index,), name=f'job-worker-{index}')
+            for index in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            self.stop.set()
+            for thread in threads:
+                thread.join()
+        return sum(processed)
+
+    def run_processes(self):
+        # Children must not share the parent's database connections.
+        connections.close_all()
+        processes = [
+            multiprocessing.Process(
+                target=_process_main,
+                args=(f'processes-{index}', self.poll_interval, self.burst),
+                name=f'job-worker-{index}',
+            )
+            for index in range(self.concurrency)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.join()
+        return None
@@ -1,9 +1,10 @@
 from django.contrib import admin
-from task_app.models import Task, Comment
+from core.admin import LargeTableAdmin, SelectedRelatedFilter
+from task_app.models import ArchivedTask, Task, Comment
 
 
 @admin.register(Task)
-class TaskAdmin(admin.ModelAdmin):
+class TaskAdmin(LargeTableAdmin):
     list_display = (
         'id',
         'title',
@@ -13,11 +14,30 @@ class TaskAdmin(admin.ModelAdmin):
         'assignee',
         'reviewer',
         'created_by')
-    list_filter = ('status', 'priority', 'board')
-    search_fields = ('title', 'description')
+    list_select_related = ('board', 'assignee', 'reviewer', 'created_by')
+    list_filter = ('status', 'priority', ('board', SelectedRelatedFilter))
+    search_fields = ('=id', '^title')
+    sortable_by = ('id', 'title')
+    autocomplete_fields = ('board', 'assignee', 'reviewer', 'created_by')
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(LargeTableAdmin):
     list_display = ('id', 'task', 'author', 'created_at')
-    search_fields = ('text', 'author__fullname')
+    list_select_related = ('task', 'author')
+    list_filter = (('task', SelectedRelatedFilter), ('author', SelectedRelatedFilter))
+    search_fields = ('=id', '=task__id', '^author__username')
+    sortable_by = ('id',)
+    ordering = ('-id',)
+    autocomplete_fields = ('task', 'author')
+
+
+@admin.register(ArchivedTask)
+class ArchivedTaskAdmin(LargeTableAdmin):
+    list_display = ('id', 'title', 'board', 'priority', 'completed_at', 'archived_at')
+    list_select_related = ('board',)
+    list_filter = (('board', SelectedRelatedFilter),)
+    search_fields = ('=id', '^title')
+    sortable_by = ('id', 'title')
+    ordering = ('-id',)
+    autocomplete_fields = ('board', 'assignee', 'reviewer', 'created_by')
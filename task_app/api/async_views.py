@@ -0,0 +1,44 @@
+from core.async_views import AsyncAPIView, fetch_all
+from core.fieldsets import FieldSelection, sideload
+from core.sharding import afan_out, merge
+from task_app.models import Task, Comment
+from task_app.api.serializers import TaskReadSerializer, CommentSerializer
+
+
+class AsyncTaskListView(AsyncAPIView):
+    """
+    Async variant of the task list endpoints.
+
+    - filter_field restricts the tasks to the requesting user:
+        * None: all tasks (GET /api/tasks/)
+        * 'assignee': GET /api/tasks/assigned-to-me/
+        * 'reviewer': GET /api/tasks/reviewing/
+    - Accepts ?fields=, ?expand= and ?normalize= like the sync views.
+    - With sharding, the shards are queried in turn and the tasks merged,
+      newest first.
+    """
+    filter_field = None
+
+    async def get(self, request):
+        tasks = Task.objects.all()
+        if self.filter_field:
+            tasks = tasks.filter(**{self.filter_field: request.user})
+        queryset = TaskReadSerializer.setup_eager_loading(tasks, FieldSelection.from_request(request))
+        results = await afan_out(lambda: fetch_all(queryset.all()))
+        tasks = merge(results, key=lambda task: task.pk, reverse=True)
+        context = {'request': request}
+        return self.render(sideload(TaskReadSerializer(tasks, many=True, context=context)))
+
+
+class AsyncCommentListView(AsyncAPIView):
+    """Async variant of GET /api/tasks/<task_pk>/comments/."""
+
+    def shard_key(self, request, task_pk=None, **kwargs):
+        return task_pk
+
+    async def get(self, request, task_pk):
+        comments = await fetch_all(CommentSerializer.setup_eager_loading(
+            Comment.objects.filter(task_id=task_pk), FieldSelection.from_request(request)
+        ))
+        context = {'request': request}
+        return self.render(sideload(CommentSerializer(comments, many=True, context=context)))
@@ -1,19 +1,17 @@
 from rest_framework import permissions
+from boards_app.membership import is_member
 
 
 class IsTaskBoardMember(permissions.BasePermission):
     """
     Permission class that grants access if the requesting user
     is either the board owner or a member of the board
-    associated with the task.
+    associated with the task (one membership row lookup).
     """
 
     def has_object_permission(self, request, view, obj):
         board = obj.board
-        return (
-            board.owner == request.user or
-            request.user in board.members.all()
-        )
+        return board.owner_id == request.user.id or is_member(board, request.user)
 
 
 class IsTaskCreatorOrBoardOwner(permissions.BasePermission):
@@ -25,8 +23,8 @@ class IsTaskCreatorOrBoardOwner(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         return (
-            obj.created_by == request.user or
-            obj.board.owner == request.user
+            obj.created_by_id == request.user.id or
+            obj.board.owner_id == request.user.id
         )
 
 
@@ -37,4 +35,4 @@ class IsCommentAuthor(permissions.BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        return obj.author == request.user
+        return obj.author_id == request.user.id
@@ -1,18 +1,25 @@
+from django.db.models import Count, Prefetch
 from rest_framework import serializers
 from auth_app.models import User
-from task_app.models import Comment, Task
+from task_app.models import ArchivedComment, ArchivedTask, Comment, Task
 from auth_app.api.serializers import MemberSerializer
+from core.fieldsets import ALL_FIELDS, SparseFieldsetMixin
+from core.serializers import CachedFieldsMixin
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(SparseFieldsetMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for comments.
 
     - Maps Comment model fields to API representation.
     - Exposes: id, content (mapped from 'text'), author, created_at.
     - Author is returned as fullname if available, otherwise username.
+    - Use setup_eager_loading() on querysets to join the author.
+    - Supports ?fields= on GET requests (core.fieldsets); with
+      ?normalize=users the author is its user id.
     """
     author = serializers.SerializerMethodField()
+    sideloaded_fields = {'author': ('users', MemberSerializer)}
 
     class Meta:
         model = Comment
@@ -21,11 +28,17 @@ class CommentSerializer(serializers.ModelSerializer):
             'content': {'source': 'text'}
         }
 
+    @staticmethod
+    def setup_eager_loading(queryset, selection=ALL_FIELDS):
+        if 'author' not in selection:
+            return queryset
+        return queryset.select_related('author')
+
     def get_author(self, obj):
         return obj.author.fullname or obj.author.username
 
 
-class TaskReadSerializer(serializers.ModelSerializer):
+class TaskReadSerializer(SparseFieldsetMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Read-only serializer for tasks.
 
@@ -33,24 +46,40 @@ class TaskReadSerializer(serializers.ModelSerializer):
     - Includes nested assignee and reviewer data via MemberSerializer.
     - Adds comments_count as a computed field.
     - Exposes: id, board, title, description, status, priority,
-      assignee, reviewer, due_date, comments_count.
+      assignee, reviewer, due_date, comments_count, version (for If-Match).
+    - Querysets must go through setup_eager_loading(), which joins assignee
+      and reviewer and annotates comments_count.
+    - Supports ?fields= and ?expand= on GET requests (core.fieldsets); pass
+      the same selection to setup_eager_loading() to skip the joins and the
+      annotation of fields that are not rendered.
+    - With ?normalize=users, assignee and reviewer are user ids.
     """
     assignee = MemberSerializer(read_only=True)
     reviewer = MemberSerializer(read_only=True)
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
+    sideloaded_fields = {
+        'assignee': ('users', MemberSerializer),
+        'reviewer': ('users', MemberSerializer),
+    }
 
     class Meta:
         model = Task
         fields = [
             'id', 'board', 'title', 'description', 'status', 'priority',
-            'assignee', 'reviewer', 'due_date', 'comments_count'
+            'assignee', 'reviewer', 'due_date', 'comments_count', 'version'
         ]
 
-    def get_comments_count(self, obj):
-        return obj.comments.count()
+    @staticmethod
+    def setup_eager_loading(queryset, selection=ALL_FIELDS):
+        related = [name for name in ('assignee', 'reviewer') if selection.expands(name)]
+        if related:
+            queryset = queryset.select_related(*related)
+        if 'comments_count' in selection:
+            queryset = queryset.annotate(comments_count=Count('comments'))
+        return queryset
 
 
-class TaskWriteSerializer(serializers.ModelSerializer):
+class TaskWriteSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Write serializer for tasks (create/update).
 
@@ -58,7 +87,7 @@ class TaskWriteSerializer(serializers.ModelSerializer):
     - Validates that assignee and reviewer are either board members or the board owner.
     - Prevents changing the board association of an existing task.
     - Exposes: board, title, description, status, priority,
-      assignee_id, reviewer_id, due_date.
+      assignee_id, reviewer_id, due_date, and the read-only version.
     """
     assignee_id = serializers.PrimaryKeyRelatedField(
         queryset=User.objects.all(),
@@ -77,8 +106,9 @@ class TaskWriteSerializer(serializers.ModelSerializer):
         model = Task
         fields = [
             'board', 'title', 'description', 'status', 'priority',
-            'assignee_id', 'reviewer_id', 'due_date'
+            'assignee_id', 'reviewer_id', 'due_date', 'version'
         ]
+        read_only_fields = ['version']
 
     def validate(self, attrs):
         board = attrs.get("board")
@@ -94,13 +124,76 @@ class TaskWriteSerializer(serializers.ModelSerializer):
             })
 
         if board:
-            allowed = set(board.members.all()) | {board.owner}
-            if assignee and assignee not in allowed:
+            # The membership rows include the owner's.
+            allowed = set(board.memberships.values_list('user_id', flat=True))
+            if assignee and assignee.id not in allowed:
                 raise serializers.ValidationError({
                     "assignee_id": "Assignee muss Mitglied oder Owner des Boards sein."
                 })
-            if reviewer and reviewer not in allowed:
+            if reviewer and reviewer.id not in allowed:
                 raise serializers.ValidationError({
                     "reviewer_id": "Reviewer muss Mitglied oder Owner des Boards sein."
                 })
         return attrs
+
+
+class ArchivedCommentSerializer(CommentSerializer):
+    """
+    Read-only serializer for comments of archived tasks.
+
+    - Same representation as CommentSerializer.
+    """
+
+    class Meta(CommentSerializer.Meta):
+        model = ArchivedComment
+        read_only_fields = CommentSerializer.Meta.fields
+
+
+class ArchivedTaskSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Read-only serializer for archived tasks.
+
+    - Same fields as TaskReadSerializer plus completed_at and archived_at.
+    - Querysets must go through setup_eager_loading().
+    """
+    assignee = MemberSerializer(read_only=True)
+    reviewer = MemberSerializer(read_only=True)
+    comments_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = ArchivedTask
+        fields = [
+            'id', 'board', 'title', 'description', 'status', 'priority',
+            'assignee', 'reviewer', 'due_date', 'comments_count',
+            'completed_at', 'archived_at'
+        ]
+        read_only_fields = fields
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.select_related('assignee', 'reviewer').annotate(
+            comments_count=Count('comments')
+        )
+
+
+class ArchivedTaskDetailSerializer(ArchivedTaskSerializer):
+    """
+    Archived task including its comments.
+
+    - setup_eager_loading() additionally prefetches the comments with their
+      authors in one query.
+    """
+    comments = ArchivedCommentSerializer(many=True, read_only=True)
+
+    class Meta(ArchivedTaskSerializer.Meta):
+        fields = ArchivedTaskSerializer.Meta.fields + ['comments']
+        read_only_fields = fields
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return ArchivedTaskSerializer.setup_eager_loading(queryset).prefetch_related(
+            Prefetch(
+                'comments',
+                CommentSerializer.setup_eager_loading(ArchivedComment.objects.all())
+            )
+        )
@@ -1,11 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from rest_framework_nested.routers import NestedDefaultRouter
-from task_app.api.views import TaskViewSet, CommentViewSet
+from task_app.api.views import ArchivedTaskViewSet, CommentViewSet, DashboardView, TaskViewSet
+from task_app.api.async_views import AsyncTaskListView, AsyncCommentListView
 
 
 router = DefaultRouter()
 router.register(r'tasks', TaskViewSet, basename='task')
+router.register(r'archive/tasks', ArchivedTaskViewSet, basename='archived-task')
 
 tasks_router = NestedDefaultRouter(router, r'tasks', lookup='task')
 tasks_router.register(r'comments', CommentViewSet, basename='task-comments')
@@ -13,4 +15,21 @@ tasks_router.register(r'comments', CommentViewSet, basename='task-comments')
 urlpatterns = [
     path('', include(router.urls)),
     path('', include(tasks_router.urls)),
+    path('dashboard/', DashboardView.as_view(), name='dashboard'),
+    path('async/tasks/', AsyncTaskListView.as_view(), name='async-task-list'),
+    path(
+        'async/tasks/assigned-to-me/',
+        AsyncTaskListView.as_view(filter_field='assignee'),
+        name='async-task-assigned-to-me'
+    ),
+    path(
+        'async/tasks/reviewing/',
+        AsyncTaskListView.as_view(filter_field='reviewer'),
+        name='async-task-reviewing'
+    ),
+    path(
+        'async/tasks/<int:task_pk>/comments/',
+        AsyncCommentListView.as_view(),
+        name='async-task-comments-list'
+    ),
 ]
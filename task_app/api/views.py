@@ -1,30 +1,82 @@
+from django.conf import settings
+from django.db.models import F, Q
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.pagination import Cursor
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from task_app.models import Task, Comment
-from task_app.api.serializers import TaskReadSerializer, TaskWriteSerializer, CommentSerializer
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+from boards_app.api.pagination import TaskColumnPagination
+from boards_app.api.views import board_version
+from boards_app.membership import member_boards
+from boards_app.models import Board
+from core.concurrency import VersionedUpdateMixin
+from core.conditional import conditional
+from core.fieldsets import FieldSelection, sideload
+from core.renderers import COMPACT_RENDERER_CLASSES
+from core.sharding import (
+    ShardSelectionMixin,
+    fan_out,
+    fan_out_serialize,
+    fan_out_version,
+    merge,
+)
+from task_app.archive import restore_task
+from task_app.dashboard import get_dashboard
+from task_app.models import ArchivedTask, Task, Comment
+from task_app.my_tasks import first_pages, group_first_pages, parse_filters, user_tasks
+from task_app.api.serializers import (
+    ArchivedTaskDetailSerializer,
+    ArchivedTaskSerializer,
+    CommentSerializer,
+    TaskReadSerializer,
+    TaskWriteSerializer,
+)
 from task_app.api.permissions import IsTaskBoardMember, IsTaskCreatorOrBoardOwner, IsCommentAuthor
 
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(ShardSelectionMixin, VersionedUpdateMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing tasks.
 
     - Requires authentication and board membership for most actions.
     - Serializer selection:
         * create/update/partial_update: TaskWriteSerializer
-        * other actions: TaskReadSerializer
+        * other actions: TaskReadSerializer (eager-loaded queryset)
     - Permission rules:
         * destroy: only task creator or board owner can delete
         * other actions: board members or owner
     - On create: automatically sets the requesting user as task creator.
+    - Updates honour If-Match: "<version>" and answer 412 when the task
+      changed in the meantime (core.concurrency.VersionedUpdateMixin).
     - Custom actions:
         * assigned-to-me: returns tasks assigned to the requesting user.
         * reviewing: returns tasks where the requesting user is the reviewer.
+        * my-tasks: both, grouped by board and status with the board title;
+          the first page of every group comes from one query, following
+          pages through the group's cursor (task_app.my_tasks).
+    - Reads accept ?fields= and ?expand= (core.fieldsets), and
+      ?normalize=users to return every user once in a top-level users map.
+    - Responses can be rendered in the compact columnar format
+      (core.renderers.CompactJSONRenderer).
+    - Reads answer If-None-Match with 304 (core.conditional), based on
+      Board.content_updated_at of the boards involved; retrieve also
+      answers If-Modified-Since.
+    - With sharding (core.sharding), detail routes run on the shard of the
+      task, create and my-tasks with ?board= on the shard of that board;
+      the other lists query every shard and merge the tasks, newest first.
     """
     queryset = Task.objects.all()
     permission_classes = [IsAuthenticated, IsTaskBoardMember]
+    renderer_classes = COMPACT_RENDERER_CLASSES
+
+    def get_queryset(self):
+        if self.action in ['create', 'update', 'partial_update']:
+            return Task.objects.all()
+        return TaskReadSerializer.setup_eager_loading(
+            Task.objects.all(), FieldSelection.from_request(self.request)
+        )
 
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
@@ -36,23 +88,100 @@ class TaskViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated(), IsTaskCreatorOrBoardOwner()]
         return [IsAuthenticated(), IsTaskBoardMember()]
 
+    def shard_key(self, request, pk=None, **kwargs):
+        if pk is not None:
+            return pk
+        if self.action == 'create' and hasattr(request.data, 'get'):
+            return request.data.get('board')
+        if self.action == 'my_tasks':
+            return request.query_params.get('board')
+        return None
+
+    def list_version(self, request, *args, **kwargs):
+        boards = Board.objects.all()
+        if self.action == 'assigned_to_me':
+            boards = boards.filter(tasks__assignee=request.user)
+        elif self.action == 'reviewing':
+            boards = boards.filter(tasks__reviewer=request.user)
+        elif self.action == 'my_tasks':
+            boards = boards.filter(Q(tasks__assignee=request.user) | Q(tasks__reviewer=request.user))
+        return fan_out_version(boards, 'content_updated_at')
+
+    def detail_version(self, request, pk=None, **kwargs):
+        return board_version(
+            request.user, Board.objects.filter(tasks=pk), version=F('tasks__version')
+        )
+
+    def list_tasks(self, request, tasks):
+        serializer, data = fan_out_serialize(
+            TaskReadSerializer,
+            TaskReadSerializer.setup_eager_loading(tasks, FieldSelection.from_request(request)),
+            self.get_serializer_context(),
+            key=lambda task: task.pk,
+            reverse=True,
+        )
+        return Response(sideload(serializer, data), status=status.HTTP_200_OK)
+
+    @conditional('list_version', last_modified=False)
+    def list(self, request, *args, **kwargs):
+        return self.list_tasks(request, self.filter_queryset(Task.objects.all()))
+
+    @conditional('detail_version')
+    def retrieve(self, request, *args, **kwargs):
+        serializer = self.get_serializer(self.get_object())
+        return Response(sideload(serializer), status=status.HTTP_200_OK)
+
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
     @action(detail=False, methods=['get'], url_path='assigned-to-me')
-    def assigned_to_me(self, request):
-        tasks = Task.objects.filter(assignee=request.user)
-        serializer = TaskReadSerializer(tasks, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+    @conditional('list_version', last_modified=False)
+    def assigned_to_me(self, request, format=None):
+        return self.list_tasks(request, Task.objects.filter(assignee=request.user))
 
     @action(detail=False, methods=['get'], url_path='reviewing')
-    def reviewing(self, request):
-        tasks = Task.objects.filter(reviewer=request.user)
-        serializer = TaskReadSerializer(tasks, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+    @conditional('list_version', last_modified=False)
+    def reviewing(self, request, format=None):
+        return self.list_tasks(request, Task.objects.filter(reviewer=request.user))
+
+    @action(detail=False, methods=['get'], url_path='my-tasks', url_name='my-tasks')
+    @conditional('list_version', last_modified=False)
+    def my_tasks(self, request, format=None):
+        try:
+            filters = parse_filters(request.query_params)
+        except ValueError as error:
+            return Response({'error': str(error)}, status=status.HTTP_400_BAD_REQUEST)
+        tasks = TaskReadSerializer.setup_eager_loading(
+            user_tasks(request.user, **filters), FieldSelection.from_request(request)
+        )
+        paginator = TaskColumnPagination()
+
+        if 'board' in filters and 'status' in filters:
+            page = paginator.paginate_queryset(tasks, request, view=self)
+            serializer = TaskReadSerializer(page, many=True, context={'request': request})
+            response = paginator.get_paginated_response(serializer.data)
+            response.data = sideload(serializer, response.data)
+            return response
 
+        def next_url(board_id, column, task):
+            url = replace_query_param(request.build_absolute_uri(), 'board', board_id)
+            paginator.base_url = replace_query_param(url, 'status', column)
+            return paginator.encode_cursor(Cursor(offset=0, reverse=False, position=str(task.pk)))
 
-class CommentViewSet(viewsets.ModelViewSet):
+        page_size = paginator.get_page_size(request)
+        context = {'request': request}
+
+        def shard_boards():
+            page = list(first_pages(tasks, page_size))
+            serializer = TaskReadSerializer(page, many=True, context=context)
+            return serializer, group_first_pages(page, serializer.data, page_size, next_url)
+
+        results = fan_out(shard_boards)
+        boards = merge([boards for _, boards in results], key=lambda board: board['id'])
+        return Response(sideload(results[-1][0], {'boards': boards}), status=status.HTTP_200_OK)
+
+
+class CommentViewSet(ShardSelectionMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing comments on tasks.
 
@@ -63,20 +192,132 @@ class CommentViewSet(viewsets.ModelViewSet):
         * other actions: any authenticated user
     - On create: automatically assigns the requesting user as author
       and links the comment to the specified task.
+    - Reads accept ?fields= and ?normalize=users (core.fieldsets).
+    - Reads answer If-None-Match and If-Modified-Since with 304
+      (core.conditional), based on Board.content_updated_at of the task's
+      board, which comment writes and author profile changes move.
+    - With sharding, runs on the shard of the task (core.sharding).
     """
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         task_id = self.kwargs.get("task_pk")
-        return Comment.objects.filter(task_id=task_id)
+        return CommentSerializer.setup_eager_loading(
+            Comment.objects.filter(task_id=task_id), FieldSelection.from_request(self.request)
+        )
 
     def get_permissions(self):
         if self.action == 'destroy':
             return [IsAuthenticated(), IsCommentAuthor()]
         return [IsAuthenticated()]
 
+    def shard_key(self, request, task_pk=None, **kwargs):
+        return task_pk
+
+    def list_version(self, request, task_pk=None, **kwargs):
+        return board_version(request.user, Board.objects.filter(tasks=task_pk))
+
+    def detail_version(self, request, task_pk=None, pk=None, **kwargs):
+        return board_version(request.user, Board.objects.filter(tasks=task_pk))
+
+    @conditional('list_version')
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_serializer(self.filter_queryset(self.get_queryset()), many=True)
+        return Response(sideload(serializer), status=status.HTTP_200_OK)
+
+    @conditional('detail_version')
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         task_id = self.kwargs.get("task_pk")
         task = Task.objects.get(pk=task_id)
         serializer.save(task=task, author=self.request.user)
+
+
+class ArchivedTaskViewSet(ShardSelectionMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet for browsing and restoring archived tasks.
+
+    - Requires authentication for all actions.
+    - list: archived tasks of the boards the user owns or is a member of,
+      optionally filtered with ?board=<id>.
+    - retrieve: a single archived task including its comments.
+    - Permission rules:
+        * retrieve/restore: board members or owner
+    - Custom actions:
+        * restore: moves the task and its comments back to the board and
+          returns the restored task.
+    - With sharding (core.sharding), retrieve, restore and list with
+      ?board= run on the board's shard; list without it queries every
+      shard.
+    """
+    permission_classes = [IsAuthenticated, IsTaskBoardMember]
+
+    def shard_key(self, request, pk=None, **kwargs):
+        return pk if pk is not None else request.query_params.get('board')
+
+    def get_queryset(self):
+        if self.action == 'list':
+            user = self.request.user
+            boards = member_boards(user).values('id')
+            queryset = ArchivedTask.objects.filter(board__in=boards)
+            board = self.request.query_params.get('board')
+            if board is not None:
+                queryset = queryset.filter(board_id=board) if board.isdigit() else queryset.none()
+            return ArchivedTaskSerializer.setup_eager_loading(queryset)
+        elif self.action == 'retrieve':
+            return ArchivedTaskDetailSerializer.setup_eager_loading(ArchivedTask.objects.all())
+        return ArchivedTask.objects.all()
+
+    def get_serializer_class(self):
+        if self.action == 'retrieve':
+            return ArchivedTaskDetailSerializer
+        return ArchivedTaskSerializer
+
+    def list(self, request, *args, **kwargs):
+        _, data = fan_out_serialize(
+            ArchivedTaskSerializer,
+            self.filter_queryset(self.get_queryset()),
+            self.get_serializer_context(),
+            key=lambda task: (
+                task.completed_at is not None, task.completed_at or task.archived_at, task.pk
+            ),
+            reverse=True,
+        )
+        return Response(data)
+
+    @action(detail=True, methods=['post'])
+    def restore(self, request, pk=None):
+        task = restore_task(self.get_object())
+        task = TaskReadSerializer.setup_eager_loading(Task.objects.all()).get(pk=task.pk)
+        return Response(TaskReadSerializer(task).data, status=status.HTTP_200_OK)
+
+
+class DashboardView(APIView):
+    """
+    API endpoint with the "my work" summary of the requesting user.
+
+    - Requires authentication.
+    - Counts the tasks the user is assignee or reviewer of by status and
+      priority, overdue and due within ?days=<n> days (default
+      DASHBOARD_DUE_SOON_DAYS), in total and per board.
+    - Computed with one grouped query and cached per user for
+      DASHBOARD_CACHE_SECONDS.
+    - Invalid days return a 400 error.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        days = request.query_params.get('days', settings.DASHBOARD_DUE_SOON_DAYS)
+        try:
+            days = int(days)
+        except (TypeError, ValueError):
+            days = -1
+        if not 0 <= days <= settings.DASHBOARD_MAX_DAYS:
+            return Response(
+                {'error': f'days must be between 0 and {settings.DASHBOARD_MAX_DAYS}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(get_dashboard(request.user, days), status=status.HTTP_200_OK)
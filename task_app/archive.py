@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import router, transaction
+from django.utils import timezone
+
+from boards_app.models import Board
+from core.sharding import fan_out
+from task_app.models import ArchivedComment, ArchivedTask, Comment, Task
+
+
+# Columns copied between the hot and the archive tables (besides the id).
+TASK_FIELDS = [
+    'title', 'description', 'board_id', 'assignee_id', 'reviewer_id', 'done',
+    'due_date', 'priority', 'status', 'created_by_id', 'completed_at', 'version',
+]
+COMMENT_FIELDS = ['task_id', 'author_id', 'text', 'created_at']
+
+
+def archive_tasks(task_ids, batch_size=None):
+    """
+    Move the given tasks and their comments into the archive tables.
+
+    - Runs in one transaction: the rows are copied with bulk inserts and
+      then deleted from Task and Comment.
+    - Ids are kept, so archived rows can be restored under the same id.
+    - The boards of the tasks are touched (Board.content_updated_at).
+    - Returns the number of archived tasks.
+    """
+    batch_size = batch_size or settings.TASK_ARCHIVE_BATCH_SIZE
+    with transaction.atomic(using=router.db_for_write(Task)):
+        tasks = list(Task.objects.filter(id__in=task_ids).values('id', *TASK_FIELDS))
+        if not tasks:
+            return 0
+        ids = [task['id'] for task in tasks]
+        comments = Comment.objects.filter(task_id__in=ids).values('id', *COMMENT_FIELDS)
+
+        ArchivedTask.objects.bulk_create(
+            [ArchivedTask(**task) for task in tasks], batch_size=batch_size
+        )
+        ArchivedComment.objects.bulk_create(
+            [ArchivedComment(**comment) for comment in comments], batch_size=batch_size
+        )
+        Task.objects.filter(id__in=ids).delete()
+        Board.touch(pk__in={task['board_id'] for task in tasks})
+    return len(tasks)
+
+
+def archive_done_tasks(older_than=None, batch_size=None, now=None):
+    """
+    Archive done tasks completed more than older_than ago, in batches.
+
+    - older_than defaults to settings.TASK_ARCHIVE_AFTER_DAYS days and
+      batch_size to settings.TASK_ARCHIVE_BATCH_SIZE.
+    - Every batch is its own transaction, so locks stay short and an
+      interrupted run keeps the batches it already moved.
+    - With sharding, every shard is archived in turn.
+    - Returns the number of archived tasks.
+    """
+    if older_than is None:
+        older_than = timedelta(days=settings.TASK_ARCHIVE_AFTER_DAYS)
+    batch_size = batch_size or settings.TASK_ARCHIVE_BATCH_SIZE
+    cutoff = (now or timezone.now()) - older_than
+    return sum(fan_out(_archive_done_tasks, cutoff, batch_size))
+
+
+def _archive_done_tasks(cutoff, batch_size):
+    archived = 0
+    while True:
+        with transaction.atomic(using=router.db_for_write(Task)):
+            ids = list(
+                Task.objects
+                .filter(status='done', completed_at__lt=cutoff)
+                .select_for_update(skip_locked=True)
+                .order_by('id')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            archived += archive_tasks(ids, batch_size)
+    return archived
+
+
+def restore_task(archived_task):
+    """
+    Move an archived task and its comments back into the hot tables.
+
+    - The task keeps its id and its done status; completed_at restarts at
+      now, so the next archive run does not move it straight back.
+    - The version continues from the archived one (+1 for the changed
+      completed_at), so an If-Match sent before the task was archived does
+      not match the restored task.
+    - Returns the restored Task.
+    """
+    with transaction.atomic(using=router.db_for_write(Task)):
+        fields = {name: getattr(archived_task, name) for name in TASK_FIELDS}
+        fields['completed_at'] = timezone.now()
+        fields['version'] = archived_task.version + 1
+        task = Task.objects.create(id=archived_task.id, **fields)
+
+        archived_comments = list(
+            ArchivedComment.objects.filter(task=archived_task).values('id', *COMMENT_FIELDS)
+        )
+        comments = Comment.objects.bulk_create(
+            [Comment(**comment) for comment in archived_comments]
+        )
+        if comments:
+            # auto_now_add overwrote created_at on insert.
+            for comment, archived in zip(comments, archived_comments):
+                comment.created_at = archived['created_at']
+            Comment.objects.bulk_update(comments, ['created_at'])
+
+        archived_task.delete()
+    return task
@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from core.sharding import fan_out, merge
+from task_app.models import Task
+
+
+STATUSES = [value for value, _ in Task.STATUS_CHOICES]
+PRIORITIES = [value for value, _ in Task.PRIORITY_CHOICES]
+ROLES = {'assigned': 'assignee', 'reviewing': 'reviewer'}
+
+
+def empty_summary():
+    return {
+        'total': 0,
+        'by_status': dict.fromkeys(STATUSES, 0),
+        'by_priority': dict.fromkeys(PRIORITIES, 0),
+        'overdue': 0,
+        'due_soon': 0,
+    }
+
+
+def dashboard_rows(user, days, today):
+    """
+    Return the dashboard counts of user as rows of one GROUP BY query.
+
+    - One row per (board, status, priority) of the tasks the user is
+      assignee or reviewer of, with per-role counts of all, overdue and
+      due-soon tasks.
+    - Overdue: due_date before today and not done. Due soon: due_date
+      within the next days days and not done.
+    """
+    open_tasks = ~Q(status='done')
+    overdue = open_tasks & Q(due_date__lt=today)
+    due_soon = open_tasks & Q(due_date__gte=today, due_date__lte=today + timedelta(days=days))
+
+    aggregates = {}
+    for role, field in ROLES.items():
+        is_role = Q(**{field: user})
+        aggregates[role] = Count('id', filter=is_role)
+        aggregates[f'{role}_overdue'] = Count('id', filter=is_role & overdue)
+        aggregates[f'{role}_due_soon'] = Count('id', filter=is_role & due_soon)
+
+    return (
+        Task.objects
+        .filter(Q(assignee=user) | Q(reviewer=user))
+        .order_by()
+        .values('board_id', 'board__title', 'status', 'priority')
+        .annotate(**aggregates)
+    )
+
+
+def build_dashboard(user, days):
+    """
+    Build the dashboard of user from dashboard_rows().
+
+    - Returns assigned and reviewing summaries (total, by status, by
+      priority, overdue, due soon) plus the same per board.
+    - With sharding, the rows of every shard are added up.
+    """
+    today = timezone.localdate()
+    summaries = {role: empty_summary() for role in ROLES}
+    boards = {}
+    rows = merge(fan_out(lambda: list(dashboard_rows(user, days, today))))
+
+    for row in rows:
+        board = boards.get(row['board_id'])
+        if board is None:
+            board = boards[row['board_id']] = {
+                'id': row['board_id'],
+                'title': row['board__title'],
+                **{role: empty_summary() for role in ROLES},
+            }
+        for role in ROLES:
+            for summary in (summaries[role], board[role]):
+                summary['total'] += row[role]
+                summary['overdue'] += row[f'{role}_overdue']
+                summary['due_soon'] += row[f'{role}_due_soon']
+                summary['by_status'][row['status']] = (
+                    summary['by_status'].get(row['status'], 0) + row[role])
+                if row['priority']:
+                    summary['by_priority'][row['priority']] = (
+                        summary['by_priority'].get(row['priority'], 0) + row[role])
+
+    return {
+        'due_soon_days': days,
+        'as_of': today.isoformat(),
+        **summaries,
+        'boards': sorted(boards.values(), key=lambda board: board['id']),
+    }
+
+
+def get_dashboard(user, days):
+    """
+    Return build_dashboard(user, days), cached per user and days.
+
+    - Cached for DASHBOARD_CACHE_SECONDS; counts may lag behind task
+      changes by up to that long.
+    """
+    key = f'dashboard:{user.pk}:{days}'
+    dashboard = cache.get(key)
+    if dashboard is None:
+        dashboard = build_dashboard(user, days)
+        cache.set(key, dashboard, settings.DASHBOARD_CACHE_SECONDS)
+    return dashboard
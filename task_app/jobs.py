@@ -0,0 +1,17 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from jobs_app.queue import job_handler
+from task_app.archive import archive_done_tasks
+
+
+@job_handler('archive_tasks')
+def archive_tasks(job):
+    """
+    Archive old done tasks (see task_app.archive.archive_done_tasks).
+
+    - Payload: {"days": <age in days>}, defaults to TASK_ARCHIVE_AFTER_DAYS.
+    """
+    days = job.payload.get('days', settings.TASK_ARCHIVE_AFTER_DAYS)
+    return {'archived': archive_done_tasks(older_than=timedelta(days=days))}
@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from task_app.archive import archive_done_tasks
+
+
+class Command(BaseCommand):
+    """
+    Move old done tasks and their comments into the archive tables.
+
+    - Meant to run periodically (e.g. a daily cron job).
+    - Example: python manage.py archive_tasks --days 90 --batch-size 1000
+    """
+    help = 'Archive done tasks completed more than --days days ago.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.TASK_ARCHIVE_AFTER_DAYS)
+        parser.add_argument('--batch-size', type=int, default=settings.TASK_ARCHIVE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        archived = archive_done_tasks(
+            older_than=timedelta(days=options['days']),
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(f'Archived {archived} tasks'))
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-19 10:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards_app', '0002_board_members_alter_board_owner'),
+        ('task_app', '0010_task_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['board', 'status', 'id'], name='task_board_status_id_idx'),
+        ),
+    ]
@@ -1,9 +1,12 @@
 from django.db import models
+from django.utils import timezone
 from auth_app.models import User
 from boards_app.models import Board
+from core.concurrency import VersionedModel
+from core.sharding import new_id, shard_for, use_shard
 
 
-class Task(models.Model):
+class Task(VersionedModel):
     """
     Model representing a task within a board.
 
@@ -18,11 +21,25 @@ class Task(models.Model):
     - priority: Priority level (low, medium, high).
     - status: Workflow status (to-do, in-progress, review, done).
     - created_by: User who created the task.
+    - completed_at: Set when the status changes to done, cleared when it
+      changes back; archive_done_tasks() uses it to find old done tasks.
+    - updated_at: Timestamp of the last change.
+    - version: Incremented by every save; saving a task read at an older
+      version raises VersionConflict (core.concurrency.VersionedModel).
+
+    Saving or deleting a task touches its board (Board.content_updated_at);
+    touch_related(queryset, deleting) touches the boards of the tasks of
+    queryset, for bulk writes without save() (core.deletion.ChunkedDeleter).
+    With sharding, a new task gets an id that maps to its board's shard
+    (core.sharding.new_id()).
 
     Meta:
     - verbose_name: "Task"
     - verbose_name_plural: "Tasks"
     - ordering: newest tasks first (descending id).
+    - index on (status, completed_at) for the archive scan.
+    - index on (board, status, id) for the paginated board columns.
+    - index on title for the admin's prefix search.
 
     __str__:
     - Returns the task title.
@@ -77,15 +94,50 @@ class Task(models.Model):
         on_delete=models.CASCADE,
         null=True
     )
+    completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
         ordering = ['-id']
+        indexes = [
+            models.Index(fields=['status', 'completed_at'], name='task_status_completed_idx'),
+            models.Index(fields=['board', 'status', 'id'], name='task_board_status_id_idx'),
+            models.Index(fields=['title'], name='task_title_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        if self.status == 'done' and self.completed_at is None:
+            self.completed_at = timezone.now()
+        elif self.status != 'done':
+            self.completed_at = None
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            extra = {'updated_at', 'completed_at'} if 'status' in update_fields else {'updated_at'}
+            kwargs['update_fields'] = {*update_fields, *extra}
+        shard = shard_for(self.board_id)
+        if self._state.adding and self.pk is None:
+            self.pk = new_id('task_app.task', shard)
+        with use_shard(shard):
+            super().save(*args, **kwargs)
+            Board.touch(pk=self.board_id)
+
+    def delete(self, *args, **kwargs):
+        board_id = self.board_id
+        with use_shard(shard_for(board_id)):
+            result = super().delete(*args, **kwargs)
+            Board.touch(pk=board_id)
+        return result
+
+    @classmethod
+    def touch_related(cls, queryset, deleting=()):
+        if Board not in deleting:
+            Board.touch(pk__in=queryset.values('board_id'), using=queryset.db)
+
 
 class Comment(models.Model):
     """
@@ -96,6 +148,10 @@ class Comment(models.Model):
     - author: User who wrote the comment.
     - text: Content of the comment.
     - created_at: Timestamp when the comment was created.
+    - updated_at: Timestamp of the last change.
+
+    Saving or deleting a comment touches the board of its task, and so
+    does touch_related(queryset, deleting) for the comments of queryset.
 
     Meta:
     - verbose_name: "Comment"
@@ -112,6 +168,7 @@ class Comment(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE)
     text = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Comment"
@@ -120,3 +177,131 @@ class Comment(models.Model):
 
     def __str__(self):
         return f"Comment by {self.author} on {self.task}"
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'updated_at'}
+        with use_shard(shard_for(self.task_id)):
+            super().save(*args, **kwargs)
+            Board.touch(tasks=self.task_id)
+
+    def delete(self, *args, **kwargs):
+        task_id = self.task_id
+        with use_shard(shard_for(task_id)):
+            result = super().delete(*args, **kwargs)
+            Board.touch(tasks=task_id)
+        return result
+
+    @classmethod
+    def touch_related(cls, queryset, deleting=()):
+        if Board not in deleting:
+            Board.touch(tasks__in=queryset.values('task_id'), using=queryset.db)
+
+
+class ArchivedTask(models.Model):
+    """
+    Done task moved out of the Task table by archive_done_tasks().
+
+    Fields:
+    - id: Primary key of the original Task, kept so restore_task() can put
+      the task back under the same id.
+    - title, description, board, assignee, reviewer, done, due_date,
+      priority, status, created_by, completed_at, version: Copied from
+      the Task.
+    - archived_at: Timestamp when the task was archived.
+
+    Meta:
+    - verbose_name: "Archived task"
+    - verbose_name_plural: "Archived tasks"
+    - ordering: most recently completed first.
+    - index on title for the admin's prefix search.
+
+    __str__:
+    - Returns the task title.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True)
+    board = models.ForeignKey(
+        Board,
+        related_name="archived_tasks",
+        on_delete=models.CASCADE)
+    assignee = models.ForeignKey(
+        User,
+        null=True,
+        blank=True,
+        related_name="+",
+        on_delete=models.SET_NULL
+    )
+    reviewer = models.ForeignKey(
+        User,
+        null=True,
+        blank=True,
+        related_name="+",
+        on_delete=models.SET_NULL
+    )
+    done = models.BooleanField(default=False)
+    due_date = models.DateField(null=True, blank=True)
+    priority = models.CharField(
+        max_length=50,
+        choices=Task.PRIORITY_CHOICES,
+        blank=True
+    )
+    status = models.CharField(
+        max_length=50,
+        choices=Task.STATUS_CHOICES,
+        default='done'
+    )
+    created_by = models.ForeignKey(
+        User,
+        related_name="+",
+        on_delete=models.CASCADE,
+        null=True
+    )
+    completed_at = models.DateTimeField(null=True, blank=True)
+    version = models.PositiveIntegerField(default=1)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Archived task"
+        verbose_name_plural = "Archived tasks"
+        ordering = ['-completed_at', '-id']
+        indexes = [
+            models.Index(fields=['title'], name='archived_task_title_idx'),
+        ]
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedComment(models.Model):
+    """
+    Comment of an ArchivedTask, moved together with its task.
+
+    Fields:
+    - id: Primary key of the original Comment.
+    - task: Foreign key to the ArchivedTask.
+    - author, text, created_at: Copied from the Comment.
+
+    Meta:
+    - verbose_name: "Archived comment"
+    - verbose_name_plural: "Archived comments"
+    - ordering: oldest comments first (ascending created_at).
+    """
+    id = models.BigIntegerField(primary_key=True)
+    task = models.ForeignKey(
+        ArchivedTask,
+        on_delete=models.CASCADE,
+        related_name="comments")
+    author = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    text = models.TextField()
+    created_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Archived comment"
+        verbose_name_plural = "Archived comments"
+        ordering = ['created_at']
+
+    def __str__(self):
+        return f"Comment by {self.author} on {self.task}"
@@ -0,0 +1,117 @@
+from datetime import date
+
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
+
+from task_app.dashboard import ROLES, STATUSES
+from task_app.models import Task
+
+
+def parse_filters(params):
+    """
+    Read the filters of the "my tasks" view from query parameters.
+
+    - role: 'assigned' or 'reviewing'; both when missing.
+    - board, status: restrict the result to one board or status; with
+      both the view returns a single group.
+    - due_from, due_to: inclusive due_date window (YYYY-MM-DD); tasks
+      without a due date are left out when either is given.
+    - Raises ValueError with a message for invalid values.
+    """
+    filters = {}
+    role = params.get('role')
+    if role:
+        if role not in ROLES:
+            raise ValueError(f'role must be one of: {", ".join(ROLES)}')
+        filters['role'] = role
+    board = params.get('board')
+    if board:
+        try:
+            filters['board'] = int(board)
+        except ValueError:
+            raise ValueError('board must be a board id') from None
+    status = params.get('status')
+    if status:
+        if status not in STATUSES:
+            raise ValueError(f'status must be one of: {", ".join(STATUSES)}')
+        filters['status'] = status
+    for name in ('due_from', 'due_to'):
+        value = params.get(name)
+        if value:
+            try:
+                filters[name] = date.fromisoformat(value)
+            except ValueError:
+                raise ValueError(f'{name} must be a date (YYYY-MM-DD)') from None
+    if 'due_from' in filters and 'due_to' in filters and filters['due_from'] > filters['due_to']:
+        raise ValueError('due_from must not be after due_to')
+    return filters
+
+
+def user_tasks(user, role=None, board=None, status=None, due_from=None, due_to=None):
+    """
+    Return the tasks user is assignee or reviewer of, filtered as given.
+
+    - role limits the tasks to one of ROLES ('assigned' or 'reviewing').
+    """
+    fields = [ROLES[role]] if role else ROLES.values()
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{field: user})
+    tasks = Task.objects.filter(condition)
+    if board is not None:
+        tasks = tasks.filter(board_id=board)
+    if status is not None:
+        tasks = tasks.filter(status=status)
+    if due_from is not None:
+        tasks = tasks.filter(due_date__gte=due_from)
+    if due_to is not None:
+        tasks = tasks.filter(due_date__lte=due_to)
+    return tasks
+
+
+def first_pages(tasks, page_size):
+    """
+    Return the first page_size tasks of every (board, status) group of tasks.
+
+    - One query: ROW_NUMBER() and COUNT() windows partitioned by board and
+      status pick the newest tasks of each group and annotate group_size;
+      the board title is joined as board_title.
+    - Ordered by board, status and newest task first.
+    """
+    group = [F('board_id'), F('status')]
+    return (
+        tasks
+        .annotate(
+            board_title=F('board__title'),
+            group_row=Window(RowNumber(), partition_by=group, order_by=F('id').desc()),
+            group_size=Window(Count('id'), partition_by=group),
+        )
+        .filter(group_row__lte=page_size)
+        .order_by('board_id', 'status', '-id')
+    )
+
+
+def group_first_pages(tasks, data, page_size, next_url):
+    """
+    Group the first_pages() tasks and their serialized data by board and status.
+
+    - Returns [{'id', 'title', 'groups': [{'status', 'count', 'next',
+      'results'}]}], boards by id and groups in workflow order.
+    - count is the size of the whole group; next is next_url(board id,
+      status, last task) when the group has more than page_size tasks.
+    """
+    boards = {}
+    for task, item in zip(tasks, data):
+        board = boards.get(task.board_id)
+        if board is None:
+            board = boards[task.board_id] = {'id': task.board_id, 'title': task.board_title, 'groups': []}
+        groups = board['groups']
+        if not groups or groups[-1]['status'] != task.status:
+            groups.append({'status': task.status, 'count': task.group_size, 'next': None, 'results': []})
+        group = groups[-1]
+        group['results'].append(item)
+        if len(group['results']) == page_size and task.group_size > page_size:
+            group['next'] = next_url(task.board_id, task.status, task)
+    for board in boards.values():
+        board['groups'].sort(key=lambda group: STATUSES.index(group['status']))
+    return list(boards.values())
@@ -6,18 +6,41 @@ Covers:
 - Tasks reviewing endpoint.
 - Task creation (validation, permissions, assignee/reviewer validation).
 - Task updates (title, status, board-change prevention).
+- Optimistic concurrency: task versions, If-Match and 412 on conflicts.
 - Task deletion (creator and board owner permissions).
 - Comment listing, creation, and deletion.
 - Task and Comment model string representation.
+- Async task and comment list views: parity with the sync views.
+- Sparse fieldsets: ?fields= and ?expand= on task and comment reads.
+- Normalized responses: ?normalize=users on task and comment lists.
+- Compact columnar format: negotiation and round trips for task lists.
+- Conditional GET: 304 responses of the task and comment endpoints.
+- Task archive: archiving old done tasks, archive endpoints and restore.
+- Dashboard: counts per role, status, priority, due date and board; caching.
+- My tasks: grouping by board and status, per-group cursors and filters.
 """
 
-from django.test import TestCase
+import time
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from auth_app.models import User
 from boards_app.models import Board
-from task_app.models import Task, Comment
+from core.concurrency import VersionConflict
+from core.renderers import from_columns
+from core.testing import token_login
+from task_app.archive import archive_done_tasks
+from task_app.models import ArchivedComment, ArchivedTask, Task, Comment
 
 
 class TaskAssignedToMeTests(TestCase):
@@ -286,6 +309,94 @@ class TaskUpdateTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
+class TaskConcurrencyTests(TestCase):
+    """Tests for versioned task updates with If-Match."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username='owner@test.com',
+            email='owner@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Test Board', owner=self.owner)
+        self.task = Task.objects.create(title='Old Title', board=self.board, created_by=self.owner)
+        self.url = reverse('task-detail', kwargs={'pk': self.task.id})
+        self.client.force_authenticate(user=self.owner)
+
+    def test_matching_version_updates_and_increments(self):
+        self.assertEqual(self.client.get(self.url).data['version'], 1)
+
+        response = self.client.patch(self.url, {'status': 'review'}, HTTP_IF_MATCH='"1"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['version'], 2)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.status, self.task.version), ('review', 2))
+
+    def test_stale_version_is_rejected(self):
+        self.client.patch(self.url, {'title': 'First'}, HTTP_IF_MATCH='"1"')
+
+        response = self.client.patch(self.url, {'title': 'Second'}, HTTP_IF_MATCH='"1"')
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.title, self.task.version), ('First', 2))
+
+    def test_if_match_accepts_issued_etags(self):
+        etag = self.client.get(self.url, {'fields': 'id,title'})['ETag']
+        self.assertTrue(etag.startswith('"1.'))
+
+        response = self.client.patch(self.url, {'title': 'First'}, HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], '"2"')
+        self.assertEqual(
+            self.client.patch(self.url, {'title': 'Stale'}, HTTP_IF_MATCH=etag).status_code,
+            status.HTTP_412_PRECONDITION_FAILED)
+        response = self.client.put(
+            self.url, {'title': 'Second', 'board': self.board.id}, HTTP_IF_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], '"3"')
+        self.assertTrue(self.client.get(self.url)['ETag'].startswith('"3.'))
+
+    def test_if_match_forms(self):
+        self.assertEqual(
+            self.client.patch(self.url, {'title': 'A'}, HTTP_IF_MATCH='W/"1"').status_code,
+            status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(
+            self.client.patch(self.url, {'title': 'B'}, HTTP_IF_MATCH='"7", 1').status_code,
+            status.HTTP_200_OK)
+        self.assertEqual(
+            self.client.patch(self.url, {'title': 'C'}, HTTP_IF_MATCH='*').status_code,
+            status.HTTP_200_OK)
+        self.assertEqual(self.client.patch(self.url, {'title': 'D'}).status_code, status.HTTP_200_OK)
+
+    @override_settings(REQUIRE_IF_MATCH=True)
+    def test_if_match_can_be_required(self):
+        response = self.client.patch(self.url, {'title': 'New'})
+
+        self.assertEqual(response.status_code, status.HTTP_428_PRECONDITION_REQUIRED)
+
+    def test_concurrent_save_is_a_conditional_update(self):
+        first = Task.objects.get(pk=self.task.pk)
+        second = Task.objects.get(pk=self.task.pk)
+        first.title = 'First'
+        with CaptureQueriesContext(connection) as queries:
+            first.save()
+        second.title = 'Second'
+
+        with self.assertRaises(VersionConflict), transaction.atomic():
+            second.save()
+
+        update = next(query['sql'] for query in queries if query['sql'].startswith('UPDATE "task_app_task"'))
+        self.assertIn('"task_app_task"."version" = 1', update)
+        self.assertNotIn('FOR UPDATE', update)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.title, self.task.version), ('First', 2))
+
+
 class TaskDeleteTests(TestCase):
     """Tests for DELETE /api/tasks/{id}/ endpoint and permissions."""
 
@@ -534,3 +645,704 @@ class CommentModelTests(TestCase):
         )
         self.assertIn('Test User', str(comment))
         self.assertIn('Task', str(comment))
+
+
+class AsyncTaskViewTests(TestCase):
+    """Tests for the async task list, assigned-to-me, reviewing and comment views."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='user@test.com',
+            email='user@test.com',
+            password='pass123',
+            fullname='Test User'
+        )
+        self.other_user = User.objects.create_user(
+            username='other@test.com',
+            email='other@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.task = Task.objects.create(
+            title='Assigned', board=self.board, assignee=self.user,
+            reviewer=self.other_user, created_by=self.user
+        )
+        Task.objects.create(
+            title='Reviewing', board=self.board, assignee=self.other_user,
+            reviewer=self.user, created_by=self.user
+        )
+        Comment.objects.create(task=self.task, author=self.user, text='First')
+        Comment.objects.create(task=self.task, author=self.other_user, text='Second')
+        token_login(self.client, self.user)
+
+    def assertSameResponse(self, sync_name, async_name, **kwargs):
+        sync_response = self.client.get(reverse(sync_name, kwargs=kwargs))
+        async_response = self.client.get(reverse(async_name, kwargs=kwargs))
+
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(async_response.json(), sync_response.json())
+        return async_response.json()
+
+    def test_task_list(self):
+        data = self.assertSameResponse('task-list', 'async-task-list')
+        self.assertEqual(len(data), 2)
+
+    def test_assigned_to_me(self):
+        data = self.assertSameResponse(
+            'task-assigned-to-me', 'async-task-assigned-to-me')
+        self.assertEqual([task['title'] for task in data], ['Assigned'])
+
+    def test_reviewing(self):
+        data = self.assertSameResponse('task-reviewing', 'async-task-reviewing')
+        self.assertEqual([task['title'] for task in data], ['Reviewing'])
+
+    def test_comment_list(self):
+        data = self.assertSameResponse(
+            'task-comments-list', 'async-task-comments-list', task_pk=self.task.id)
+        self.assertEqual([comment['content'] for comment in data], ['First', 'Second'])
+
+    def test_unauthenticated(self):
+        self.client.credentials()
+        response = self.client.get(reverse('async-task-assigned-to-me'))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TaskFieldsetTests(TestCase):
+    """Tests for ?fields= and ?expand= on the task and comment endpoints."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='user@test.com',
+            email='user@test.com',
+            password='pass123',
+            fullname='Test User'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.task = Task.objects.create(
+            title='Task', board=self.board, assignee=self.user,
+            reviewer=self.user, created_by=self.user
+        )
+        Comment.objects.create(task=self.task, author=self.user, text='Comment')
+        self.client.force_authenticate(user=self.user)
+
+    def get(self, name, params, **kwargs):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(name, kwargs=kwargs), params)
+        return response, [query['sql'] for query in queries]
+
+    def test_fields_skip_joins_and_annotations(self):
+        response, queries = self.get('task-list', {'fields': 'id,title,status'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{'id': self.task.id, 'title': 'Task', 'status': 'to-do'}])
+        self.assertFalse([sql for sql in queries if 'task_app_task' in sql and 'JOIN' in sql])
+        self.assertFalse([sql for sql in queries if 'task_app_task' in sql and 'COUNT' in sql])
+
+    def test_unexpanded_users_are_ids(self):
+        response, queries = self.get(
+            'task-detail', {'fields': 'id,assignee,reviewer', 'expand': 'reviewer'},
+            pk=self.task.id
+        )
+
+        self.assertEqual(response.data['assignee'], self.user.id)
+        self.assertEqual(response.data['reviewer']['fullname'], 'Test User')
+
+    def test_nested_fields(self):
+        response, _ = self.get('task-assigned-to-me', {'fields': 'id,assignee.fullname'})
+
+        self.assertEqual(response.data, [{'id': self.task.id, 'assignee': {'fullname': 'Test User'}}])
+
+    def test_unknown_fields(self):
+        token_login(self.client, self.user)
+        response, _ = self.get('task-list', {'fields': 'id,secret', 'expand': 'title'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('secret', str(response.data['fields']))
+        self.assertIn('title', str(response.data['expand']))
+        response = self.client.get(reverse('async-task-list'), {'fields': 'assignee.secret'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('assignee.secret', response.json()['fields'][0])
+
+    def test_comment_fields(self):
+        response, queries = self.get(
+            'task-comments-list', {'fields': 'id,content'}, task_pk=self.task.id
+        )
+
+        self.assertEqual(list(response.data[0]), ['id', 'content'])
+        self.assertFalse([sql for sql in queries if 'JOIN "auth_app_user"' in sql])
+
+    def test_async_views_match(self):
+        token_login(self.client, self.user)
+        params = {'fields': 'id,title,assignee', 'expand': ''}
+        for sync_name, async_name in [
+            ('task-list', 'async-task-list'),
+            ('task-reviewing', 'async-task-reviewing'),
+        ]:
+            sync_response = self.client.get(reverse(sync_name), params)
+            async_response = self.client.get(reverse(async_name), params)
+            self.assertEqual(async_response.json(), sync_response.json())
+
+    def test_writes_ignore_fields(self):
+        url = reverse('task-comments-list', kwargs={'task_pk': self.task.id})
+        response = self.client.post(url + '?fields=id', {'content': 'New'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['content'], 'New')
+
+
+class NormalizedTaskResponseTests(TestCase):
+    """Tests for ?normalize=users on the task and comment endpoints."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='user@test.com',
+            email='user@test.com',
+            password='pass123',
+            fullname='Test User'
+        )
+        self.other_user = User.objects.create_user(
+            username='other@test.com',
+            email='other@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.task = Task.objects.create(
+            title='First', board=self.board, assignee=self.user, reviewer=self.other_user
+        )
+        Task.objects.create(title='Second', board=self.board, assignee=self.user)
+        Comment.objects.create(task=self.task, author=self.other_user, text='Comment')
+        self.client.force_authenticate(user=self.user)
+
+    def test_task_list_references_users(self):
+        response = self.client.get(reverse('task-list'), {'normalize': 'users'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [(task['assignee'], task['reviewer']) for task in data['results']],
+            [(self.user.id, self.other_user.id), (self.user.id, None)]
+        )
+        self.assertEqual(data['users'], {
+            str(self.user.id): {'id': self.user.id, 'fullname': 'Test User', 'email': 'user@test.com'},
+            str(self.other_user.id): {'id': self.other_user.id, 'fullname': None, 'email': 'other@test.com'},
+        })
+
+    def test_task_detail(self):
+        response = self.client.get(
+            reverse('task-detail', kwargs={'pk': self.task.id}), {'normalize': 'users'}
+        )
+
+        self.assertEqual(response.data['assignee'], self.user.id)
+        self.assertEqual(sorted(response.data['users']), [self.user.id, self.other_user.id])
+
+    def test_comment_list(self):
+        url = reverse('task-comments-list', kwargs={'task_pk': self.task.id})
+        response = self.client.get(url, {'normalize': 'users'})
+
+        self.assertEqual(response.data['results'][0]['author'], self.other_user.id)
+        self.assertEqual(list(response.data['users']), [self.other_user.id])
+
+    def test_empty_list(self):
+        response = self.client.get(reverse('task-reviewing'), {'normalize': 'users'})
+
+        self.assertEqual(response.data, {'results': [], 'users': {}})
+
+    def test_unknown_collection(self):
+        response = self.client.get(reverse('task-list'), {'normalize': 'boards'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('normalize', response.data)
+
+    def test_async_views_match(self):
+        token_login(self.client, self.user)
+        params = {'normalize': 'users'}
+        for sync_url, async_url in [
+            (reverse('task-list'), reverse('async-task-list')),
+            (reverse('task-comments-list', kwargs={'task_pk': self.task.id}),
+             reverse('async-task-comments-list', kwargs={'task_pk': self.task.id})),
+        ]:
+            sync_response = self.client.get(sync_url, params)
+            async_response = self.client.get(async_url, params)
+            self.assertEqual(async_response.json(), sync_response.json())
+
+
+class CompactTaskFormatTests(TestCase):
+    """Tests for the compact columnar format of the task list endpoints."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='user@test.com',
+            email='user@test.com',
+            password='pass123',
+            fullname='Test User'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        for index in range(3):
+            Task.objects.create(
+                title=f'Task {index}', board=self.board, assignee=self.user,
+                reviewer=self.user, priority='high'
+            )
+        self.client.force_authenticate(user=self.user)
+
+    def assertRoundTrip(self, url, params=None, compact_params=None, **headers):
+        regular = self.client.get(url, params)
+        compact = self.client.get(url, {**(params or {}), **(compact_params or {})}, **headers)
+
+        self.assertEqual(compact.status_code, status.HTTP_200_OK)
+        self.assertEqual(compact['Content-Type'], 'application/vnd.kanmind.compact+json')
+        self.assertEqual(from_columns(compact.json()), regular.json())
+        self.assertLess(len(compact.content), len(regular.content))
+        return compact.json()
+
+    def test_accept_header(self):
+        data = self.assertRoundTrip(
+            reverse('task-list'), HTTP_ACCEPT='application/vnd.kanmind.compact+json'
+        )
+
+        self.assertEqual(data['columns'][:3], ['id', 'board', 'title'])
+        self.assertEqual([row[2] for row in data['rows']], ['Task 0', 'Task 1', 'Task 2'])
+
+    def test_format_parameter(self):
+        self.assertRoundTrip(reverse('task-assigned-to-me'), compact_params={'format': 'compact'})
+        self.assertRoundTrip(
+            reverse('task-reviewing'), {'normalize': 'users'}, {'format': 'compact'}
+        )
+
+    def test_format_suffix(self):
+        regular = self.client.get(reverse('task-reviewing'))
+        compact = self.client.get(reverse('task-reviewing', kwargs={'format': 'compact'}))
+
+        self.assertEqual(from_columns(compact.json()), regular.json())
+
+    def test_json_stays_default(self):
+        response = self.client.get(reverse('task-list'))
+
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIsInstance(response.json(), list)
+
+
+class TaskConditionalGetTests(TestCase):
+    """Tests for If-None-Match and If-Modified-Since on the task and comment endpoints."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='user@test.com',
+            email='user@test.com',
+            password='pass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='other@test.com',
+            email='other@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.board.members.add(self.other_user)
+        self.task = Task.objects.create(title='Task', board=self.board, assignee=self.user)
+        self.comment = Comment.objects.create(task=self.task, author=self.user, text='Hi')
+        self.client.force_authenticate(user=self.user)
+
+    def assertRevalidates(self, url, change):
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        change()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_task_detail(self):
+        url = reverse('task-detail', kwargs={'pk': self.task.id})
+        response = self.assertRevalidates(
+            url, lambda: Comment.objects.create(task=self.task, author=self.user, text='New')
+        )
+        self.assertEqual(response.data['comments_count'], 2)
+
+    def test_assigned_to_me(self):
+        def reassign():
+            self.task.assignee = self.other_user
+            self.task.save()
+
+        response = self.assertRevalidates(reverse('task-assigned-to-me'), reassign)
+        self.assertEqual(response.data, [])
+
+    def test_comment_list(self):
+        url = reverse('task-comments-list', kwargs={'task_pk': self.task.id})
+        response = self.assertRevalidates(url, self.comment.delete)
+        self.assertEqual(response.data, [])
+
+    def test_comment_detail(self):
+        url = reverse(
+            'task-comments-detail', kwargs={'task_pk': self.task.id, 'pk': self.comment.id}
+        )
+
+        def edit():
+            self.comment.text = 'Edited'
+            self.comment.save()
+
+        response = self.assertRevalidates(url, edit)
+        self.assertEqual(response.data['content'], 'Edited')
+
+    def test_task_lists_ignore_if_modified_since(self):
+        newer = Board.objects.create(title='Newer', owner=self.other_user)
+        newer.members.add(self.user)
+        task = Task.objects.create(title='Newer', board=newer, assignee=self.user)
+        url = reverse('task-assigned-to-me')
+        response = self.client.get(url)
+        self.assertTrue(response.has_header('ETag'))
+        self.assertFalse(response.has_header('Last-Modified'))
+
+        task.assignee = None
+        task.save()
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 3600))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['title'] for item in response.data], ['Task'])
+
+    def test_comments_revalidate_after_author_rename(self):
+        url = reverse('task-comments-list', kwargs={'task_pk': self.task.id})
+        detail_url = reverse(
+            'task-comments-detail', kwargs={'task_pk': self.task.id, 'pk': self.comment.id}
+        )
+        detail_etag = self.client.get(detail_url)['ETag']
+
+        def rename():
+            self.user.fullname = 'Renamed'
+            self.user.save()
+
+        response = self.assertRevalidates(url, rename)
+        self.assertEqual(response.data[0]['author'], 'Renamed')
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['author'], 'Renamed')
+
+    def test_archiving_touches_board(self):
+        Task.objects.filter(pk=self.task.pk).update(
+            status='done', completed_at=timezone.now() - timedelta(days=60)
+        )
+        before = Board.objects.get(pk=self.board.pk).content_updated_at
+
+        archive_done_tasks(older_than=timedelta(days=30))
+
+        self.assertGreater(Board.objects.get(pk=self.board.pk).content_updated_at, before)
+
+
+class TaskArchiveTests(TestCase):
+    """Tests for task_app.archive and the /api/archive/tasks/ endpoints."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='user@test.com',
+            email='user@test.com',
+            password='pass123'
+        )
+        self.outsider = User.objects.create_user(
+            username='outsider@test.com',
+            email='outsider@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.old_task = Task.objects.create(
+            title='Old', board=self.board, status='done', created_by=self.user
+        )
+        Task.objects.filter(pk=self.old_task.pk).update(
+            completed_at=timezone.now() - timedelta(days=60)
+        )
+        self.comment = Comment.objects.create(
+            task=self.old_task, author=self.user, text='Archived comment'
+        )
+        self.recent_task = Task.objects.create(
+            title='Recent', board=self.board, status='done', created_by=self.user
+        )
+        self.open_task = Task.objects.create(
+            title='Open', board=self.board, created_by=self.user
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_completed_at_follows_status(self):
+        self.assertIsNotNone(self.recent_task.completed_at)
+        self.assertIsNone(self.open_task.completed_at)
+
+        self.recent_task.status = 'review'
+        self.recent_task.save(update_fields=['status'])
+        self.recent_task.refresh_from_db()
+        self.assertIsNone(self.recent_task.completed_at)
+
+    def test_archive_moves_old_done_tasks_with_comments(self):
+        archived = archive_done_tasks(older_than=timedelta(days=30), batch_size=1)
+
+        self.assertEqual(archived, 1)
+        self.assertFalse(Task.objects.filter(pk=self.old_task.pk).exists())
+        self.assertFalse(Comment.objects.filter(pk=self.comment.pk).exists())
+        archived_task = ArchivedTask.objects.get(pk=self.old_task.pk)
+        self.assertEqual(archived_task.title, 'Old')
+        self.assertEqual(
+            list(archived_task.comments.values_list('id', 'text')),
+            [(self.comment.pk, 'Archived comment')]
+        )
+        self.assertCountEqual(
+            Task.objects.values_list('title', flat=True), ['Recent', 'Open']
+        )
+
+    def test_archive_command(self):
+        out = StringIO()
+        call_command('archive_tasks', days=90, stdout=out)
+        self.assertIn('Archived 0 tasks', out.getvalue())
+
+        call_command('archive_tasks', days=30, stdout=out)
+        self.assertIn('Archived 1 tasks', out.getvalue())
+
+    def test_board_detail_reads_hot_tasks_only(self):
+        archive_done_tasks(older_than=timedelta(days=30))
+
+        response = self.client.get(reverse('board-detail', kwargs={'pk': self.board.pk}))
+
+        self.assertCountEqual(
+            [task['title'] for task in response.data['tasks']], ['Open', 'Recent']
+        )
+
+    def test_list_and_retrieve_archived_tasks(self):
+        archive_done_tasks(older_than=timedelta(days=30))
+
+        response = self.client.get(reverse('archived-task-list'), {'board': self.board.pk})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task['title'] for task in response.data], ['Old'])
+        self.assertEqual(response.data[0]['comments_count'], 1)
+
+        response = self.client.get(
+            reverse('archived-task-detail', kwargs={'pk': self.old_task.pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [comment['content'] for comment in response.data['comments']],
+            ['Archived comment']
+        )
+
+    def test_outsider_cannot_see_archived_tasks(self):
+        archive_done_tasks(older_than=timedelta(days=30))
+        self.client.force_authenticate(user=self.outsider)
+
+        response = self.client.get(reverse('archived-task-list'))
+        self.assertEqual(response.data, [])
+
+        response = self.client.post(
+            reverse('archived-task-restore', kwargs={'pk': self.old_task.pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_restore_task(self):
+        archive_done_tasks(older_than=timedelta(days=30))
+
+        response = self.client.post(
+            reverse('archived-task-restore', kwargs={'pk': self.old_task.pk})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], self.old_task.pk)
+        self.assertEqual(response.data['comments_count'], 1)
+        self.assertFalse(ArchivedTask.objects.exists())
+        self.assertFalse(ArchivedComment.objects.exists())
+        comment = Comment.objects.get(pk=self.comment.pk)
+        self.assertEqual(comment.created_at, self.comment.created_at)
+        self.assertEqual(archive_done_tasks(older_than=timedelta(days=30)), 0)
+
+    def test_restore_keeps_stale_if_match_rejected(self):
+        self.old_task.title = 'Edited'
+        self.old_task.save(update_fields=['title'])
+        self.assertEqual(self.old_task.version, 2)
+        archive_done_tasks(older_than=timedelta(days=30))
+        self.assertEqual(ArchivedTask.objects.get(pk=self.old_task.pk).version, 2)
+
+        response = self.client.post(
+            reverse('archived-task-restore', kwargs={'pk': self.old_task.pk})
+        )
+        self.assertEqual(response.data['version'], 3)
+
+        url = reverse('task-detail', kwargs={'pk': self.old_task.pk})
+        for stale in ('"1"', '"2"'):
+            response = self.client.patch(url, {'title': 'Lost update'}, HTTP_IF_MATCH=stale)
+            self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        response = self.client.patch(url, {'title': 'Current'}, HTTP_IF_MATCH='"3"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Task.objects.get(pk=self.old_task.pk).title, 'Current')
+
+
+class DashboardTests(TestCase):
+    """Tests for GET /api/dashboard/."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='user@test.com',
+            email='user@test.com',
+            password='pass123'
+        )
+        self.other = User.objects.create_user(
+            username='other@test.com',
+            email='other@test.com',
+            password='pass123'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.other_board = Board.objects.create(title='Other Board', owner=self.other)
+        today = timezone.localdate()
+        for title, board, status_, priority, due, assignee, reviewer in [
+            ('Overdue', self.board, 'to-do', 'high', -2, self.user, None),
+            ('Soon', self.board, 'in-progress', 'low', 3, self.user, self.other),
+            ('Later', self.other_board, 'review', 'high', 30, self.user, None),
+            ('Done overdue', self.board, 'done', 'medium', -5, self.user, None),
+            ('Review', self.other_board, 'to-do', 'medium', 1, self.other, self.user),
+            ('Unrelated', self.board, 'to-do', 'high', -1, self.other, self.other),
+        ]:
+            Task.objects.create(
+                title=title, board=board, status=status_, priority=priority,
+                due_date=today + timedelta(days=due), assignee=assignee,
+                reviewer=reviewer, created_by=self.user
+            )
+        self.url = reverse('dashboard')
+        self.client.force_authenticate(user=self.user)
+
+    def test_dashboard_counts(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        assigned = response.data['assigned']
+        self.assertEqual(assigned['total'], 4)
+        self.assertEqual(
+            assigned['by_status'],
+            {'to-do': 1, 'in-progress': 1, 'review': 1, 'done': 1}
+        )
+        self.assertEqual(assigned['by_priority'], {'low': 1, 'medium': 1, 'high': 2})
+        self.assertEqual(assigned['overdue'], 1)
+        self.assertEqual(assigned['due_soon'], 1)
+        reviewing = response.data['reviewing']
+        self.assertEqual(reviewing['total'], 1)
+        self.assertEqual(reviewing['due_soon'], 1)
+        self.assertEqual(response.data['due_soon_days'], 7)
+
+        boards = {board['title']: board for board in response.data['boards']}
+        self.assertEqual(boards['Board']['assigned']['total'], 3)
+        self.assertEqual(boards['Other Board']['assigned']['total'], 1)
+        self.assertEqual(boards['Other Board']['reviewing']['total'], 1)
+
+    def test_days_parameter(self):
+        response = self.client.get(self.url, {'days': 60})
+        self.assertEqual(response.data['assigned']['due_soon'], 2)
+
+        for days in ('-1', 'abc', '1000'):
+            response = self.client.get(self.url, {'days': days})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_single_query_and_cache(self):
+        with self.assertNumQueries(1):
+            first = self.client.get(self.url)
+        Task.objects.create(title='New', board=self.board, assignee=self.user)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(first.data, second.data)
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class MyTasksTests(TestCase):
+    """Tests for GET /api/tasks/my-tasks/."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='user@test.com',
+            email='user@test.com',
+            password='pass123'
+        )
+        self.other = User.objects.create_user(
+            username='other@test.com',
+            email='other@test.com',
+            password='pass123'
+        )
+        self.alpha = Board.objects.create(title='Alpha', owner=self.user)
+        self.beta = Board.objects.create(title='Beta', owner=self.other)
+        self.beta.members.add(self.user)
+        today = timezone.localdate()
+        self.tasks = {}
+        for title, board, status_, due, assignee, reviewer in [
+            ('First', self.alpha, 'to-do', 1, self.user, None),
+            ('Second', self.alpha, 'to-do', 5, self.user, None),
+            ('Third', self.alpha, 'to-do', None, self.user, self.other),
+            ('Check', self.alpha, 'review', 2, self.other, self.user),
+            ('Beta task', self.beta, 'to-do', 10, self.user, None),
+            ('Unrelated', self.beta, 'to-do', 1, self.other, self.other),
+        ]:
+            self.tasks[title] = Task.objects.create(
+                title=title, board=board, status=status_, assignee=assignee, reviewer=reviewer,
+                due_date=today + timedelta(days=due) if due is not None else None,
+                created_by=self.user
+            )
+        self.url = reverse('task-my-tasks')
+        self.client.force_authenticate(user=self.user)
+
+    def titles(self, results):
+        return [task['title'] for task in results]
+
+    def test_groups_by_board_and_status_in_one_query(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'page_size': 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        boards = response.data['boards']
+        self.assertEqual([(board['id'], board['title']) for board in boards],
+                         [(self.alpha.id, 'Alpha'), (self.beta.id, 'Beta')])
+        todo, review = boards[0]['groups']
+        self.assertEqual((todo['status'], todo['count']), ('to-do', 3))
+        self.assertEqual(self.titles(todo['results']), ['Third', 'Second'])
+        self.assertIsNotNone(todo['next'])
+        self.assertEqual((review['status'], review['count']), ('review', 1))
+        self.assertIsNone(review['next'])
+        self.assertEqual(self.titles(boards[1]['groups'][0]['results']), ['Beta task'])
+
+    def test_next_cursor_pages_through_group(self):
+        first = self.client.get(self.url, {'page_size': 2}).data['boards'][0]['groups'][0]
+
+        response = self.client.get(first['next'])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.titles(response.data['results']), ['First'])
+        self.assertIsNone(response.data['next'])
+
+    def test_role_and_due_window(self):
+        today = timezone.localdate()
+
+        response = self.client.get(self.url, {'role': 'reviewing'})
+        groups = [group for board in response.data['boards'] for group in board['groups']]
+        self.assertEqual([self.titles(group['results']) for group in groups], [['Check']])
+
+        response = self.client.get(self.url, {
+            'due_from': today.isoformat(),
+            'due_to': (today + timedelta(days=5)).isoformat(),
+        })
+        groups = [group for board in response.data['boards'] for group in board['groups']]
+        self.assertEqual([self.titles(group['results']) for group in groups],
+                         [['Second', 'First'], ['Check']])
+
+    def test_invalid_filters(self):
+        for params in [{'role': 'owner'}, {'status': 'later'}, {'board': 'x'},
+                       {'due_from': 'tomorrow'}, {'due_from': '2026-02-01', 'due_to': '2026-01-01'}]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)